@@ -0,0 +1,130 @@
+"""
+Record compression with a shared dictionary.
+
+Stored questions are small (a few hundred bytes) and alike: the same keys,
+option labels, tier names and common words. Compressed one by one they
+barely shrink, because each record starts from an empty window. Priming
+the compressor with a dictionary of typical records lets every record
+refer back to it, which is where most of the saving comes from, while
+each record can still be decompressed on its own when it is read.
+
+zstd (the optional zstandard package) trains a proper dictionary. Without
+it, zlib is used with a preset dictionary (zdict) made of distinct sample
+records; zlib only looks 32 KiB back, so that is the dictionary size.
+
+Usage:
+    dictionary = train_dictionary(sample_records)
+    codec = Codec("zlib", dictionary)
+    blob = codec.compress(record)
+    record = codec.decompress(blob)
+"""
+
+import zlib
+import threading
+
+try:
+    import zstandard
+except ImportError:  # optional; zlib with a preset dictionary is the fallback
+    zstandard = None
+
+
+CODECS = ("none", "zlib", "zstd")
+
+DICTIONARY_SIZE = 32 * 1024
+
+# Records a dictionary is trained on
+TRAINING_SAMPLES = 2000
+
+
+def default_codec():
+    return "zstd" if zstandard is not None else "zlib"
+
+
+def _raw_dictionary(samples, size):
+    """Distinct samples up to size bytes, the last ones last (nearest to the data, cheapest to refer to)."""
+    seen = set()
+    parts = []
+    total = 0
+    for sample in reversed(samples):
+        if sample in seen:
+            continue
+        if total + len(sample) > size:
+            break
+        seen.add(sample)
+        parts.append(sample)
+        total += len(sample)
+    return b"".join(reversed(parts))
+
+
+def train_dictionary(samples, codec=None, size=DICTIONARY_SIZE):
+    """
+    Build a dictionary from sample records (bytes).
+
+    Returns:
+        bytes: The dictionary; empty for codec "none"
+    """
+    codec = codec or default_codec()
+    samples = list(samples)
+    if codec == "none" or not samples:
+        return b""
+    if codec == "zstd":
+        try:
+            return zstandard.train_dictionary(size, samples).as_bytes()
+        except zstandard.ZstdError:
+            # too few or too similar samples to train on; raw content still works
+            pass
+    return _raw_dictionary(samples, size)
+
+
+class Codec:
+    """
+    Compresses and decompresses single records with a fixed dictionary.
+
+    Safe to share between threads.
+    """
+
+    def __init__(self, name=None, dictionary=b"", level=None):
+        self.name = name or default_codec()
+        if self.name not in CODECS:
+            raise ValueError(f"Unknown codec '{self.name}' (use one of {', '.join(CODECS)})")
+        self.dictionary = dictionary
+        self._compressor = None
+        if self.name == "zlib":
+            # Raw deflate (no header or checksum per record). Priming with the
+            # dictionary is done once; each record starts from a copy. The
+            # compressor holds a few hundred KiB, so readers never create it.
+            self._level = 6 if level is None else level
+            self._zdict = {"zdict": dictionary} if dictionary else {}
+            self._decompressor = zlib.decompressobj(-15, **self._zdict)
+        elif self.name == "zstd":
+            if zstandard is None:
+                raise ValueError("The zstd codec needs the zstandard package")
+            self._dict = zstandard.ZstdCompressionDict(dictionary) if dictionary else None
+            self._level = 3 if level is None else level
+            # zstandard contexts are not thread-safe; keep one per thread
+            self._local = threading.local()
+
+    def compress(self, data):
+        if self.name == "zlib":
+            if self._compressor is None:
+                self._compressor = zlib.compressobj(self._level, zlib.DEFLATED, -15, **self._zdict)
+            c = self._compressor.copy()
+            return c.compress(data) + c.flush()
+        if self.name == "zstd":
+            return self._zstd("compressor", zstandard.ZstdCompressor, level=self._level).compress(data)
+        return data
+
+    def decompress(self, data):
+        if self.name == "zlib":
+            d = self._decompressor.copy()
+            return d.decompress(data) + d.flush()
+        if self.name == "zstd":
+            return self._zstd("decompressor", zstandard.ZstdDecompressor).decompress(data)
+        return data
+
+    def _zstd(self, name, factory, **kwargs):
+        context = getattr(self._local, name, None)
+        if context is None:
+            context = factory(dict_data=self._dict, **kwargs)
+            setattr(self._local, name, context)
+        return context
@@ -0,0 +1,75 @@
+"""
+Runtime settings for the backend.
+
+Values are read from the environment on every call, so tests and tools can
+point the question pipeline somewhere else without reloading modules.
+"""
+
+import os
+
+
+# Hugging Face Inference API
+DEFAULT_HF_BASE_URL = "https://router.huggingface.co/hf-inference"
+HF_MODEL_ID = "bigscience/bloom"
+DEFAULT_HF_TIMEOUT = 60.0
+DEFAULT_HF_MAX_CONCURRENCY = 64
+DEFAULT_HF_BREAKER_FAILURES = 5
+DEFAULT_HF_BREAKER_COOLDOWN = 30.0
+
+
+def hf_base_url():
+    """Base URL for model requests (HF_API_BASE_URL overrides, e.g. a local mock server)."""
+    return os.environ.get("HF_API_BASE_URL", DEFAULT_HF_BASE_URL).rstrip("/")
+
+
+def hf_model_url(model_id=HF_MODEL_ID):
+    return f"{hf_base_url()}/{model_id}"
+
+
+def hf_timeout():
+    """Seconds to wait for a model response (HF_API_TIMEOUT overrides)."""
+    return float(os.environ.get("HF_API_TIMEOUT", DEFAULT_HF_TIMEOUT))
+
+
+def hf_max_concurrency():
+    """Model requests in flight at once across all games (HF_API_MAX_CONCURRENCY); read when the first request is made."""
+    return int(os.environ.get("HF_API_MAX_CONCURRENCY", DEFAULT_HF_MAX_CONCURRENCY))
+
+
+def hf_hedge_after():
+    """Seconds after which a slow model request is sent again (HF_API_HEDGE_AFTER); 0, the default, never does."""
+    return float(os.environ.get("HF_API_HEDGE_AFTER", 0))
+
+
+def hf_breaker_failures():
+    """Failed game fetches in a row that open the provider's circuit (HF_API_BREAKER_FAILURES); 0 turns it off."""
+    return int(os.environ.get("HF_API_BREAKER_FAILURES", DEFAULT_HF_BREAKER_FAILURES))
+
+
+def hf_breaker_cooldown():
+    """Seconds an open circuit waits before letting a probe request through (HF_API_BREAKER_COOLDOWN)."""
+    return float(os.environ.get("HF_API_BREAKER_COOLDOWN", DEFAULT_HF_BREAKER_COOLDOWN))
+
+
+def question_export_file():
+    """JSONL file that model-generated questions are appended to (QUIZZIFY_EXPORT_FILE), or None."""
+    return os.environ.get("QUIZZIFY_EXPORT_FILE") or None
+
+
+def question_bank_file():
+    """Question bank (see question_bank.py) used when the model is unavailable (QUIZZIFY_QUESTION_BANK), or None."""
+    return os.environ.get("QUIZZIFY_QUESTION_BANK") or None
+
+
+# Semantic topic cache (topic_cache.py)
+DEFAULT_TOPIC_SIMILARITY = 0.8
+
+
+def topic_cache_size():
+    """Question sets kept by the topic cache (QUIZZIFY_TOPIC_CACHE_SIZE); 0, the default, turns it off."""
+    return int(os.environ.get("QUIZZIFY_TOPIC_CACHE_SIZE", 0))
+
+
+def topic_similarity():
+    """Cosine similarity at which a cached topic is reused (QUIZZIFY_TOPIC_SIMILARITY)."""
+    return float(os.environ.get("QUIZZIFY_TOPIC_SIMILARITY", DEFAULT_TOPIC_SIMILARITY))
@@ -4,7 +4,22 @@ Handles all game logic, scoring, and state management.
 """
 
 from backend.llm_questions import get_questions_from_llm
+from backend import metrics
+from backend import tracing
+from backend.logs import get_logger
 import json
+import itertools
+
+log = get_logger(__name__)
+
+# Small per-process ids to tell games apart in logs
+_session_ids = itertools.count(1)
+
+# Label children bound once; submit_answer is a hot path
+_ANSWERS_CORRECT = metrics.ANSWERS.labels("true")
+_ANSWERS_WRONG = metrics.ANSWERS.labels("false")
+_GAMES_WON = metrics.GAMES_FINISHED.labels("won")
+_GAMES_LOST = metrics.GAMES_FINISHED.labels("lost")
 
 
 class QuizGame:
@@ -19,6 +34,7 @@ class QuizGame:
         self.current_index = 0
         self.game_over = False
         self.game_started = False
+        self.session = next(_session_ids)
     
     def start_new_game(self, topic="General Knowledge"):
         """
@@ -30,19 +46,25 @@ class QuizGame:
         Returns:
             bool: True if game started successfully
         """
-        try:
-            print(f"Starting new game: {topic}")
-            self.questions = get_questions_from_llm(topic=topic)
-            self.score = 0
-            self.current_index = 0
-            self.game_over = False
-            self.game_started = True
-            print(f"Game started with {len(self.questions)} questions")
-            return True
-        except Exception as e:
-            print(f"Failed to start game: {e}")
-            self.game_over = True
-            return False
+        with tracing.span("game.start", topic=topic, session=self.session):
+            try:
+                log.debug("Starting new game", extra={"topic": topic, "session": self.session})
+                with metrics.GAME_START_SECONDS.time() as start:
+                    self.questions = get_questions_from_llm(topic=topic)
+                self.score = 0
+                self.current_index = 0
+                self.game_over = False
+                self.game_started = True
+                metrics.GAMES_STARTED.inc()
+                log.info("Game started", extra={
+                    "topic": topic, "session": self.session,
+                    "questions": len(self.questions), "latency_ms": round(start.seconds * 1000),
+                })
+                return True
+            except Exception as e:
+                log.error("Failed to start game", extra={"topic": topic, "session": self.session, "error": str(e)})
+                self.game_over = True
+                return False
     
     def get_current_question(self):
         """
@@ -120,6 +142,7 @@ class QuizGame:
         _, points = self.get_current_level()
         
         if is_correct:
+            _ANSWERS_CORRECT.inc()
             self.score += points
             points_earned = points
             
@@ -129,12 +152,15 @@ class QuizGame:
             # Check if quiz is complete (all 12 answered correctly)
             if self.current_index >= len(self.questions):
                 self.game_over = True
+                _GAMES_WON.inc()
                 next_q_num = None
             else:
                 next_q_num = self.current_index + 1
         
         else:
             # Wrong answer - game over
+            _ANSWERS_WRONG.inc()
+            _GAMES_LOST.inc()
             self.game_over = True
             points_earned = 0
             next_q_num = None
@@ -0,0 +1,201 @@
+"""
+Tolerant JSON parsing for model output.
+
+Generations are often almost JSON: trailing commas, single quotes, missing
+commas, unquoted keys, Python literals, an example array echoed from the
+prompt, prose with stray brackets, or an array cut off by the token limit.
+json.loads rejects all of them. This parser takes what it can instead:
+
+    >>> extract_arrays("Sure! [{'text': 'Hi?', 'answer': 'a',}, {'text': 'Cut")
+    [[{'text': 'Hi?', 'answer': 'a'}]]
+
+Rules:
+- Objects are kept only once their closing brace is seen, so a truncated
+  last object is dropped rather than returned half filled. A truncated
+  top-level array keeps the elements it completed.
+- Repeated and trailing commas are ignored, as are missing commas between
+  containers. A missing closing brace is assumed when an array closes.
+- Strings may use ' or "; a quote only closes a string when the next
+  non-space character could follow a value (, : } ] or the end), so
+  apostrophes and stray quotes inside strings survive.
+- Bare words are strings (answer: b), except true/false/null and their
+  Python spellings. Anything else that cannot start a value is skipped.
+
+One regular expression splits the text into tokens in a single pass and a
+loop with an explicit stack assembles them, so parsing is linear in the
+length of the output and deep nesting cannot hit the recursion limit.
+"""
+
+import re
+
+
+# Containers nested deeper than this are junk, not questions, and are skipped
+MAX_DEPTH = 32
+
+_OPENERS = re.compile(r"[\[{]")
+
+# Whitespace is consumed in front of each token. Any other character is
+# matched as junk and skipped: leaving it to fall between matches would make
+# finditer rescan the whitespace before it from every position.
+# A string without its closing quote runs to the end of the text (its end
+# group is then empty), so no character is scanned twice.
+_TOKEN = re.compile(r"""
+  \s*(?:
+    (?P<open>[\[{])
+  | (?P<close>[\]}])
+  | (?P<sep>[,:])
+  | "(?P<dq>[^"\\]*(?:(?:\\.|"(?!\s*(?:[,:}\]]|\Z)))[^"\\]*)*)(?P<dq_end>"?)
+  | '(?P<sq>[^'\\]*(?:(?:\\.|'(?!\s*(?:[,:}\]]|\Z)))[^'\\]*)*)(?P<sq_end>'?)
+  | (?P<number>-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?)
+  | (?P<word>[A-Za-z_][A-Za-z0-9_\-]*)
+  | (?P<junk>.)
+  )
+""", re.VERBOSE | re.DOTALL)
+
+_ESCAPE = re.compile(r"\\(u[0-9a-fA-F]{4}|.)", re.DOTALL)
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f"}
+
+_LITERALS = {
+    "true": True, "false": False, "null": None,
+    "True": True, "False": False, "None": None,
+}
+
+# Pending key of an object frame that is waiting for a key, not a value
+_NO_KEY = object()
+
+
+def _unescape(match):
+    esc = match.group(1)
+    if len(esc) == 5:
+        return chr(int(esc[1:], 16))
+    return _ESCAPES.get(esc, esc)
+
+
+def _add(frame, value):
+    container = frame[0]
+    if container is None:
+        return
+    if isinstance(container, list):
+        container.append(value)
+    elif frame[1] is _NO_KEY:
+        if isinstance(value, (str, int, float)):
+            frame[1] = str(value)
+    else:
+        container[frame[1]] = value
+        frame[1] = _NO_KEY
+
+
+def _parse(text, start):
+    """
+    Parse the container opening at text[start].
+
+    Returns:
+        tuple: (value, end index, complete). When the text runs out, value
+               is what the top-level array completed, or None if it was an
+               object.
+    """
+    # One frame per open container: [list or dict (None if skipped), pending key]
+    stack = []
+    for match in _TOKEN.finditer(text, start):
+        kind = match.lastgroup
+        if kind == "open":
+            if len(stack) >= MAX_DEPTH or (stack and stack[-1][0] is None):
+                stack.append([None, _NO_KEY])
+            else:
+                stack.append([{} if match.group(kind) == "{" else [], _NO_KEY])
+            continue
+        if kind == "close":
+            container = stack[-1][0]
+            if container is None:
+                stack.pop()
+                continue
+            if isinstance(container, list) and match.group(kind) == "}":
+                continue  # a brace closing nothing
+            if isinstance(container, dict) and match.group(kind) == "]":
+                # missing closing brace: close the object, then the array
+                stack.pop()
+                if not stack:
+                    return container, match.end(), True
+                _add(stack[-1], container)
+                container = stack[-1][0]
+                if not isinstance(container, list):
+                    continue
+            stack.pop()
+            if not stack:
+                return container, match.end(), True
+            _add(stack[-1], container)
+            continue
+        if kind == "junk":
+            continue
+        if kind == "sep":
+            if match.group(kind) == ",":
+                # "key": , -> the key never got a value
+                stack[-1][1] = _NO_KEY
+            continue
+
+        if kind == "number":
+            number = match.group(kind)
+            value = float(number) if any(ch in number for ch in ".eE") else int(number)
+        elif kind == "word":
+            value = match.group(kind)
+            frame = stack[-1]
+            if not (isinstance(frame[0], dict) and frame[1] is _NO_KEY):
+                value = _LITERALS.get(value, value)
+        else:
+            # a string; its end group is the last group that matched
+            if not match.group(kind):
+                break  # the text was cut off inside it
+            value = match.group(kind[:2])
+            if "\\" in value:
+                value = _ESCAPE.sub(_unescape, value)
+        _add(stack[-1], value)
+
+    # Ran out of text: only the completed elements of a top-level array survive
+    if isinstance(stack[0][0], list):
+        return stack[0][0], len(text), False
+    return None, len(text), False
+
+
+def extract_arrays(text):
+    """
+    Find every top-level array in text, parsed tolerantly.
+
+    Objects found outside any array are gathered into one extra list at the
+    end, so output that lists questions without brackets is still usable.
+
+    Returns:
+        list: One list per array, in order of appearance (may be empty)
+    """
+    arrays, loose = [], []
+    i = 0
+    while True:
+        match = _OPENERS.search(text, i)
+        if match is None:
+            break
+        value, i, complete = _parse(text, match.start())
+        if isinstance(value, list):
+            arrays.append(value)
+        elif value is not None:
+            loose.append(value)
+        if not complete:
+            break
+    if loose:
+        arrays.append(loose)
+    return arrays
+
+
+def loads(text):
+    """
+    Parse the first array or object in text tolerantly.
+
+    Raises:
+        ValueError: If text contains no array or object, or ends inside
+                    the first object
+    """
+    match = _OPENERS.search(text)
+    if match is None:
+        raise ValueError("No JSON array or object found")
+    value, _, _ = _parse(text, match.start())
+    if value is None:
+        raise ValueError("Text ends inside the first object")
+    return value
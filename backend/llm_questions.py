@@ -1,26 +1,64 @@
 import os
 import json
-from dotenv import load_dotenv
-import requests
+import random
+import functools
+import itertools
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 
-load_dotenv()
+from backend import config
+from backend import json_repair
+from backend import resilience
+from backend import metrics
+from backend import tracing
+from backend.logs import get_logger
+from backend.question_schema import validate_questions
 
-HUGGINGFACE_API_TOKEN = os.getenv("HUGGINGFACE_API_TOKEN")
+log = get_logger(__name__)
 
-def get_questions_from_huggingface(topic="General Knowledge"):
+_TOPIC_CACHE_HITS = metrics.TOPIC_CACHE_LOOKUPS.labels("hit")
+_TOPIC_CACHE_MISSES = metrics.TOPIC_CACHE_LOOKUPS.labels("miss")
+
+QUESTIONS_PER_GAME = 12
+# Fewer usable questions than this and the model output is discarded;
+# between this and QUESTIONS_PER_GAME the game is topped up from the fallback
+MIN_MODEL_QUESTIONS = 6
+
+# dotenv and requests are imported on first use: they are only needed for
+# a network fetch and together dominate the import time of this module.
+# Modules only needed once a feature is configured (exporting, the question
+# bank and its index, the topic cache) are imported when first used too.
+_env_loaded = False
+
+
+def get_api_token():
     """
-    Fetch 12 MCQs from Hugging Face Inference API using Bloom model.
-    
+    Read HUGGINGFACE_API_TOKEN, loading .env on the first call.
+
     Returns:
-        A list of question dicts or fallback questions on failure.
+        str or None: The token if configured
     """
-    if not HUGGINGFACE_API_TOKEN:
-        raise ValueError("HUGGINGFACE_API_TOKEN not found in .env")
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _env_loaded = True
+    return os.getenv("HUGGINGFACE_API_TOKEN")
+
 
-    model_id = "bigscience/bloom"  # Updated model id to valid one
+# Difficulty tiers in game order: get_current_level() scores questions 1-4
+# as Easy, 5-8 as Medium and 9-12 as Hard. Each tier is its own, smaller
+# request: (name, what the model is asked for, max_new_tokens).
+TIERS = (
+    ("easy", "easy questions on well-known facts that a beginner can answer", 320),
+    ("medium", "medium difficulty questions that need solid knowledge of the topic", 360),
+    ("hard", "hard questions on specific details that only an expert knows, with plausible wrong options", 400),
+)
+QUESTIONS_PER_TIER = QUESTIONS_PER_GAME // len(TIERS)
 
-    prompt = f"""
-Generate exactly 12 multiple-choice quiz questions about: {topic}
+TIER_PROMPT = """
+Generate exactly {count} {description} about: {topic}
 
 Return ONLY a JSON array of questions, for example:
 
@@ -34,86 +72,390 @@ Return ONLY a JSON array of questions, for example:
 ]
 """
 
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def _pool(name, per_request=1):
+    """
+    Shared threads for model requests, sized by HF_API_MAX_CONCURRENCY when first used.
+
+    Tier requests run on the "tier" pool and may wait on the "fetch" pool
+    (hedging); the two are kept apart so a full pool never waits on itself.
+    """
+    executor = _executors.get(name)
+    if executor is None:
+        with _executors_lock:
+            executor = _executors.get(name)
+            if executor is None:
+                executor = _executors[name] = ThreadPoolExecutor(
+                    config.hf_max_concurrency() * per_request, thread_name_prefix=f"quizzify-{name}")
+    return executor
+
+
+def get_questions_from_huggingface(topic="General Knowledge"):
+    """
+    Fetch 12 MCQs from Hugging Face Inference API using Bloom model.
+
+    The Easy, Medium and Hard questions are requested at the same time, one
+    request per tier, so the wait is that of the slowest short request
+    rather than of one long one. Questions come back in tier order with a
+    "tier" field.
+
+    Returns:
+        A list of question dicts or fallback questions on failure.
+
+    Raises:
+        resilience.CircuitOpen: The provider failed too often lately; nothing was sent
+        Exception: What the first tier's request raised, if every tier failed
+    """
+    token = get_api_token()
+    if not token:
+        metrics.LLM_FETCH_ERRORS.labels("no_token").inc()
+        raise ValueError("HUGGINGFACE_API_TOKEN not found in .env")
+
+    provider = resilience.breaker(config.hf_model_url())
+    if not provider.allow():
+        raise resilience.CircuitOpen(f"{provider.name} failed {provider.failures} times in a row, waiting to retry")
+
+    calls = [functools.partial(_try, generate_tier, topic, *spec, token) for spec in TIERS]
+    # The other tiers go to the pool, each in a copy of this context so its
+    # spans join the trace; the first runs here meanwhile.
+    pool = _pool("tier")
+    futures = [pool.submit(contextvars.copy_context().run, call) for call in calls[1:]]
+    outcomes = [calls[0]()] + [future.result() for future in futures]
+
+    tiers, errors = [], []
+    for (tier, _, _), (questions, error) in zip(TIERS, outcomes):
+        if error is not None:
+            log.warning("Tier request failed", extra={"topic": topic, "tier": tier, "error": str(error)})
+            errors.append(error)
+        tiers.append(questions)
+    if len(errors) == len(TIERS):
+        provider.failure()
+        raise errors[0]
+    provider.success()
+
+    questions = assemble_tiers(tiers)
+
+    export_path = config.question_export_file()
+    if export_path:
+        from backend import question_io
+        try:
+            question_io.export_generated(export_path, topic, questions)
+        except OSError as e:
+            log.warning("Could not export generated questions", extra={"path": export_path, "error": str(e)})
+
+    return questions
+
+
+def _try(function, *args):
+    """(function(*args), None), or ([], the exception) if it raised."""
+    try:
+        return function(*args), None
+    except Exception as e:
+        return [], e
+
+
+def generate_tier(topic, tier, description, max_new_tokens, token):
+    """
+    Request and validate the questions of one tier.
+
+    Returns:
+        list: Every valid question in the output (may be more or fewer than a tier needs)
+    """
+    with tracing.span("llm.tier", tier=tier) as s:
+        prompt = TIER_PROMPT.format(count=QUESTIONS_PER_TIER, description=description, topic=topic)
+        hedge_after = config.hf_hedge_after()
+        if hedge_after > 0:
+            generated_text = resilience.hedged(
+                _pool("fetch", 2), hedge_after, request_generation, prompt, max_new_tokens, token)
+        else:
+            generated_text = request_generation(prompt, max_new_tokens, token)
+        questions = valid_questions_in(generated_text)
+        s.set(valid=len(questions or ()))
+        return questions or []
+
+
+def request_generation(prompt, max_new_tokens, token):
+    """
+    POST one prompt to the model.
+
+    Returns:
+        str: The generated text
+
+    Raises:
+        ValueError: On an error status or an unexpected response
+    """
+    import requests
+
     headers = {
-        "Authorization": f"Bearer {HUGGINGFACE_API_TOKEN}"
+        "Authorization": f"Bearer {token}"
     }
     payload = {
         "inputs": prompt,
         "parameters": {
-            "max_new_tokens": 700,
+            "max_new_tokens": max_new_tokens,
             "do_sample": False,
         }
     }
 
-    response = requests.post(
-        f"https://router.huggingface.co/hf-inference/{model_id}",
-        headers=headers,
-        json=payload
-    )
+    try:
+        with metrics.LLM_FETCH_SECONDS.time() as fetch, tracing.span("llm.fetch") as fetch_span:
+            response = requests.post(
+                config.hf_model_url(),
+                headers=headers,
+                json=payload,
+                timeout=config.hf_timeout()
+            )
+            fetch_span.set(status=response.status_code)
+    except Exception:
+        metrics.LLM_FETCH_ERRORS.labels("network").inc()
+        raise
+
+    log.debug("Model responded", extra={
+        "status": response.status_code, "latency_ms": round(fetch.seconds * 1000),
+    })
 
     if response.status_code != 200:
+        metrics.LLM_FETCH_ERRORS.labels("http_status").inc()
         raise ValueError(f"Hugging Face API Error: {response.status_code} - {response.text}")
 
     response_json = response.json()
 
     if isinstance(response_json, list) and "generated_text" in response_json[0]:
-        generated_text = response_json[0]["generated_text"]
-    else:
-        raise ValueError("Unexpected response format from Hugging Face API")
+        return response_json[0]["generated_text"]
+    metrics.LLM_FETCH_ERRORS.labels("bad_response").inc()
+    raise ValueError("Unexpected response format from Hugging Face API")
 
-    try:
-        start_index = generated_text.find('[')
-        end_index = generated_text.rfind(']') + 1
-        json_str = generated_text[start_index:end_index]
 
-        questions = json.loads(json_str)
-    except Exception as e:
-        print(f"Warning: Failed to parse Hugging Face JSON output ({e}), falling back to default questions.")
-        questions = parse_fallback_questions()
+def valid_questions_in(generated_text):
+    """
+    Parse and validate the questions in raw model output.
 
-    valid_questions = []
-    for i, q in enumerate(questions):
+    Returns:
+        list or None: The valid questions, normalized; None if the output
+                      holds no parseable question list
+    """
+    with tracing.span("llm.parse", chars=len(generated_text)) as parse_span:
         try:
-            question = {
-                "text": str(q.get("text", "")).strip(),
-                "options": {
-                    "a": str(q.get("options", {}).get("a", "")).strip(),
-                    "b": str(q.get("options", {}).get("b", "")).strip(),
-                    "c": str(q.get("options", {}).get("c", "")).strip(),
-                    "d": str(q.get("options", {}).get("d", "")).strip(),
-                },
-                "answer": str(q.get("answer", "")).strip().lower()
-            }
-            if not question["text"]:
-                raise ValueError("Missing question text")
-            if question["answer"] not in ["a", "b", "c", "d"]:
-                raise ValueError(f"Invalid answer '{question['answer']}'")
-            if any(not opt for opt in question["options"].values()):
-                raise ValueError("One or more options missing")
-            valid_questions.append(question)
+            questions, repaired = load_question_list(generated_text)
         except Exception as e:
-            print(f"Question {i+1} invalid: {e}")
-
-    if len(valid_questions) != 12:
-        print(f"Warning: Expected 12 valid questions but got {len(valid_questions)}. Using fallback questions.")
-        valid_questions = parse_fallback_questions()
+            metrics.LLM_PARSE_FAILURES.inc()
+            log.warning("Model output is not parseable JSON", extra={"error": str(e)})
+            return None
+        if repaired:
+            metrics.LLM_PARSE_REPAIRS.inc()
+            parse_span.set(repaired=True)
+            log.debug("Model output needed repair", extra={"questions": len(questions)})
 
+    with tracing.span("llm.validate") as validate_span:
+        valid_questions, errors = validate_questions(questions)
+        for error in errors:
+            log.info("Question rejected", extra={
+                "question": error.index + 1, "field": error.field, "error": error.message,
+            })
+        rejected = len({error.index for error in errors})
+        if rejected:
+            metrics.LLM_INVALID_QUESTIONS.inc(rejected)
+        validate_span.set(valid=len(valid_questions))
     return valid_questions
 
 
+def _enough_questions(count):
+    """False (and counted) if a game of count model questions should be replaced by the fallback."""
+    if count < MIN_MODEL_QUESTIONS:
+        metrics.FALLBACKS.labels("invalid_count").inc()
+        log.warning("Too few valid questions, using fallback questions",
+                    extra={"valid": count, "expected": QUESTIONS_PER_GAME})
+        return False
+    if count < QUESTIONS_PER_GAME:
+        metrics.FALLBACKS.labels("topped_up").inc()
+        log.info("Topping up with fallback questions", extra={"valid": count, "expected": QUESTIONS_PER_GAME})
+    return True
+
+
+def parse_questions_output(generated_text):
+    """
+    Extract and validate the question list from raw model output.
+
+    Returns:
+        A list of 12 question dicts, or the fallback questions if the
+        output cannot be used.
+    """
+    valid_questions = valid_questions_in(generated_text)
+    if valid_questions is None:
+        metrics.FALLBACKS.labels("parse_error").inc()
+        log.warning("Using fallback questions for unparseable output")
+        return parse_fallback_questions()
+
+    if not _enough_questions(len(valid_questions)):
+        return parse_fallback_questions()
+    seen = {q["text"] for q in valid_questions}
+    extra = [q for q in parse_fallback_questions() if q["text"] not in seen]
+    valid_questions += extra[:QUESTIONS_PER_GAME - len(valid_questions)]
+    return valid_questions[:QUESTIONS_PER_GAME]
+
+
+def assemble_tiers(tiers):
+    """
+    Build a game from the valid questions of each tier, in tier order.
+
+    Each tier keeps its first QUESTIONS_PER_TIER questions not already used
+    by an earlier tier. Short tiers are topped up in place from the fallback
+    questions, so questions 1-4, 5-8 and 9-12 stay in their bands.
+
+    Args:
+        tiers (list): One list of valid questions per entry of TIERS
+
+    Returns:
+        list: 12 question dicts with a "tier" field, or the fallback questions
+    """
+    seen = set()
+    picked = []
+    for (tier, _, _), questions in zip(TIERS, tiers):
+        chosen = []
+        for q in questions:
+            if len(chosen) == QUESTIONS_PER_TIER:
+                break
+            if q["text"] not in seen:
+                seen.add(q["text"])
+                chosen.append(dict(q, tier=tier))
+        picked.append(chosen)
+
+    if not _enough_questions(sum(map(len, picked))):
+        return parse_fallback_questions()
+    extra = iter([q for q in parse_fallback_questions() if q["text"] not in seen])
+    game = []
+    for (tier, _, _), chosen in zip(TIERS, picked):
+        chosen += [dict(q, tier=tier) for q in itertools.islice(extra, QUESTIONS_PER_TIER - len(chosen))]
+        game += chosen
+    return game
+
+
+def _question_objects(items):
+    return sum(isinstance(q, dict) and "text" in q for q in items)
+
+
+def load_question_list(generated_text):
+    """
+    Find the question array in raw model output.
+
+    Clean output is read with json.loads. Anything else goes through
+    json_repair, and the array holding the most question objects wins (an
+    echoed prompt carries a one-question example array before the real one).
+
+    Returns:
+        tuple: (list of question dicts, True if the output needed repair)
+
+    Raises:
+        ValueError: If the output holds no question objects
+    """
+    start_index = generated_text.find('[')
+    end_index = generated_text.rfind(']') + 1
+    try:
+        questions = json.loads(generated_text[start_index:end_index])
+        if isinstance(questions, list) and _question_objects(questions):
+            return questions, False
+    except ValueError:
+        pass
+
+    best = max(json_repair.extract_arrays(generated_text), key=_question_objects, default=[])
+    if not _question_objects(best):
+        raise ValueError("No question objects in model output")
+    return [q for q in best if isinstance(q, dict)], True
+
+
 def get_questions_from_llm(topic="General Knowledge"):
     """
     Primary function to get questions via Hugging Face API.
     Falls back on failure.
+
+    With the topic cache on (QUIZZIFY_TOPIC_CACHE_SIZE), a game generated
+    for a similar enough topic is reused without a model call.
+    While the provider's circuit breaker is open (resilience.py), games go
+    straight to the bank or built-in questions.
     """
-    try:
-        return get_questions_from_huggingface(topic)
-    except Exception as e:
-        print(f"Error fetching questions from Hugging Face: {e}")
-        print("Using fallback questions instead...")
+    with tracing.span("llm.get_questions", topic=topic) as s:
+        cache = None
+        if config.topic_cache_size() > 0:
+            from backend import topic_cache
+            cache = topic_cache.default_cache()
+        if cache is not None:
+            hit = cache.get(topic)
+            if hit is not None:
+                questions, match, similarity = hit
+                _TOPIC_CACHE_HITS.inc()
+                log.debug("Reusing cached questions", extra={
+                    "topic": topic, "cached_topic": match, "similarity": round(similarity, 3),
+                })
+                s.set(cache=match)
+                return questions
+            _TOPIC_CACHE_MISSES.inc()
+        try:
+            with tracing.span("llm.huggingface"):
+                questions = get_questions_from_huggingface(topic)
+            # only games with model-generated questions are worth keeping
+            if cache is not None and not all(map(is_builtin, questions)):
+                cache.put(topic, questions)
+            return questions
+        except resilience.CircuitOpen as e:
+            # the provider is known to be down; not worth a warning per game
+            reason = "circuit_open"
+            log.debug("Provider circuit open, using fallback questions", extra={"topic": topic, "error": str(e)})
+        except Exception as e:
+            reason = "fetch_error"
+            log.warning("Question fetch failed, using fallback questions", extra={"topic": topic, "error": str(e)})
+        metrics.FALLBACKS.labels(reason).inc()
+        s.set(fallback=reason)
+        questions = bank_questions(topic)
+        if questions is not None:
+            s.set(source="bank")
+            return questions
         return parse_fallback_questions()
 
 
+def bank_questions(topic):
+    """
+    Draw a game from the question bank named by QUIZZIFY_QUESTION_BANK.
+
+    With the bank's search index, the game is drawn from the questions that
+    rank best for the topic (BM25 over question, option and topic text).
+    Without an index, or with too few matches, questions tagged with the
+    topic are used, and failing that a draw from the whole bank.
+
+    Returns:
+        list or None: 12 question dicts, or None without a usable bank
+    """
+    if not config.question_bank_file():
+        return None
+    from backend import question_bank, search_index
+    try:
+        bank = question_bank.default_bank()
+        index = search_index.default_index()
+    except (OSError, ValueError) as e:
+        log.warning("Could not open question bank", extra={"path": config.question_bank_file(), "error": str(e)})
+        return None
+    if bank is None or len(bank) < QUESTIONS_PER_GAME:
+        return None
+    if index is not None and len(index) != len(bank):
+        # left over from an earlier build of the bank: its numbers point elsewhere
+        log.warning("Search index does not match the question bank, not using it",
+                    extra={"path": index.path, "indexed": len(index), "questions": len(bank)})
+        index = None
+    with tracing.span("llm.bank", topic=topic) as s:
+        if index is not None:
+            # a pool twice the game size keeps repeated topics from replaying one game
+            hits = index.search(topic, limit=2 * QUESTIONS_PER_GAME)
+            s.set(matches=len(hits))
+            if len(hits) >= QUESTIONS_PER_GAME:
+                numbers = random.sample([number for number, _ in hits], QUESTIONS_PER_GAME)
+                return question_bank.by_tier(bank[n] for n in numbers)
+        if len(bank.ids(topic=topic)) >= QUESTIONS_PER_GAME:
+            return bank.draw(QUESTIONS_PER_GAME, topic=topic)
+        return bank.draw(QUESTIONS_PER_GAME)
+
+
 def get_fallback_questions():
     fallback_json = """{
         "questions": [
@@ -182,8 +524,23 @@ def get_fallback_questions():
     return fallback_json
 
 
+def _question_key(question):
+    return question["text"], question["answer"], tuple(sorted(question["options"].items()))
+
+
+@functools.lru_cache(maxsize=1)
+def _builtin_keys():
+    return frozenset(map(_question_key, json.loads(get_fallback_questions())["questions"]))
+
+
+def is_builtin(question):
+    """True for one of the built-in fallback questions (not a model question reusing its text)."""
+    return _question_key(question) in _builtin_keys()
+
+
 def parse_fallback_questions():
-    data = json.loads(get_fallback_questions())
+    with tracing.span("llm.fallback"):
+        data = json.loads(get_fallback_questions())
     return data["questions"]
 
 
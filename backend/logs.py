@@ -0,0 +1,124 @@
+"""
+Structured, non-blocking logging for Quizzify.
+
+Modules log through get_logger() with the standard logging API and pass
+structured fields as extra:
+
+    log = get_logger(__name__)
+    log.info("Game started", extra={"topic": topic, "latency_ms": 812})
+
+Records only go into a queue on the calling thread; a QueueListener thread
+formats and writes them, so logging never blocks the UI on stdout. Calls
+below the configured level return after one cached level check.
+
+Entry points call configure() once. The environment can override it:
+    QUIZZIFY_LOG_LEVEL=DEBUG|INFO|WARNING|ERROR   (default INFO)
+    QUIZZIFY_LOG_FORMAT=text|json                 (default text)
+"""
+
+import os
+import sys
+import json
+import queue
+import atexit
+import logging
+import logging.handlers
+
+
+ROOT_LOGGER = "quizzify"
+
+# Attributes every LogRecord has; anything else came in through extra
+_RESERVED = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+_listener = None
+
+# Library use stays silent until an entry point calls configure()
+logging.getLogger(ROOT_LOGGER).addHandler(logging.NullHandler())
+
+
+def get_logger(name):
+    """Return a logger under the quizzify namespace (e.g. quizzify.backend.game_engine)."""
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+def fields(record):
+    """Return the structured fields passed to a log call as extra."""
+    return {k: v for k, v in vars(record).items() if k not in _RESERVED and not k.startswith("_")}
+
+
+class TextFormatter(logging.Formatter):
+    """time level logger: message key=value ..."""
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)-7s %(name)s: %(message)s")
+
+    def format(self, record):
+        line = super().format(record)
+        extra = fields(record)
+        if extra:
+            line += " " + " ".join(f"{k}={v}" for k, v in extra.items())
+        return line
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line with the structured fields at top level."""
+
+    def format(self, record):
+        entry = {
+            "time": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update(fields(record))
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def configure(level=None, fmt=None, stream=None):
+    """
+    Route quizzify logs through a background writer.
+
+    Args:
+        level (str or int): Minimum level (QUIZZIFY_LOG_LEVEL, else INFO)
+        fmt (str): "text" or "json" (QUIZZIFY_LOG_FORMAT, else text)
+        stream: Where records are written (default sys.stderr)
+
+    Calling it again replaces the previous configuration.
+    """
+    global _listener
+    level = level or os.environ.get("QUIZZIFY_LOG_LEVEL", "INFO")
+    fmt = fmt or os.environ.get("QUIZZIFY_LOG_FORMAT", "text")
+
+    shutdown()
+
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(JsonFormatter() if fmt == "json" else TextFormatter())
+
+    records = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(records, handler, respect_handler_level=True)
+    _listener.start()
+
+    root = logging.getLogger(ROOT_LOGGER)
+    root.addHandler(logging.handlers.QueueHandler(records))
+    root.setLevel(level.upper() if isinstance(level, str) else level)
+    # quizzify records are handled here only, not again by the root logger
+    root.propagate = False
+
+
+def shutdown():
+    """Flush queued records, stop the writer thread and go back to the silent default."""
+    global _listener
+    root = logging.getLogger(ROOT_LOGGER)
+    # without a listener the queue would only grow
+    for old in [h for h in root.handlers if isinstance(h, logging.handlers.QueueHandler)]:
+        root.removeHandler(old)
+    root.setLevel(logging.NOTSET)
+    root.propagate = True
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(shutdown)
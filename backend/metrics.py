@@ -0,0 +1,288 @@
+"""
+In-process metrics for Quizzify.
+
+Counters and latency histograms live in one registry and are exported in
+the Prometheus text format, either over HTTP or to a file (for the
+node_exporter textfile collector). Counting is a per-thread addition and
+observing a histogram a lock and an addition, so both are safe to call from
+the game and UI hot paths.
+
+Usage:
+    from backend import metrics
+    metrics.GAMES_STARTED.inc()
+    with metrics.LLM_FETCH_SECONDS.time():
+        ...
+    print(metrics.REGISTRY.render())
+
+Exporters are enabled from the environment by configure_from_env():
+    QUIZZIFY_METRICS_PORT=9464        serve http://127.0.0.1:9464/metrics
+    QUIZZIFY_METRICS_FILE=quizzify.prom  write the file on exit
+"""
+
+import os
+import time
+import bisect
+import atexit
+import threading
+
+
+# Latency buckets in seconds: game actions are fast, model calls are slow
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Shared label handling: a metric with label names holds one child per label set."""
+
+    TYPE = ""
+
+    def __init__(self, name, help, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children = {}
+
+    def labels(self, *values):
+        """Return the child for one set of label values (cache it on hot paths)."""
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        values = tuple(str(v) for v in values)
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def _series(self):
+        if self.labelnames:
+            return sorted(self._children.items())
+        return [((), self)]
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.TYPE}"]
+        for values, child in self._series():
+            lines.extend(child._samples(self.name, self.labelnames, values))
+        return lines
+
+
+class Counter(_Metric):
+    """A value that only goes up."""
+
+    TYPE = "counter"
+
+    def __init__(self, name, help, labelnames=()):
+        super().__init__(name, help, labelnames)
+        # Each thread adds to its own one-item list, so inc() needs no lock
+        # (a third of the cost of taking one); value sums the lists.
+        self._local = threading.local()
+        self._cells = []
+
+    def _new_child(self):
+        return Counter(self.name, self.help)
+
+    def inc(self, amount=1):
+        try:
+            self._local.cell[0] += amount
+        except AttributeError:
+            cell = self._local.cell = [amount]
+            with self._lock:
+                self._cells.append(cell)
+
+    @property
+    def value(self):
+        with self._lock:
+            return sum(cell[0] for cell in self._cells)
+
+    def _samples(self, name, labelnames, values):
+        return [f"{name}{_format_labels(labelnames, values)} {_format_value(self.value)}"]
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative buckets, plus their sum and count."""
+
+    TYPE = "histogram"
+
+    def __init__(self, name, help, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def _new_child(self):
+        return Histogram(self.name, self.help, buckets=self.buckets)
+
+    def observe(self, value):
+        # first bucket whose upper bound is >= value; the last slot is +Inf
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def time(self):
+        """Context manager observing the time spent in its block."""
+        return _Timer(self)
+
+    def _samples(self, name, labelnames, values):
+        with self._lock:
+            counts, total, count = list(self.counts), self.sum, self.count
+        lines = []
+        cumulative = 0
+        for bound, n in zip(self.buckets + (float("inf"),), counts):
+            cumulative += n
+            labels = _format_labels(labelnames, values, [("le", _format_value(bound))])
+            lines.append(f"{name}_bucket{labels} {cumulative}")
+        labels = _format_labels(labelnames, values)
+        lines.append(f"{name}_sum{labels} {_format_value(total)}")
+        lines.append(f"{name}_count{labels} {count}")
+        return lines
+
+
+class _Timer:
+    def __init__(self, histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.seconds = time.perf_counter() - self.start
+        self.histogram.observe(self.seconds)
+        return False
+
+
+class Registry:
+    """A named set of metrics, rendered together."""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, help, labelnames=()):
+        return self.register(Counter(name, help, labelnames))
+
+    def histogram(self, name, help, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self.register(Histogram(name, help, labelnames, buckets))
+
+    def get(self, name):
+        return self._metrics[name]
+
+    def render(self):
+        """Return every metric in the Prometheus text exposition format."""
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path):
+        """Write render() to path atomically (write, then rename)."""
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.render())
+        os.replace(tmp, path)
+
+
+REGISTRY = Registry()
+
+# LLM pipeline
+LLM_FETCH_SECONDS = REGISTRY.histogram(
+    "quizzify_llm_fetch_seconds", "Time spent waiting for the question model")
+LLM_FETCH_ERRORS = REGISTRY.counter(
+    "quizzify_llm_fetch_errors_total", "Question fetches that failed", ["reason"])
+LLM_PARSE_FAILURES = REGISTRY.counter(
+    "quizzify_llm_parse_failures_total", "Model outputs that did not contain parseable JSON")
+LLM_PARSE_REPAIRS = REGISTRY.counter(
+    "quizzify_llm_parse_repairs_total", "Model outputs read with the tolerant parser")
+LLM_INVALID_QUESTIONS = REGISTRY.counter(
+    "quizzify_llm_invalid_questions_total", "Generated questions rejected by validation")
+FALLBACKS = REGISTRY.counter(
+    "quizzify_fallback_total", "Games served the built-in question set", ["reason"])
+LLM_HEDGED_REQUESTS = REGISTRY.counter(
+    "quizzify_llm_hedged_requests_total", "Slow model requests sent twice, by which copy answered first (or failed)", ["winner"])
+CIRCUIT_TRANSITIONS = REGISTRY.counter(
+    "quizzify_circuit_transitions_total", "Provider circuit breaker state changes, by new state", ["state"])
+TOPIC_CACHE_LOOKUPS = REGISTRY.counter(
+    "quizzify_topic_cache_lookups_total", "Topic cache lookups, by hit or miss", ["result"])
+
+# Games
+GAMES_STARTED = REGISTRY.counter(
+    "quizzify_games_started_total", "Games started")
+GAMES_FINISHED = REGISTRY.counter(
+    "quizzify_games_finished_total", "Games that reached game over", ["outcome"])
+GAME_START_SECONDS = REGISTRY.histogram(
+    "quizzify_game_start_seconds", "Time to start a game, including fetching questions")
+ANSWERS = REGISTRY.counter(
+    "quizzify_answers_total", "Answers submitted (rate() gives answers per second)", ["correct"])
+
+
+_server = None
+
+
+def start_http_server(port, host="127.0.0.1", registry=REGISTRY):
+    """
+    Serve the registry at http://host:port/metrics from a daemon thread.
+
+    Returns:
+        ThreadingHTTPServer: The running server (call shutdown() to stop)
+    """
+    # imported here: http.server is only needed when exporting, not to count
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def configure_from_env():
+    """Start the exporters requested by QUIZZIFY_METRICS_PORT / QUIZZIFY_METRICS_FILE."""
+    global _server
+    port = os.environ.get("QUIZZIFY_METRICS_PORT")
+    if port and _server is None:
+        _server = start_http_server(int(port))
+    path = os.environ.get("QUIZZIFY_METRICS_FILE")
+    if path:
+        atexit.register(REGISTRY.write_textfile, path)
@@ -0,0 +1,328 @@
+"""
+On-disk question bank opened with mmap.
+
+A bank is one file built from a JSONL or CSV question file (see
+question_io.py):
+
+    header     magic, version, question count and section offsets
+    dictionary compression dictionary shared by all records (compression.py)
+    data       the questions as compact JSON, each compressed on its own, back to back
+    offsets    count + 1 little-endian uint64: question i is data[offsets[i]:offsets[i + 1]]
+    ids        uint32 question numbers, one run per topic and per tier
+    directory  JSON {"topics": {key: [start, count]}, "tiers": {...}} into ids,
+               plus the codec and where the dictionary is
+
+Opening a bank maps the file and reads the header and the small directory;
+no question is decompressed or parsed until it is asked for. Reading
+question i is two offset lookups, decompressing its own bytes and one
+json.loads, so drawing a game is
+12 seeks whatever the size of the bank. Worker processes that open the same
+file share its pages through the OS page cache instead of each holding a
+copy of the bank.
+
+Usage:
+    python -m backend.question_bank build bank.jsonl questions.qbank
+    python -m backend.question_bank info questions.qbank
+    QUIZZIFY_QUESTION_BANK=questions.qbank python run_quiz.py
+
+build also writes the search index (search_index.py) next to the bank.
+"""
+
+import os
+import sys
+import json
+import mmap
+import array
+import random
+import struct
+import argparse
+import itertools
+import threading
+from collections.abc import Sequence
+
+from backend import config
+from backend import compression
+from backend import question_io
+from backend import search_index
+
+
+MAGIC = b"QZBANK\r\n"
+VERSION = 2
+
+# magic, version, count, data_at, offsets_at, ids_at, directory_at
+_HEADER = struct.Struct("<8sIIQQQQ")
+_OFFSET = struct.Struct("<Q")
+_ID = struct.Struct("<I")
+
+TIERS = ("easy", "medium", "hard")
+
+
+def topic_key(topic):
+    """Index key for a topic: lower case, single spaces."""
+    return " ".join(str(topic).lower().split())
+
+
+def by_tier(questions):
+    """Sort questions easy, medium, hard; untiered ones count as medium."""
+    rank = {tier: i for i, tier in enumerate(TIERS)}
+    return sorted(questions, key=lambda q: rank.get(q.get("tier"), 1))
+
+
+def _pad(f, size=8):
+    """Pad f to a multiple of size so the next section is aligned."""
+    f.write(b"\0" * (-f.tell() % size))
+
+
+def build(questions, path, codec=None):
+    """
+    Write an iterable of questions (e.g. question_io.iter_questions()) to a bank file.
+
+    Questions are streamed to disk; only the offsets and index arrays are
+    kept in memory while building. "topic" and "tier" are indexed when present.
+    The compression dictionary is trained on the first questions.
+
+    Args:
+        codec (str): "zstd", "zlib" or "none"; default zstd when installed, else zlib
+
+    Returns:
+        int: Questions written
+    """
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    offsets = array.array("Q", [0])
+    topics = {}
+    tiers = {}
+
+    records = ((q, dumps(q).encode("utf-8")) for q in questions)
+    head = list(itertools.islice(records, compression.TRAINING_SAMPLES))
+    codec = compression.Codec(codec, compression.train_dictionary([r for _, r in head], codec))
+    raw_bytes = 0
+
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(b"\0" * _HEADER.size)
+        dictionary_at = f.tell()
+        f.write(codec.dictionary)
+        _pad(f)
+        data_at = f.tell()
+        for number, (question, record) in enumerate(itertools.chain(head, records)):
+            raw_bytes += len(record)
+            f.write(codec.compress(record))
+            offsets.append(f.tell() - data_at)
+            if question.get("topic"):
+                topics.setdefault(topic_key(question["topic"]), array.array("I")).append(number)
+            if question.get("tier") in TIERS:
+                tiers.setdefault(question["tier"], array.array("I")).append(number)
+        count = len(offsets) - 1
+
+        _pad(f)
+        offsets_at = f.tell()
+        if sys.byteorder != "little":
+            offsets.byteswap()
+        offsets.tofile(f)
+
+        ids_at = f.tell()
+        directory = {
+            "topics": {}, "tiers": {}, "codec": codec.name,
+            "dictionary": [dictionary_at, len(codec.dictionary)], "raw_bytes": raw_bytes,
+        }
+        start = 0
+        for name, index in (("topics", topics), ("tiers", tiers)):
+            for key, ids in index.items():
+                directory[name][key] = [start, len(ids)]
+                start += len(ids)
+                if sys.byteorder != "little":
+                    ids.byteswap()
+                ids.tofile(f)
+
+        directory_at = f.tell()
+        f.write(json.dumps(directory, ensure_ascii=False).encode("utf-8"))
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, VERSION, count, data_at, offsets_at, ids_at, directory_at))
+    os.replace(tmp, path)
+    return count
+
+
+class _Ids(Sequence):
+    """A run of uint32 question numbers read straight from the map."""
+
+    def __init__(self, buffer, at, count):
+        self._buffer = buffer
+        self._at = at
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._count))]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("question index out of range")
+        return _ID.unpack_from(self._buffer, self._at + _ID.size * i)[0]
+
+
+class QuestionBank(Sequence):
+    """
+    Read-only view of a bank file; bank[i] is question i as a dict.
+
+    Safe to share between threads. Each process should open its own
+    QuestionBank: the mapping is what gets shared.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, data_at, offsets_at, ids_at, directory_at = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version not in (1, VERSION):
+            self._map.close()
+            raise ValueError(f"{path} is not a version {VERSION} question bank")
+        self._count = count
+        self._data_at = data_at
+        self._offsets_at = offsets_at
+        self._ids_at = ids_at
+        directory = json.loads(self._map[directory_at:])
+        self._topics = directory["topics"]
+        self._tiers = directory["tiers"]
+        # version 1 banks are uncompressed
+        at, size = directory.get("dictionary", (0, 0))
+        self.codec = compression.Codec(directory.get("codec", "none"), self._map[at:at + size])
+        self.raw_bytes = directory.get("raw_bytes")
+        self.data_bytes = _OFFSET.unpack_from(self._map, offsets_at + _OFFSET.size * count)[0]
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._count))]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("question index out of range")
+        at = self._offsets_at + _OFFSET.size * i
+        start, end = struct.unpack_from("<QQ", self._map, at)
+        return json.loads(self.codec.decompress(self._map[self._data_at + start:self._data_at + end]))
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def topics(self):
+        """Topic keys in the bank (see topic_key())."""
+        return list(self._topics)
+
+    def tiers(self):
+        return list(self._tiers)
+
+    def _run(self, entry):
+        if entry is None:
+            return _Ids(self._map, self._ids_at, 0)
+        start, count = entry
+        return _Ids(self._map, self._ids_at + _ID.size * start, count)
+
+    def ids(self, topic=None, tier=None):
+        """
+        Question numbers for one topic or one tier, or all of them.
+
+        Returns:
+            Sequence: Lazily read question numbers (range() for the whole bank)
+        """
+        if topic is not None:
+            return self._run(self._topics.get(topic_key(topic)))
+        if tier is not None:
+            return self._run(self._tiers.get(tier))
+        return range(self._count)
+
+    def draw(self, count, topic=None, rng=random):
+        """
+        Pick count distinct random questions, easy ones first.
+
+        With a topic, questions come from that topic only. Without one,
+        and when every tier has enough questions, each tier gets an equal
+        share (the game's Easy/Medium/Hard bands); otherwise questions are
+        drawn from the whole bank.
+
+        Returns:
+            list: Question dicts; fewer than count if the pool is smaller
+        """
+        if topic is not None:
+            pool = self.ids(topic=topic)
+            numbers = rng.sample(pool, min(count, len(pool)))
+        else:
+            share, rest = divmod(count, len(TIERS))
+            runs = [self.ids(tier=tier) for tier in TIERS]
+            if not rest and all(len(run) >= share for run in runs):
+                numbers = [n for run in runs for n in rng.sample(run, share)]
+            else:
+                numbers = rng.sample(range(self._count), min(count, self._count))
+        return by_tier(self[n] for n in numbers)
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_bank():
+    """
+    The bank named by QUIZZIFY_QUESTION_BANK, opened once per process.
+
+    Returns:
+        QuestionBank or None: None when no bank is configured
+    """
+    global _default
+    path = config.question_bank_file()
+    if not path:
+        return None
+    bank = _default
+    if bank is None or bank.path != path:
+        with _default_lock:
+            if _default is None or _default.path != path:
+                previous, _default = _default, QuestionBank(path)
+                if previous is not None:
+                    previous.close()
+            bank = _default
+    return bank
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build and inspect mmap question banks")
+    sub = parser.add_subparsers(dest="command", required=True)
+    make = sub.add_parser("build", help="build a bank and its search index from a .jsonl or .csv question file")
+    make.add_argument("src")
+    make.add_argument("dst")
+    make.add_argument("--codec", choices=compression.CODECS, help="default: zstd when installed, else zlib")
+    show = sub.add_parser("info", help="print the size and indexes of a bank")
+    show.add_argument("path")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        rejected = []
+        count = build(question_io.iter_questions(args.src, on_error=rejected.append), args.dst, args.codec)
+        print(f"Wrote {count:,} questions to {args.dst} ({len(rejected):,} problems skipped)")
+        with QuestionBank(args.dst) as bank:
+            search_index.build(bank, search_index.index_path(args.dst))
+        return 0
+
+    with QuestionBank(args.path) as bank:
+        print(f"{len(bank):,} questions, {os.path.getsize(args.path):,} bytes")
+        if bank.raw_bytes:
+            saved = 100 - 100 * bank.data_bytes / bank.raw_bytes
+            print(f"  {bank.codec.name}: {bank.data_bytes:,} bytes of questions, "
+                  f"{bank.raw_bytes:,} uncompressed ({saved:.0f}% saved)")
+        for name, index in (("tier", bank._tiers), ("topic", bank._topics)):
+            for key, (_, count) in sorted(index.items(), key=lambda item: -item[1][1])[:20]:
+                print(f"  {name} {key!r}: {count:,}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,306 @@
+"""
+Streaming import and export of question banks.
+
+Questions use the same shape as parse_fallback_questions():
+
+    {"text": "...", "options": {"a": "...", "b": "...", "c": "...", "d": "..."}, "answer": "b"}
+
+plus an optional "topic" and "tier" (easy, medium or hard). Two file formats are supported, chosen by the
+file extension:
+
+    .jsonl  one question object per line
+    .csv    columns text,a,b,c,d,answer[,topic,tier] (a header row is required)
+
+Reading is a generator over the file: records are parsed one line at a
+time and validated in batches by validate_questions(), the validator the
+live question path uses, so memory stays flat however long the file is.
+Writing buffers one batch of lines and writes it with a single call.
+
+Usage:
+    python -m backend.question_io validate bank.csv
+    python -m backend.question_io convert bank.csv bank.jsonl
+    QUIZZIFY_EXPORT_FILE=generated.jsonl python run_quiz.py   # keep what the model generates
+"""
+
+import io
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+import itertools
+import threading
+
+from backend.question_schema import OPTION_KEYS, QuestionError, validate_questions
+
+
+BATCH_SIZE = 2048
+
+# Fields carried through import and export next to the validated question
+META_FIELDS = ("topic", "tier")
+
+CSV_REQUIRED = ("text",) + OPTION_KEYS + ("answer",)
+CSV_FIELDS = CSV_REQUIRED + META_FIELDS
+
+_append_lock = threading.Lock()
+
+
+def detect_format(path):
+    """Return "jsonl" or "csv" from the file extension."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if ext == ".csv":
+        return "csv"
+    raise ValueError(f"Unknown question file format '{ext}' (use .jsonl or .csv)")
+
+
+# ============================================
+#      READING
+# ============================================
+
+def _read_jsonl(f, on_error):
+    for line_no, line in enumerate(f, 1):
+        if not line.strip():
+            continue
+        try:
+            yield line_no, json.loads(line)
+        except ValueError as e:
+            if on_error is not None:
+                on_error(QuestionError(line_no, "", f"invalid JSON: {e}"))
+
+
+def _read_csv(f, on_error):
+    reader = csv.DictReader(f)
+    missing = [name for name in CSV_REQUIRED if name not in (reader.fieldnames or ())]
+    if missing:
+        raise ValueError(f"CSV header is missing columns: {', '.join(missing)}")
+    for row in reader:
+        record = {
+            "text": row["text"],
+            "options": {key: row[key] for key in OPTION_KEYS},
+            "answer": row["answer"],
+        }
+        for name in META_FIELDS:
+            if row.get(name):
+                record[name] = row[name]
+        # line_num is where the row ended, which is right for single-line rows
+        yield reader.line_num, record
+
+
+def read_records(path, fmt=None, on_error=None):
+    """
+    Yield (line number, raw record) for every record in a question file.
+
+    Lines that are not valid JSON go to on_error as QuestionError(line, "", message).
+    """
+    fmt = fmt or detect_format(path)
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if fmt == "jsonl":
+            yield from _read_jsonl(f, on_error)
+        else:
+            yield from _read_csv(f, on_error)
+
+
+def iter_questions(path, fmt=None, batch_size=BATCH_SIZE, on_error=None, progress=None):
+    """
+    Yield the valid questions of a file, normalized, in file order.
+
+    Args:
+        on_error (callable): Called with a QuestionError per problem; its
+                             index is the line number in the file
+        progress (callable): Called after each batch with (records read,
+                             questions accepted); unreadable lines count
+                             as read
+    """
+    read = accepted = 0
+
+    def unreadable(error):
+        nonlocal read
+        read += 1
+        if on_error is not None:
+            on_error(error)
+
+    records = read_records(path, fmt, unreadable)
+    while True:
+        batch = list(itertools.islice(records, batch_size))
+        if not batch:
+            break
+        lines = [line for line, _ in batch]
+        items = [record for _, record in batch]
+        metas = [{k: item.pop(k) for k in META_FIELDS if k in item} if item.__class__ is dict else None
+                 for item in items]
+
+        valid, errors = validate_questions(items)
+        rejected = set()
+        for error in errors:
+            rejected.add(error.index)
+            if on_error is not None:
+                on_error(error._replace(index=lines[error.index]))
+
+        # valid keeps input order without the rejected items
+        kept = (meta for i, meta in enumerate(metas) if i not in rejected) if rejected else iter(metas)
+        for question, meta in zip(valid, kept):
+            if meta:
+                question = dict(question, **meta)
+            yield question
+
+        read += len(batch)
+        accepted += len(valid)
+        if progress is not None:
+            progress(read, accepted)
+
+
+# ============================================
+#      WRITING
+# ============================================
+
+def _jsonl_lines(questions):
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(", ", ": ")).encode
+    for q in questions:
+        yield dumps(q) + "\n"
+
+
+def _csv_lines(questions):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    for q in questions:
+        options = q["options"]
+        writer.writerow((q["text"], options["a"], options["b"], options["c"], options["d"],
+                         q["answer"], q.get("topic") or "", q.get("tier") or ""))
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def write_questions(path, questions, fmt=None, batch_size=BATCH_SIZE, append=False):
+    """
+    Write questions (any iterable, e.g. iter_questions()) to a file.
+
+    Returns:
+        int: Questions written
+    """
+    fmt = fmt or detect_format(path)
+    lines = _jsonl_lines(questions) if fmt == "jsonl" else _csv_lines(questions)
+    count = 0
+    with open(path, "a" if append else "w", encoding="utf-8", newline="") as f:
+        if fmt == "csv" and f.tell() == 0:
+            f.write(",".join(CSV_FIELDS) + "\n")
+        while True:
+            chunk = list(itertools.islice(lines, batch_size))
+            if not chunk:
+                break
+            f.write("".join(chunk))
+            count += len(chunk)
+    return count
+
+
+def convert(src, dst, batch_size=BATCH_SIZE, on_error=None, progress=None):
+    """
+    Stream src into dst, validating and normalizing on the way.
+
+    Returns:
+        dict: {"read", "written", "rejected"}
+    """
+    counts = {"read": 0}
+
+    def count(read, accepted):
+        counts["read"] = read
+        if progress is not None:
+            progress(read, accepted)
+
+    questions = iter_questions(src, batch_size=batch_size, on_error=on_error, progress=count)
+    written = write_questions(dst, questions, batch_size=batch_size)
+    return {"read": counts["read"], "written": written, "rejected": counts["read"] - written}
+
+
+# ============================================
+#      EXPORT OF GENERATED QUESTIONS
+# ============================================
+
+def export_generated(path, topic, questions):
+    """
+    Append the model-generated questions of one game to a JSONL bank.
+
+    Built-in fallback questions (used for fallbacks and top-ups) are left out.
+
+    Returns:
+        int: Questions written
+    """
+    from backend.llm_questions import is_builtin
+    generated = [dict(q, topic=topic) for q in questions if not is_builtin(q)]
+    if not generated:
+        return 0
+    with _append_lock:
+        return write_questions(path, generated, fmt="jsonl", append=True)
+
+
+# ============================================
+#      COMMAND LINE
+# ============================================
+
+class _Progress:
+    """Rate-limited progress line on stderr."""
+
+    def __init__(self, stream=sys.stderr, interval=0.5):
+        self.stream = stream
+        self.interval = interval
+        self.start = self.last = time.perf_counter()
+
+    def __call__(self, read, accepted, final=False):
+        now = time.perf_counter()
+        if not final and now - self.last < self.interval:
+            return
+        self.last = now
+        rate = read / max(now - self.start, 1e-9)
+        self.stream.write(f"\r{read:,} read  {accepted:,} valid  {read - accepted:,} rejected  {rate:,.0f}/s")
+        if final:
+            self.stream.write("\n")
+        self.stream.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import, validate and export question banks")
+    sub = parser.add_subparsers(dest="command", required=True)
+    check = sub.add_parser("validate", help="check a .jsonl or .csv bank")
+    check.add_argument("path")
+    conv = sub.add_parser("convert", help="validate src and write the valid questions to dst")
+    conv.add_argument("src")
+    conv.add_argument("dst")
+    for p in (check, conv):
+        p.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+        p.add_argument("--show-errors", type=int, default=20, help="print at most this many problems")
+    args = parser.parse_args(argv)
+
+    shown = []
+
+    def on_error(error):
+        if len(shown) < args.show_errors:
+            shown.append(error)
+            # \r and the padding overwrite a progress line already on screen
+            line = f"line {error.index}: {error.field or 'record'}: {error.message}"
+            sys.stderr.write(f"\r{line:<79}\n")
+
+    progress = _Progress()
+    if args.command == "validate":
+        read = accepted = 0
+
+        def count(r, a):
+            nonlocal read, accepted
+            read, accepted = r, a
+            progress(r, a)
+
+        for _ in iter_questions(args.path, batch_size=args.batch_size, on_error=on_error, progress=count):
+            pass
+        progress(read, accepted, final=True)
+        return 0 if read == accepted else 1
+
+    result = convert(args.src, args.dst, args.batch_size, on_error, progress)
+    progress(result["read"], result["written"], final=True)
+    print(f"Wrote {result['written']:,} questions to {args.dst}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""
+Batch validation for the question schema.
+
+A question is {"text": str, "options": {"a".."d": str}, "answer": "a".."d"}.
+
+    valid, errors = validate_questions(items)
+
+valid holds the normalized questions (whitespace stripped, answer lower
+case, numbers turned into strings) and errors one QuestionError per
+problem, with the item's index and the field:
+
+    QuestionError(index=3, field="options.c", message="empty")
+
+Batches are first checked column by column with map() and itemgetter(), so
+the loop runs in C. When every item is already valid and normalized (the
+usual case for an exported bank), the items are returned as they are, not
+copied. Otherwise the items that failed a column check go through
+_check(), which builds fresh dicts with only the schema fields and
+collects the errors. Batches are checked in chunks, so a few bad items in
+a large import only slow down their own chunks.
+"""
+
+import operator
+import itertools
+from collections import namedtuple
+
+
+QuestionError = namedtuple("QuestionError", "index field message")
+
+OPTION_KEYS = ("a", "b", "c", "d")
+
+# Items checked column-wise at a time
+CHUNK = 512
+
+_CHOICES = frozenset(OPTION_KEYS)
+_ANSWER_MESSAGE = "must be one of " + ", ".join(OPTION_KEYS)
+_OPTION_FIELDS = tuple((key, f"options.{key}") for key in OPTION_KEYS)
+
+_get_text = operator.itemgetter("text")
+_get_options = operator.itemgetter("options")
+_get_answer = operator.itemgetter("answer")
+_get_option = tuple(operator.itemgetter(key) for key in OPTION_KEYS)
+_strip = str.strip
+
+
+def _narrow(ok, mask):
+    """Combine a column's row mask with those of earlier failing columns."""
+    return mask if ok is None else map(operator.and_, ok, mask)
+
+
+def _text_column(values, ok):
+    """
+    Narrow ok to the rows holding non-empty text with nothing to strip.
+
+    strip() returns the string itself when there is nothing to strip; the
+    row mask is only built for a column that fails as a whole. A value that
+    is not a string raises TypeError.
+    """
+    if all(values) and list(map(_strip, values)) == values:
+        return ok
+    return _narrow(ok, map(operator.and_, map(operator.is_, map(_strip, values), values), map(bool, values)))
+
+
+def _fast(items):
+    """
+    Check a chunk column by column.
+
+    Returns:
+        True if every item is valid and normalized, else a per-row mask of
+        the ones that are; None if the chunk's shape rules this out
+
+    Raises:
+        TypeError, KeyError, AttributeError: On a missing key or a value of
+        the wrong type; the chunk then goes item by item
+    """
+    if set(map(len, items)) != {3}:
+        return None
+    ok = _text_column(list(map(_get_text, items)), None)
+    options = list(map(_get_options, items))
+    if set(map(len, options)) != {len(OPTION_KEYS)}:
+        return None
+    for get in _get_option:
+        ok = _text_column(list(map(get, options)), ok)
+    answers = list(map(_get_answer, items))
+    if not _CHOICES.issuperset(answers):
+        ok = _narrow(ok, map(_CHOICES.__contains__, answers))
+    return True if ok is None else list(ok)
+
+
+def _string(value, at, field, errors):
+    """value as a string (numbers are converted), or None, recording why."""
+    if value.__class__ is str:
+        return value
+    if value.__class__ in (int, float):
+        return str(value)
+    errors.append(QuestionError(at, field, "missing or not a string"))
+    return None
+
+
+def _text(value, at, field, errors):
+    """value as stripped, non-empty text, or None, recording why."""
+    value = _string(value, at, field, errors)
+    if value is None:
+        return None
+    value = value.strip()
+    if not value:
+        errors.append(QuestionError(at, field, "empty"))
+        return None
+    return value
+
+
+def _check(item, at, errors):
+    """A normalized copy of one question, or None if it is invalid (errors get why)."""
+    if item.__class__ is not dict:
+        errors.append(QuestionError(at, "", "not an object"))
+        return None
+    text = _text(item.get("text"), at, "text", errors)
+
+    options = item.get("options")
+    if options.__class__ is not dict:
+        errors.append(QuestionError(at, "options", "missing or not an object"))
+        options = None
+    else:
+        options = {key: _text(options.get(key), at, field, errors) for key, field in _OPTION_FIELDS}
+
+    answer = _string(item.get("answer"), at, "answer", errors)
+    if answer is not None:
+        answer = answer.strip().lower()
+        if answer not in _CHOICES:
+            errors.append(QuestionError(at, "answer", _ANSWER_MESSAGE))
+            answer = None
+
+    if text is None or options is None or answer is None or None in options.values():
+        return None
+    return {"text": text, "options": options, "answer": answer}
+
+
+def validate_questions(items, chunk=CHUNK):
+    """
+    Validate and normalize a batch of question dicts.
+
+    Args:
+        chunk (int): Items checked column-wise at a time
+
+    Returns:
+        tuple: (valid questions, list of QuestionError)
+    """
+    valid, errors = [], []
+    for start in range(0, len(items), chunk):
+        part = list(items[start:start + chunk])
+        try:
+            mask = _fast(part)
+        except (TypeError, KeyError, AttributeError):
+            mask = None
+        if mask is True:
+            valid += part
+            continue
+        if mask is None:
+            indices = range(len(part))
+        else:
+            # only the rows that failed a column check go item by item
+            indices = itertools.compress(range(len(part)), map(operator.not_, mask))
+        for index in indices:
+            part[index] = _check(part[index], start + index, errors)
+        valid += filter(None, part)
+    return valid, errors
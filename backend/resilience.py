@@ -0,0 +1,162 @@
+"""
+Hedged requests and circuit breakers for the question provider.
+
+The model endpoint has a long latency tail and, when it is down, every
+request waits for the full failure before the game falls back.
+
+Hedging: if a request has not answered after a delay (set it near the
+provider's p95, see the quizzify_llm_fetch_seconds histogram), the same
+request is sent again and whichever succeeds first is used. Only the slow
+5% pay for a second request, and they stop waiting on the slowest replies.
+The losing request cannot be cancelled mid-flight; it finishes in the
+background and its answer is dropped.
+
+Circuit breaker: after a number of failures in a row a provider's breaker
+opens and callers stop sending requests to it (allow() is False), so new
+games go straight to cached or fallback questions. After a cooldown one
+caller is let through as a probe (half open): if it succeeds the breaker
+closes, if it fails it opens for another cooldown.
+
+Usage:
+    breaker = resilience.breaker(url)
+    if not breaker.allow():
+        raise resilience.CircuitOpen(url)
+    try:
+        text = resilience.hedged(pool, 2.5, fetch, prompt)
+    except Exception:
+        breaker.failure()
+        raise
+    breaker.success()
+"""
+
+import time
+import threading
+import contextvars
+from concurrent.futures import wait, FIRST_COMPLETED
+
+from backend import config
+from backend import metrics
+from backend.logs import get_logger
+
+log = get_logger(__name__)
+
+_PRIMARY_WON = metrics.LLM_HEDGED_REQUESTS.labels("primary")
+_HEDGE_WON = metrics.LLM_HEDGED_REQUESTS.labels("hedge")
+_HEDGES_FAILED = metrics.LLM_HEDGED_REQUESTS.labels("failed")
+
+
+class CircuitOpen(Exception):
+    """Raised instead of calling a provider whose breaker is open."""
+
+
+def hedged(pool, delay, function, *args):
+    """
+    function(*args) on pool, called a second time if the first call has not
+    returned within delay seconds.
+
+    A call that fails before the delay is not hedged. Once hedged, the first
+    call to succeed wins; if both fail, the first error is raised.
+    """
+    first = pool.submit(contextvars.copy_context().run, function, *args)
+    if wait([first], timeout=delay).done:
+        return first.result()
+
+    second = pool.submit(contextvars.copy_context().run, function, *args)
+    pending = {first: _PRIMARY_WON, second: _HEDGE_WON}
+    errors = []
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in sorted(done, key=lambda f: f is second):
+            counter = pending.pop(future)
+            if future.exception() is None:
+                counter.inc()
+                return future.result()
+            errors.append(future.exception())
+    _HEDGES_FAILED.inc()
+    raise errors[0]
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure breaker for one provider. Thread-safe.
+
+    failures=0 turns it off: allow() is always True.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, name, failures=5, cooldown=30.0, clock=time.monotonic):
+        self.name = name
+        self.failures = failures
+        self.cooldown = cooldown
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failed = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self):
+        return self._state
+
+    def allow(self):
+        """
+        Whether a request may be sent now.
+
+        After the cooldown the first caller gets True and becomes the probe;
+        others get False until it reports success() or failure().
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.cooldown:
+                self._move(self.HALF_OPEN)
+                return True
+            return False
+
+    def success(self):
+        with self._lock:
+            self._failed = 0
+            if self._state != self.CLOSED:
+                self._move(self.CLOSED)
+
+    def failure(self):
+        with self._lock:
+            self._failed += 1
+            if self._state == self.HALF_OPEN or (
+                    self._state == self.CLOSED and self.failures and self._failed >= self.failures):
+                self._opened_at = self._clock()
+                self._move(self.OPEN)
+
+    def _move(self, state):
+        self._state = state
+        metrics.CIRCUIT_TRANSITIONS.labels(state).inc()
+        log.warning("Provider circuit changed state", extra={"provider": self.name, "state": state, "failures": self._failed})
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def breaker(provider):
+    """
+    The breaker of a provider (e.g. its URL), configured by
+    HF_API_BREAKER_FAILURES and HF_API_BREAKER_COOLDOWN.
+
+    Returns:
+        CircuitBreaker: One per provider per process; replaced if the settings change
+    """
+    failures, cooldown = config.hf_breaker_failures(), config.hf_breaker_cooldown()
+    b = _breakers.get(provider)
+    if b is None or b.failures != failures or b.cooldown != cooldown:
+        with _breakers_lock:
+            b = _breakers.get(provider)
+            if b is None or b.failures != failures or b.cooldown != cooldown:
+                b = _breakers[provider] = CircuitBreaker(provider, failures, cooldown)
+    return b
+
+
+def reset():
+    """Forget every breaker (all providers start closed again)."""
+    with _breakers_lock:
+        _breakers.clear()
@@ -0,0 +1,253 @@
+"""
+Full-text search over a question bank, for on-topic games without the model.
+
+An inverted index maps each term of the question text, options and topic
+to the questions containing it. Queries are ranked with BM25, so a topic
+like "Roman history" finds the questions that mention its rarer terms
+most, without scanning the bank.
+
+The index is a file next to the bank (questions.qbank.idx), mapped with
+mmap like the bank itself:
+
+    header     magic, version, question count, average length and section offsets
+    lengths    uint16 per question: its number of terms
+    postings   per term, uint32 question numbers followed by uint16 term counts
+    vocabulary JSON {term: [offset into postings, question count]}
+
+A query reads only the postings of its own terms.
+
+Usage:
+    python -m backend.search_index build questions.qbank
+    python -m backend.search_index search questions.qbank "roman history"
+"""
+
+import re
+import sys
+import math
+import json
+import mmap
+import array
+import heapq
+import struct
+import argparse
+import operator
+import threading
+
+from backend import config
+from backend.question_schema import OPTION_KEYS
+
+
+MAGIC = b"QZINDEX\n"
+VERSION = 1
+
+# magic, version, questions, average length, lengths_at, postings_at, vocabulary_at
+_HEADER = struct.Struct("<8sIIdQQQ")
+
+# BM25 term frequency saturation and length normalization
+K1 = 1.2
+B = 0.75
+
+_WORD = re.compile(r"[^\W_]+")
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have how in is it its of on or that the this to was were what
+when where which who whom why will with
+""".split())
+
+
+def tokenize(text):
+    """Lower-case word terms without stopwords; a trailing plural "s" is dropped."""
+    terms = []
+    for word in _WORD.findall(text.lower()):
+        if word in STOPWORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        terms.append(word)
+    return terms
+
+
+def _document(question):
+    options = question.get("options") or {}
+    parts = [question.get("text") or "", question.get("topic") or ""]
+    parts += [str(options.get(key) or "") for key in OPTION_KEYS]
+    return " ".join(parts)
+
+
+def index_path(bank_path):
+    return bank_path + ".idx"
+
+
+def build(bank, path):
+    """
+    Index every question of a QuestionBank into path.
+
+    Returns:
+        int: Distinct terms indexed
+    """
+    lengths = array.array("H")
+    postings = {}
+    for number in range(len(bank)):
+        terms = tokenize(_document(bank[number]))
+        lengths.append(min(len(terms), 0xFFFF))
+        counts = {}
+        for term in terms:
+            counts[term] = counts.get(term, 0) + 1
+        for term, count in counts.items():
+            entry = postings.get(term)
+            if entry is None:
+                entry = postings[term] = (array.array("I"), array.array("H"))
+            entry[0].append(number)
+            entry[1].append(min(count, 0xFFFF))
+
+    average = sum(lengths) / len(lengths) if lengths else 0.0
+    little = sys.byteorder == "little"
+    with open(path, "wb") as f:
+        f.write(b"\0" * _HEADER.size)
+        lengths_at = f.tell()
+        if not little:
+            lengths.byteswap()
+        lengths.tofile(f)
+
+        postings_at = f.tell()
+        vocabulary = {}
+        for term, (numbers, counts) in postings.items():
+            vocabulary[term] = [f.tell() - postings_at, len(numbers)]
+            if not little:
+                numbers.byteswap()
+                counts.byteswap()
+            numbers.tofile(f)
+            counts.tofile(f)
+
+        vocabulary_at = f.tell()
+        f.write(json.dumps(vocabulary, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, VERSION, len(lengths), average, lengths_at, postings_at, vocabulary_at))
+    return len(vocabulary)
+
+
+class SearchIndex:
+    """BM25 search over one bank's index file."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, average, lengths_at, postings_at, vocabulary_at = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {VERSION} search index")
+        self._count = count
+        self._postings_at = postings_at
+        self._vocabulary = json.loads(self._map[vocabulary_at:])
+
+        # The length part of the BM25 denominator, per question
+        lengths = self._array("H", lengths_at, count)
+        scale = K1 * B / average if average else 0.0
+        self._norms = [K1 * (1 - B) + scale * n for n in lengths]
+
+    def _array(self, typecode, at, count):
+        values = array.array(typecode)
+        values.frombytes(self._map[at:at + values.itemsize * count])
+        if sys.byteorder != "little":
+            values.byteswap()
+        return values
+
+    def __len__(self):
+        return self._count
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def search(self, query, limit=10):
+        """
+        Rank questions against a query.
+
+        Terms in more than half of the bank add almost nothing to a BM25
+        score but cost a pass over most of it, so they are only used when
+        no rarer query term matches.
+
+        Returns:
+            list: (question number, score) pairs, best first; only questions
+                  sharing at least one term with the query
+        """
+        scores = {}
+        get = scores.get
+        norms = self._norms
+        entries = sorted(filter(None, map(self._vocabulary.get, set(tokenize(query)))), key=operator.itemgetter(1))
+        for at, df in entries:
+            if scores and 2 * df > self._count:
+                break
+            idf = math.log(1 + (self._count - df + 0.5) / (df + 0.5))
+            weight = idf * (K1 + 1)
+            numbers = self._array("I", self._postings_at + at, df)
+            counts = self._array("H", self._postings_at + at + 4 * df, df)
+            for number, tf in zip(numbers, counts):
+                scores[number] = get(number, 0.0) + weight * tf / (tf + norms[number])
+        return heapq.nlargest(limit, scores.items(), key=operator.itemgetter(1))
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_index():
+    """
+    The index of the QUIZZIFY_QUESTION_BANK bank, opened once per process.
+
+    Returns:
+        SearchIndex or None: None when no bank is configured or it has no index
+    """
+    global _default
+    bank_path = config.question_bank_file()
+    if not bank_path:
+        return None
+    path = index_path(bank_path)
+    index = _default
+    if index is None or index.path != path:
+        with _default_lock:
+            if _default is None or _default.path != path:
+                try:
+                    index = SearchIndex(path)
+                except FileNotFoundError:
+                    return None
+                previous, _default = _default, index
+                if previous is not None:
+                    previous.close()
+            index = _default
+    return index
+
+
+def main(argv=None):
+    from backend.question_bank import QuestionBank
+
+    parser = argparse.ArgumentParser(description="Build and query the search index of a question bank")
+    sub = parser.add_subparsers(dest="command", required=True)
+    make = sub.add_parser("build", help="index a bank (written to BANK.idx)")
+    make.add_argument("bank")
+    find = sub.add_parser("search", help="print the best questions for a query")
+    find.add_argument("bank")
+    find.add_argument("query")
+    find.add_argument("--limit", type=int, default=12)
+    args = parser.parse_args(argv)
+
+    with QuestionBank(args.bank) as bank:
+        if args.command == "build":
+            terms = build(bank, index_path(args.bank))
+            print(f"Indexed {len(bank):,} questions, {terms:,} terms, into {index_path(args.bank)}")
+            return 0
+        with SearchIndex(index_path(args.bank)) as index:
+            for number, score in index.search(args.query, args.limit):
+                print(f"{score:6.2f}  {bank[number]['text']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+"""
+Question sets cached by topic meaning rather than by exact string.
+
+"Python programming", "programming in Python" and "python programing" are
+one topic to a player, so a game generated for one is reused for the
+others instead of going back to the model.
+
+Topics are turned into hashed n-gram vectors: each word (after the search
+tokenizer drops stopwords and plural "s") and each character trigram of it
+is hashed into one of DIM signed buckets, and the vector is scaled to unit
+length. Word order, case, filler words and small typos barely move the
+vector; different subjects share almost no buckets. Similarity is the
+cosine, i.e. a dot product.
+
+The vectors of all cached topics sit in one matrix stored column by column
+(one array per bucket). A lookup only touches the columns of the query's
+non-zero buckets and adds them up with map(), so scoring every cached
+topic runs in C.
+
+Cached sets are stored as compressed JSON (compression.py, with a
+dictionary built from the built-in questions) and only decompressed for a
+hit, so a large cache costs about a kilobyte per topic.
+
+Hashed n-grams catch spelling and word-order variants, not synonyms
+("python coding" is not matched to "python programming"). For that, pass
+TopicCache an embed= function mapping a topic to a unit {bucket: value}
+vector over DIM buckets, e.g. from a small local embedding model.
+"""
+
+import zlib
+import json
+import array
+import heapq
+import operator
+import itertools
+import functools
+import threading
+from collections import OrderedDict
+
+from backend import config
+from backend import compression
+from backend.search_index import tokenize
+
+
+DIM = 512
+
+
+def _bucket(feature):
+    """Bucket and sign for a feature; crc32 is stable across processes, unlike hash()."""
+    h = zlib.crc32(feature.encode("utf-8"))
+    return h % DIM, 1.0 if h & 0x80000000 else -1.0
+
+
+def embed(topic):
+    """
+    Hashed n-gram vector of a topic.
+
+    Returns:
+        dict: {bucket: value} with unit length; empty for a topic without words
+    """
+    vector = {}
+    for word in tokenize(topic):
+        padded = f" {word} "
+        features = [f"w:{word}"] + [padded[i:i + 3] for i in range(len(padded) - 2)]
+        for feature in features:
+            bucket, sign = _bucket(feature)
+            vector[bucket] = vector.get(bucket, 0.0) + sign
+    norm = sum(v * v for v in vector.values()) ** 0.5
+    return {bucket: v / norm for bucket, v in vector.items() if v} if norm else {}
+
+
+@functools.lru_cache(maxsize=1)
+def question_codec():
+    """Codec with a dictionary of the built-in questions, shared by every cache."""
+    # imported here: llm_questions imports this module
+    from backend.llm_questions import get_fallback_questions
+    samples = [json.dumps(q, separators=(",", ":")).encode("utf-8")
+               for q in json.loads(get_fallback_questions())["questions"]]
+    return compression.Codec(None, compression.train_dictionary(samples))
+
+
+class TopicCache:
+    """
+    At most capacity question sets, least recently used evicted first.
+
+    get() returns the set cached for the most similar topic if its cosine
+    similarity is at least threshold. Thread-safe.
+    """
+
+    def __init__(self, capacity=256, threshold=0.8, embed=embed, codec=None):
+        self.capacity = capacity
+        self.threshold = threshold
+        self.embed = embed
+        self.codec = codec or question_codec()
+        self._lock = threading.Lock()
+        # topic -> slot, oldest first
+        self._slots = OrderedDict()
+        self._entries = [None] * capacity
+        self._vectors = [None] * capacity
+        self._columns = [array.array("f", bytes(4 * capacity)) for _ in range(DIM)]
+
+    def __len__(self):
+        return len(self._slots)
+
+    def stored_bytes(self):
+        """Compressed size of the cached question sets."""
+        with self._lock:
+            return sum(len(self._entries[slot][1]) for slot in self._slots.values())
+
+    def _key(self, topic):
+        return " ".join(topic.lower().split())
+
+    def nearest(self, topic, k=1):
+        """
+        The k cached topics most similar to topic.
+
+        Returns:
+            list: (similarity, cached topic) pairs, best first
+        """
+        vector = self.embed(topic)
+        with self._lock:
+            if not vector or not self._slots:
+                return []
+            scores = None
+            for bucket, value in vector.items():
+                column = map(operator.mul, self._columns[bucket], itertools.repeat(value))
+                scores = list(column) if scores is None else list(map(operator.add, scores, column))
+            best = heapq.nlargest(k, self._slots.values(), key=scores.__getitem__)
+            return [(scores[slot], self._entries[slot][0]) for slot in best]
+
+    def get(self, topic):
+        """
+        Returns:
+            tuple: (questions, matched topic, similarity), or None on a miss
+        """
+        hit = self._take(self._key(topic), 1.0)
+        if hit is None:
+            for similarity, match in self.nearest(topic):
+                if similarity < self.threshold:
+                    break
+                hit = self._take(match, similarity)
+                if hit is not None:
+                    break
+        if hit is None:
+            return None
+        blob, match, similarity = hit
+        # decompressed outside the lock
+        return json.loads(self.codec.decompress(blob)), match, similarity
+
+    def _take(self, key, similarity):
+        """Mark key used; (compressed set, key, similarity) or None if it is not cached."""
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is None:
+                return None
+            self._slots.move_to_end(key)
+            return self._entries[slot][1], key, similarity
+
+    def put(self, topic, questions):
+        """Cache questions for topic, replacing any set cached for the same topic string."""
+        key = self._key(topic)
+        vector = self.embed(topic)
+        if not vector or not self.capacity:
+            return
+        blob = self.codec.compress(json.dumps(list(questions), separators=(",", ":")).encode("utf-8"))
+        with self._lock:
+            slot = self._slots.pop(key, None)
+            if slot is None:
+                if len(self._slots) < self.capacity:
+                    slot = len(self._slots)
+                else:
+                    _, slot = self._slots.popitem(last=False)
+            self._set_vector(slot, vector)
+            self._entries[slot] = (key, blob)
+            self._slots[key] = slot
+
+    def _set_vector(self, slot, vector):
+        old = self._vectors[slot]
+        if old:
+            for bucket in old:
+                self._columns[bucket][slot] = 0.0
+        for bucket, value in vector.items():
+            self._columns[bucket][slot] = value
+        self._vectors[slot] = vector
+
+    def clear(self):
+        with self._lock:
+            for slot in self._slots.values():
+                self._set_vector(slot, {})
+            self._slots.clear()
+            self._entries = [None] * self.capacity
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_cache():
+    """
+    The process-wide cache sized by QUIZZIFY_TOPIC_CACHE_SIZE.
+
+    Returns:
+        TopicCache or None: None when the cache is off (size 0, the default)
+    """
+    global _default
+    size, threshold = config.topic_cache_size(), config.topic_similarity()
+    if size <= 0:
+        return None
+    cache = _default
+    if cache is None or cache.capacity != size or cache.threshold != threshold:
+        with _default_lock:
+            if _default is None or _default.capacity != size or _default.threshold != threshold:
+                _default = TopicCache(size, threshold)
+            cache = _default
+    return cache
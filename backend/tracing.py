@@ -0,0 +1,158 @@
+"""
+Lightweight tracing spans for the question pipeline.
+
+A span times one step and records its parent, so a slow game start can be
+broken down into fetch, parse, validate and fallback time. The current span
+lives in a context variable: nested spans pick up the trace id and parent
+without passing anything around.
+
+    with tracing.span("llm.fetch", topic=topic) as s:
+        response = requests.post(...)
+        s.set(status=response.status_code)
+
+Tracing is off unless QUIZZIFY_TRACE_FILE names an output file (or
+configure() is called); a disabled span() is a single function call.
+
+Output is the Chrome trace event format with one complete ("X") event per
+line, inside an array that is left open:
+
+    [
+    {"name": "game.start", "ph": "X", "ts": ..., "dur": ..., ...},
+    {"name": "llm.fetch", ...},
+
+chrome://tracing, Perfetto and speedscope load this as is (the format allows
+the missing "]"), and it can still be appended to and read line by line.
+"""
+
+import os
+import json
+import time
+import itertools
+import threading
+import contextvars
+
+
+_current = contextvars.ContextVar("quizzify_span", default=None)
+_span_ids = itertools.count(1)
+
+_lock = threading.Lock()
+_path = None
+
+
+class Span:
+    """One timed step. Use through span(), not directly."""
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "attrs", "start_us", "_t0", "_token")
+
+    def __init__(self, name, parent, attrs):
+        self.name = name
+        self.span_id = next(_span_ids)
+        if parent is None:
+            self.trace_id = os.urandom(8).hex()
+            self.parent_id = None
+        else:
+            self.trace_id = parent.trace_id
+            self.parent_id = parent.span_id
+        self.attrs = attrs
+
+    def set(self, **attrs):
+        """Add attributes (status codes, counts, ...) to the span."""
+        self.attrs.update(attrs)
+
+    def __enter__(self):
+        self.start_us = time.time_ns() // 1000
+        self._t0 = time.perf_counter_ns()
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        dur_us = (time.perf_counter_ns() - self._t0) // 1000
+        _current.reset(self._token)
+        if exc_type is not None:
+            self.attrs["error"] = f"{exc_type.__name__}: {exc}"
+        _export(self, dur_us)
+        return False
+
+
+class _NoSpan:
+    """Returned by span() while tracing is off."""
+
+    trace_id = None
+
+    def set(self, **attrs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name, **attrs):
+    """Context manager timing one step as a child of the current span."""
+    if _path is None:
+        return _NO_SPAN
+    return Span(name, _current.get(), attrs)
+
+
+def current_trace_id():
+    """Trace id of the span being executed, or None."""
+    current = _current.get()
+    return current.trace_id if current is not None else None
+
+
+def _export(span, dur_us):
+    args = {"trace_id": span.trace_id, "span_id": span.span_id}
+    if span.parent_id is not None:
+        args["parent_id"] = span.parent_id
+    args.update(span.attrs)
+    event = {
+        "name": span.name,
+        "cat": span.name.split(".")[0],
+        "ph": "X",
+        "ts": span.start_us,
+        "dur": dur_us,
+        "pid": os.getpid(),
+        "tid": threading.get_ident(),
+        "args": args,
+    }
+    line = json.dumps(event, default=str) + ",\n"
+    with _lock:
+        path = _path
+        if path is None:
+            return
+        new = not os.path.exists(path) or os.path.getsize(path) == 0
+        with open(path, "a", encoding="utf-8") as f:
+            if new:
+                f.write("[\n")
+            f.write(line)
+
+
+def configure(path):
+    """Write spans to path (None turns tracing off)."""
+    global _path
+    with _lock:
+        _path = path
+
+
+def read_trace(path):
+    """
+    Read a trace file back.
+
+    Returns:
+        list: Event dicts in the order they finished
+    """
+    events = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip().rstrip(",")
+            if line and line not in ("[", "]"):
+                events.append(json.loads(line))
+    return events
+
+
+configure(os.environ.get("QUIZZIFY_TRACE_FILE") or None)
@@ -0,0 +1,116 @@
+"""
+Baseline storage and regression checks shared by the benchmark suites.
+"""
+
+import json
+import os
+import platform
+
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+# Allowed relative slowdown before a result counts as a regression
+DEFAULT_THRESHOLD = 0.15
+
+
+def baseline_path(name):
+    """Return the path of the baseline file for a suite."""
+    return os.path.join(BASELINE_DIR, f"{name}.json")
+
+
+def load_baseline(name):
+    """
+    Load a stored baseline.
+
+    Returns:
+        dict: {"machine": {...}, "results": {case: {metric: value}}}
+        None: If no baseline has been recorded yet
+    """
+    path = baseline_path(name)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(name, results):
+    """Store results as the new baseline for a suite."""
+    os.makedirs(BASELINE_DIR, exist_ok=True)
+    data = {
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    with open(baseline_path(name), "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare(results, baseline, metrics, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare results against a baseline.
+
+    Args:
+        results (dict): {case: {metric: value}} from the current run
+        baseline (dict): Stored baseline as returned by load_baseline()
+        metrics (dict): {metric: "higher" | "lower"}, the better direction
+        threshold (float): Allowed relative change in the worse direction
+
+    Returns:
+        list: Regression messages (empty if everything is within threshold)
+    """
+    regressions = []
+    if not baseline:
+        return regressions
+
+    for case, values in results.items():
+        base_values = baseline["results"].get(case)
+        if not base_values:
+            continue
+        for metric, better in metrics.items():
+            old = base_values.get(metric)
+            new = values.get(metric)
+            if old is None or new is None or old == 0:
+                continue
+            change = (new - old) / old
+            worse = -change if better == "higher" else change
+            if worse > threshold:
+                regressions.append(
+                    f"{case}.{metric}: {old:.2f} -> {new:.2f} ({worse * 100:+.1f}% worse)"
+                )
+    return regressions
+
+
+def report(name, results, metrics, threshold=DEFAULT_THRESHOLD, update=False):
+    """
+    Print a results table, check it against the stored baseline and
+    optionally record it as the new baseline.
+
+    Returns:
+        bool: True if no regression was found
+    """
+    metric_names = list(metrics)
+    print(f"\n{name}".ljust(30) + "".join(m.rjust(22) for m in metric_names))
+    print("-" * (30 + 22 * len(metric_names)))
+    for case, values in results.items():
+        print(case.ljust(30) + "".join(f"{values.get(m, 0):22.2f}" for m in metric_names))
+
+    baseline = load_baseline(name)
+    regressions = compare(results, baseline, metrics, threshold)
+
+    if update:
+        save_baseline(name, results)
+        print(f"\nBaseline updated: {baseline_path(name)}")
+    elif baseline is None:
+        print("\nNo baseline yet. Run with --update-baseline to record one.")
+
+    if regressions:
+        print(f"\nREGRESSIONS (threshold {threshold * 100:.0f}%):")
+        for line in regressions:
+            print(f"  {line}")
+        return False
+
+    print("\nNo regressions.")
+    return True
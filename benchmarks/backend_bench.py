@@ -0,0 +1,391 @@
+"""
+Micro-benchmarks for the quiz engine and the question pipeline.
+
+Nothing here touches the network: the Hugging Face call is replaced by a
+stub that answers instantly with canned model output, and the parser runs
+over a corpus of realistic and malformed outputs in
+benchmarks/corpus/llm_outputs.jsonl.
+
+Usage:
+    python -m benchmarks.backend_bench
+    python -m benchmarks.backend_bench --update-baseline
+    python -m benchmarks.backend_bench --build-corpus   # regenerate the corpus
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import contextlib
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks._baseline import report, DEFAULT_THRESHOLD
+from backend import compression
+from backend import llm_questions
+from backend import question_bank
+from backend import search_index
+from backend.game_engine import QuizGame
+from backend.llm_questions import parse_fallback_questions, parse_questions_output
+from backend.question_schema import validate_questions
+from backend.topic_cache import TopicCache
+
+
+SUITE_NAME = "backend"
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus", "llm_outputs.jsonl")
+
+METRICS = {
+    "ops_per_sec": "higher",
+    # parse cases only: share of documents that yield their own questions
+    "accepted_pct": "higher",
+    # compression cases only
+    "mb_per_sec": "higher",
+    "saved_pct": "higher",
+}
+
+
+# ============================================
+#      CORPUS
+# ============================================
+
+# What the model sees; instruction-tuned models often echo it back
+PROMPT_ECHO = """
+Generate exactly 12 multiple-choice quiz questions about: {topic}
+
+Return ONLY a JSON array of questions, for example:
+
+[
+  {{
+    "text": "Question text?",
+    "options": {{"a": "Option A", "b": "Option B", "c": "Option C", "d": "Option D"}},
+    "answer": "a"
+  }},
+  ...
+]
+"""
+
+TOPICS = ["General Knowledge", "Python Programming", "World History", "Astronomy", "Football"]
+
+
+def _questions(rng, count=12, long_text=False):
+    """Shuffled fallback questions with shuffled options (answer kept right)."""
+    base = parse_fallback_questions()
+    rng.shuffle(base)
+    questions = []
+    for i in range(count):
+        q = base[i % len(base)]
+        keys = list("abcd")
+        values = [q["options"][k] for k in keys]
+        correct = q["options"][q["answer"]]
+        rng.shuffle(values)
+        text = q["text"]
+        if long_text:
+            text = "In the context of the topic discussed earlier and considering common knowledge, " + text
+        questions.append({
+            "text": text,
+            "options": dict(zip(keys, values)),
+            "answer": keys[values.index(correct)],
+        })
+    return questions
+
+
+def build_corpus(seed=7):
+    """
+    Generate the corpus entries.
+
+    Returns:
+        list: [{"name": str, "kind": "valid" | "malformed", "generated_text": str}]
+    """
+    rng = random.Random(seed)
+    entries = []
+
+    def add(name, kind, text):
+        entries.append({"name": name, "kind": kind, "generated_text": text})
+
+    for n, topic in enumerate(TOPICS):
+        qs = _questions(rng)
+        array = json.dumps(qs, indent=2)
+        add(f"clean_{n}", "valid", array)
+        add(f"compact_{n}", "valid", json.dumps(qs, separators=(",", ":")))
+        add(f"prose_{n}", "valid", f"Sure! Here are 12 questions about {topic}:\n\n{array}\n\nGood luck!")
+        add(f"fenced_{n}", "valid", f"```json\n{array}\n```")
+        add(f"long_{n}", "valid", json.dumps(_questions(rng, long_text=True), indent=2))
+
+        # Echoed prompt: the example array comes first
+        add(f"prompt_echo_{n}", "malformed", PROMPT_ECHO.format(topic=topic) + "\n" + array)
+        # Cut off by the token limit
+        add(f"truncated_{n}", "malformed", array[: int(len(array) * rng.uniform(0.5, 0.95))])
+        # Trailing commas and single quotes
+        add(f"trailing_comma_{n}", "malformed", array.replace('"\n  }', '",\n  }').replace("}\n]", "},\n]"))
+        add(f"single_quotes_{n}", "malformed", array.replace('"', "'"))
+        # Brackets in the surrounding prose, keys left unquoted
+        add(f"stray_bracket_{n}", "malformed",
+            f"Here are [12] questions about {topic}:\n{array}\nWant more? Reply [yes] or [no].")
+        add(f"unquoted_keys_{n}", "malformed",
+            array.replace('"text":', "text:").replace('"options":', "options:").replace('"answer":', "answer:"))
+        # Schema problems: uppercase / padded answers, a missing option, 11 questions
+        sloppy = _questions(rng)
+        for q in sloppy:
+            q["answer"] = f" {q['answer'].upper()} "
+        add(f"sloppy_answers_{n}", "valid", json.dumps(sloppy, indent=2))
+        missing = _questions(rng)
+        del missing[rng.randrange(12)]["options"]["d"]
+        add(f"missing_option_{n}", "malformed", json.dumps(missing, indent=2))
+        add(f"eleven_{n}", "malformed", json.dumps(_questions(rng, count=11), indent=2))
+
+    return entries
+
+
+def write_corpus(path=CORPUS_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        for entry in build_corpus():
+            f.write(json.dumps(entry) + "\n")
+
+
+def load_corpus(path=CORPUS_PATH):
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+# ============================================
+#      CASES
+# ============================================
+
+class StubResponse:
+    """Just enough of requests.Response for get_questions_from_huggingface()."""
+
+    status_code = 200
+
+    def __init__(self, generated_text):
+        self._json = [{"generated_text": generated_text}]
+        self.text = json.dumps(self._json)
+
+    def json(self):
+        return self._json
+
+
+@contextlib.contextmanager
+def stubbed_provider(generated_text, latency=None):
+    """
+    Answer every Hugging Face request with generated_text.
+
+    Args:
+        latency (callable): Optional; returns the seconds each request
+                            sleeps before answering (default: instant)
+    """
+    response = StubResponse(generated_text)
+
+    # a plain function, not a Mock: Mocks keep every call's arguments
+    def post(*args, **kwargs):
+        if latency is not None:
+            time.sleep(latency())
+        return response
+
+    with mock.patch.dict(os.environ, {"HUGGINGFACE_API_TOKEN": "benchmark"}), \
+            mock.patch.object(llm_questions, "_env_loaded", True), \
+            mock.patch("requests.post", new=post):
+        yield
+
+
+def timed(op, ops, repeats=5):
+    """
+    Run op() ops times per batch.
+
+    Returns:
+        dict: {"ops_per_sec": float, "us_per_op": float} from the fastest batch
+    """
+    batch = max(1, ops // repeats)
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(batch):
+            op()
+        took = time.perf_counter() - start
+        best = took if best is None else min(best, took)
+    return {"ops_per_sec": batch / best, "us_per_op": best * 1e6 / batch}
+
+
+def bench_engine(ops):
+    game = QuizGame()
+    game.questions = parse_fallback_questions()
+    game.game_started = True
+    answers = [q["answer"] for q in game.questions]
+
+    def submit():
+        if game.game_over:
+            game.score, game.current_index, game.game_over = 0, 0, False
+        game.submit_answer(answers[game.current_index])
+
+    return {
+        "submit_answer": timed(submit, ops),
+        "get_progress": timed(game.get_progress, ops),
+    }
+
+
+def bench_start_new_game(ops, corpus):
+    text = next(e["generated_text"] for e in corpus if e["kind"] == "valid")
+    game = QuizGame()
+    with stubbed_provider(text):
+        result = timed(lambda: game.start_new_game("Benchmarks"), ops)
+    return {"start_new_game": result}
+
+
+def bench_parse(ops, corpus):
+    results = {}
+    for kind in ("valid", "malformed"):
+        texts = [e["generated_text"] for e in corpus if e["kind"] == kind]
+        fallback = parse_fallback_questions()
+        accepted = sum(parse_questions_output(t) != fallback for t in texts)
+
+        def parse_all():
+            for t in texts:
+                parse_questions_output(t)
+
+        result = timed(parse_all, max(5, ops // len(texts)))
+        # report per document, not per pass over the corpus
+        result["ops_per_sec"] *= len(texts)
+        result["us_per_op"] /= len(texts)
+        result["accepted_pct"] = accepted * 100 / len(texts)
+        results[f"parse_{kind}"] = result
+    return results
+
+
+def bench_validate(ops, corpus, seed=7):
+    """Bulk validation of a question bank built from the corpus; about 5% of it needs fixing or is invalid."""
+    rng = random.Random(seed)
+    pool = [q for e in corpus if e["name"].startswith("clean_") for q in json.loads(e["generated_text"])]
+    bank = []
+    for i in range(ops):
+        q = pool[i % len(pool)]
+        q = {"text": q["text"], "options": dict(q["options"]), "answer": q["answer"]}
+        roll = rng.random()
+        if roll < 0.03:
+            q["answer"] = f" {q['answer'].upper()}"
+        elif roll < 0.05:
+            q["options"]["c"] = ""
+        bank.append(q)
+
+    result = timed(lambda: validate_questions(bank), 5)
+    # report per question
+    result["ops_per_sec"] *= len(bank)
+    result["us_per_op"] /= len(bank)
+    return {"validate_bulk": result}
+
+
+def bench_bank(ops, corpus):
+    """Drawing a game from an mmap bank of ops questions built from the corpus, and searching it by topic."""
+    pool = [q for e in corpus if e["name"].startswith("clean_") for q in json.loads(e["generated_text"])]
+    bank_questions = (dict(pool[i % len(pool)], text=f"{pool[i % len(pool)]['text']} #{i}",
+                           topic=TOPICS[i % len(TOPICS)], tier=question_bank.TIERS[i % 3])
+                      for i in range(ops))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.qbank")
+        question_bank.build(bank_questions, path)
+        with question_bank.QuestionBank(path) as bank:
+            search_index.build(bank, search_index.index_path(path))
+            with search_index.SearchIndex(search_index.index_path(path)) as index:
+                queries = iter(TOPICS * 2000)
+                return {
+                    "bank_open": timed(lambda: question_bank.QuestionBank(path).close(), 2000),
+                    "bank_draw": timed(lambda: bank.draw(12), 2000),
+                    "bank_search": timed(lambda: index.search(next(queries), 24), 500),
+                }
+
+
+def bench_topic_cache(ops, size=4096, seed=7):
+    """Similarity lookups in a full topic cache; half the queries are near variants of a cached topic."""
+    rng = random.Random(seed)
+    words = sorted({w for t in TOPICS for w in t.lower().split()} | {
+        "ancient", "modern", "european", "asian", "music", "film", "chemistry", "physics",
+        "biology", "geography", "literature", "art", "math", "economics", "sport", "science"})
+    cache = TopicCache(capacity=size)
+    topics = [" ".join(rng.sample(words, 3)) + f" {i}" for i in range(size)]
+    for topic in topics:
+        cache.put(topic, [])
+    queries = iter([rng.choice(topics).upper() if i % 2 else f"{rng.choice(words)} quiz"
+                    for i in range(ops)] * 5)
+    return {"topic_cache_lookup": timed(lambda: cache.get(next(queries)), ops)}
+
+
+def _synthetic_questions(rng, count):
+    """Questions with made-up words, so records share structure but not text (unlike the corpus)."""
+    syllables = ["ka", "to", "ri", "mo", "sen", "lar", "pu", "ex", "ion", "tra", "ver", "di", "na", "que", "sto"]
+    vocabulary = ["".join(rng.choice(syllables) for _ in range(rng.randint(1, 4))) for _ in range(3000)]
+    common = "what which who is the of in was how many year first largest capital".split()
+    for i in range(count):
+        words = rng.sample(common, 3) + rng.sample(vocabulary, 5)
+        rng.shuffle(words)
+        yield {
+            "text": " ".join(words).capitalize() + "?",
+            "options": {k: " ".join(rng.sample(vocabulary, rng.randint(1, 2))).title() for k in "abcd"},
+            "answer": rng.choice("abcd"),
+            "topic": TOPICS[i % len(TOPICS)],
+            "tier": question_bank.TIERS[i % 3],
+        }
+
+
+def bench_compression(ops, seed=7):
+    """
+    Per-record compression of question records with a dictionary trained on
+    other records, for each available codec.
+    """
+    rng = random.Random(seed)
+    records = [json.dumps(q, separators=(",", ":")).encode("utf-8")
+               for q in _synthetic_questions(rng, compression.TRAINING_SAMPLES + ops)]
+    training, records = records[:compression.TRAINING_SAMPLES], records[compression.TRAINING_SAMPLES:]
+    raw = sum(map(len, records))
+    codecs = ["zlib"] + (["zstd"] if compression.zstandard is not None else [])
+    results = {}
+    for name in codecs:
+        codec = compression.Codec(name, compression.train_dictionary(training, name))
+        blobs = [codec.compress(r) for r in records]
+        saved = 100 - 100 * sum(map(len, blobs)) / raw
+        for case, op, data in (("compress", codec.compress, records), ("decompress", codec.decompress, blobs)):
+            result = timed(lambda: list(map(op, data)), 5)
+            # report per record, plus throughput of uncompressed bytes
+            result["mb_per_sec"] = raw * result["ops_per_sec"] / 1e6
+            result["ops_per_sec"] *= len(data)
+            result["us_per_op"] /= len(data)
+            result["saved_pct"] = saved
+            results[f"{case}_{name}"] = result
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Backend micro-benchmarks")
+    parser.add_argument("--ops", type=int, default=200000, help="operations per engine case")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed relative regression (default 0.15)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="store this run as the new baseline")
+    parser.add_argument("--build-corpus", action="store_true",
+                        help=f"regenerate {os.path.relpath(CORPUS_PATH)}")
+    args = parser.parse_args(argv)
+
+    if args.build_corpus:
+        write_corpus()
+        print(f"Wrote {CORPUS_PATH}")
+        return 0
+
+    corpus = load_corpus()
+    results = {}
+    results.update(bench_engine(args.ops))
+    results.update(bench_start_new_game(args.ops // 20, corpus))
+    results.update(bench_parse(args.ops // 20, corpus))
+    results.update(bench_validate(args.ops // 2, corpus))
+    results.update(bench_bank(args.ops // 2, corpus))
+    results.update(bench_topic_cache(args.ops // 100))
+    results.update(bench_compression(args.ops // 20))
+
+    ok = report(SUITE_NAME, results, METRICS, args.threshold, args.update_baseline)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
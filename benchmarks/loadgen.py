@@ -0,0 +1,219 @@
+"""
+Concurrent player load generator.
+
+Simulates N players, each on its own thread, playing QuizGame end to end:
+start a game on a topic from the mix, think, answer (right with the given
+accuracy), and start again when the game is over. The player count ramps
+through the given steps; each step reports throughput, p50/p95/p99 latency
+of game starts and answers, and the memory held per live session.
+
+The question provider is the offline stub from backend_bench with an
+optional simulated model latency, so a run measures the engine and
+pipeline rather than Hugging Face. With --base-url, game starts make real
+HTTP requests instead, e.g. to benchmarks/mock_hf_server.py.
+
+Usage:
+    python -m benchmarks.loadgen
+    python -m benchmarks.loadgen --players 1,8,32,128 --duration 10 --think-ms 200
+    python -m benchmarks.loadgen --provider-latency-ms 1500 --update-baseline
+    python -m benchmarks.loadgen --base-url http://127.0.0.1:8089
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import threading
+import contextlib
+from unittest import mock
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks._baseline import report, DEFAULT_THRESHOLD
+from benchmarks.backend_bench import load_corpus, stubbed_provider
+from backend import llm_questions
+from backend.game_engine import QuizGame
+
+
+SUITE_NAME = "loadgen"
+
+METRICS = {
+    "answers_per_sec": "higher",
+    "start_p99_ms": "lower",
+    "answer_p99_ms": "lower",
+    "kib_per_session": "lower",
+}
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list (0 if empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(p / 100 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+class Player(threading.Thread):
+    """
+    One simulated player.
+
+    Args:
+        seed (int): Seeds think times, answer choices and topics
+        topics (list): Topics to pick from for each new game
+        think (float): Mean seconds between answers (exponential)
+        accuracy (float): Probability of answering correctly
+        stop (threading.Event): Set to end the session
+    """
+
+    def __init__(self, seed, topics, think, accuracy, stop):
+        super().__init__(daemon=True)
+        self.rng = random.Random(seed)
+        self.topics = topics
+        self.think = think
+        self.accuracy = accuracy
+        self.stop = stop
+        self.start_latencies = []
+        self.answer_latencies = []
+        self.games = 0
+        self.failed_starts = 0
+
+    def _pause(self):
+        if self.think > 0:
+            self.stop.wait(self.rng.expovariate(1 / self.think))
+
+    def run(self):
+        while not self.stop.is_set():
+            game = QuizGame()
+            t = time.perf_counter()
+            ok = game.start_new_game(self.rng.choice(self.topics))
+            if not ok:
+                # counted apart from the latencies, and retried after a think
+                # instead of straight away
+                self.failed_starts += 1
+                self._pause()
+                continue
+            self.start_latencies.append(time.perf_counter() - t)
+            self.games += 1
+
+            while not game.game_over and not self.stop.is_set():
+                self._pause()
+                answer = game.get_current_question()["answer"]
+                if self.rng.random() >= self.accuracy:
+                    answer = self.rng.choice([c for c in "abcd" if c != answer])
+                t = time.perf_counter()
+                game.submit_answer(answer)
+                game.get_progress()
+                self.answer_latencies.append(time.perf_counter() - t)
+
+
+@contextlib.contextmanager
+def http_provider(base_url):
+    """Send model requests to base_url with a placeholder token."""
+    with mock.patch.dict(os.environ, {"HF_API_BASE_URL": base_url,
+                                      "HUGGINGFACE_API_TOKEN": os.environ.get("HUGGINGFACE_API_TOKEN", "loadgen")}), \
+            mock.patch.object(llm_questions, "_env_loaded", True):
+        yield
+
+
+def session_memory(count, topics):
+    """
+    Python heap held per started game, measured over count live games.
+
+    Returns:
+        float: KiB per session
+    """
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    games = []
+    for i in range(count):
+        game = QuizGame()
+        game.start_new_game(topics[i % len(topics)])
+        games.append(game)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (after - before) / count / 1024
+
+
+def run_step(players, duration, topics, think, accuracy, seed):
+    """
+    Run one ramp step.
+
+    Returns:
+        dict: Throughput, latency percentiles (ms) and memory per session
+    """
+    stop = threading.Event()
+    threads = [Player(seed + i, topics, think, accuracy, stop) for i in range(players)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    starts = sorted(x for thread in threads for x in thread.start_latencies)
+    answers = sorted(x for thread in threads for x in thread.answer_latencies)
+    result = {
+        "players": players,
+        "games_per_sec": sum(thread.games for thread in threads) / elapsed,
+        "failed_starts_per_sec": sum(thread.failed_starts for thread in threads) / elapsed,
+        "answers_per_sec": len(answers) / elapsed,
+        "kib_per_session": session_memory(max(players, 16), topics),
+    }
+    for name, values in (("start", starts), ("answer", answers)):
+        for p in (50, 95, 99):
+            result[f"{name}_p{p}_ms"] = percentile(values, p) * 1000
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Concurrent player load generator")
+    parser.add_argument("--players", default="1,4,16,64", help="comma-separated ramp of player counts")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per ramp step")
+    parser.add_argument("--think-ms", type=float, default=100.0, help="mean think time between answers")
+    parser.add_argument("--accuracy", type=float, default=0.8, help="probability of a correct answer")
+    parser.add_argument("--topics", default="General Knowledge,Science,History,Geography",
+                        help="comma-separated topic mix")
+    parser.add_argument("--provider-latency-ms", type=float, default=0.0,
+                        help="mean simulated model latency per game start (lognormal)")
+    parser.add_argument("--base-url", help="send model requests to this server instead of the stub")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed relative regression (default 0.15)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="store this run as the new baseline")
+    args = parser.parse_args(argv)
+
+    topics = [t.strip() for t in args.topics.split(",") if t.strip()]
+    text = next(e["generated_text"] for e in load_corpus() if e["kind"] == "valid")
+
+    if args.base_url:
+        provider = http_provider(args.base_url)
+    else:
+        latency = None
+        if args.provider_latency_ms > 0:
+            mean = args.provider_latency_ms / 1000
+            rng = random.Random(args.seed)
+            # lognormal with sigma 0.5, scaled so the mean is as requested (E = e^(sigma^2/2))
+            latency = lambda: rng.lognormvariate(0, 0.5) * mean / 1.1331
+        provider = stubbed_provider(text, latency)
+
+    results = {}
+    with provider:
+        for players in (int(p) for p in args.players.split(",")):
+            result = run_step(players, args.duration, topics, args.think_ms / 1000, args.accuracy, args.seed)
+            results[f"players_{players}"] = result
+            print(f"{players:>5} players: {result['answers_per_sec']:9.1f} answers/s  "
+                  f"start p99 {result['start_p99_ms']:8.2f} ms  answer p99 {result['answer_p99_ms']:6.3f} ms")
+
+    # HTTP runs measure a different stack; keep their baseline apart
+    suite = f"{SUITE_NAME}_http" if args.base_url else SUITE_NAME
+    ok = report(suite, results, METRICS, args.threshold, args.update_baseline)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,247 @@
+"""
+Memory profiling mode built on tracemalloc.
+
+sessions: creates QuizGame sessions in a session store (a plain list, the
+way a server would hold them) with the offline stub provider, snapshots the
+heap at checkpoints and attributes the growth to subsystems by the
+innermost project frame of each allocation. It then keeps the store at a
+fixed size while games come and go; the heap should stop growing.
+
+ui: draws every screen repeatedly under the dummy video driver and counts
+the pygame.Surface objects created per frame (their pixels live outside the
+Python heap, so tracemalloc alone cannot see them) plus any Python heap
+retained across frames.
+
+Usage:
+    python -m benchmarks.memory_profile
+    python -m benchmarks.memory_profile --sessions 500 --checkpoints 5
+    python -m benchmarks.memory_profile --mode ui --frames 300
+    python -m benchmarks.memory_profile --update-baseline
+"""
+
+import os
+import sys
+import gc
+import argparse
+import tracemalloc
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks._baseline import report, DEFAULT_THRESHOLD
+
+
+SUITE_NAME = "memory"
+
+METRICS = {
+    "bytes_per_session": "lower",
+    "churn_growth_kib": "lower",
+    "surfaces_per_frame": "lower",
+    "surface_kib_per_frame": "lower",
+    "retained_bytes_per_frame": "lower",
+}
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Project file -> subsystem; the innermost project frame of an allocation wins
+SUBSYSTEMS = {
+    os.path.join("backend", "game_engine.py"): "engine",
+    os.path.join("backend", "llm_questions.py"): "questions",
+    os.path.join("backend", "metrics.py"): "observability",
+    os.path.join("backend", "logs.py"): "observability",
+    os.path.join("backend", "tracing.py"): "observability",
+    os.path.join("ui", "pygame_ui.py"): "ui.draw",
+    os.path.join("ui", "layout.py"): "ui.layout",
+    os.path.join("ui", "prerender.py"): "ui.prerender",
+    os.path.join("ui", "resources.py"): "ui.fonts",
+    os.path.join("ui", "assets.py"): "ui.assets",
+}
+
+
+def subsystem(traceback):
+    """Name the subsystem responsible for one allocation traceback."""
+    # frames run oldest to newest; the newest project frame made the call
+    for frame in reversed(traceback):
+        path = os.path.abspath(frame.filename)
+        if path.startswith(ROOT):
+            return SUBSYSTEMS.get(os.path.relpath(path, ROOT), "other project code")
+    return "other"
+
+
+def take_snapshot():
+    """
+    Heap snapshot without tracemalloc's own bookkeeping. Garbage is collected
+    first so cycles awaiting collection don't read as growth.
+    """
+    gc.collect()
+    return tracemalloc.take_snapshot().filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),))
+
+
+def by_subsystem(snapshot, base):
+    """
+    Heap growth between two snapshots, grouped by subsystem.
+
+    Returns:
+        dict: {subsystem: bytes}, largest first
+    """
+    totals = {}
+    for stat in snapshot.compare_to(base, "traceback"):
+        name = subsystem(stat.traceback)
+        totals[name] = totals.get(name, 0) + stat.size_diff
+    return dict(sorted(totals.items(), key=lambda item: -item[1]))
+
+
+def _print_breakdown(label, totals, per=None):
+    parts = ", ".join(
+        f"{name} {size / 1024:.1f} KiB" + (f" ({size / per:.0f} B each)" if per else "")
+        for name, size in totals.items() if abs(size) >= 512
+    )
+    print(f"  {label}: {parts or 'no growth'}")
+
+
+# ============================================
+#      SESSIONS
+# ============================================
+
+def profile_sessions(count, checkpoints, churn):
+    """
+    Returns:
+        dict: bytes_per_session, churn_growth_kib and the per-subsystem split
+    """
+    from benchmarks.backend_bench import load_corpus, stubbed_provider
+    from backend.game_engine import QuizGame
+
+    text = next(e["generated_text"] for e in load_corpus() if e["kind"] == "valid")
+    store = []
+
+    def new_session(i):
+        game = QuizGame()
+        game.start_new_game(f"Topic {i % 7}")
+        game.submit_answer(game.get_current_question()["answer"])
+        return game
+
+    with stubbed_provider(text):
+        tracemalloc.start(25)
+        new_session(-1)  # first-use caches (metric children, loggers) are not per session
+        base = take_snapshot()
+
+        print(f"\nSessions (store of {count}):")
+        step = max(1, count // checkpoints)
+        snapshot = base
+        while len(store) < count:
+            for _ in range(min(step, count - len(store))):
+                store.append(new_session(len(store)))
+            snapshot = take_snapshot()
+            totals = by_subsystem(snapshot, base)
+            grown = sum(totals.values())
+            print(f"  {len(store):>6} sessions  {grown / 1024:9.1f} KiB  {grown / len(store):8.0f} B/session")
+        totals = by_subsystem(snapshot, base)
+        per_session = sum(totals.values()) / count
+        _print_breakdown("per subsystem", totals, per=count)
+
+        # Churn: same number of live sessions, games replaced one by one
+        full = take_snapshot()
+        for i in range(churn):
+            store[i % count] = new_session(i)
+        after = take_snapshot()
+        churn_totals = by_subsystem(after, full)
+        churn_growth = sum(churn_totals.values())
+        print(f"\nChurn ({churn} games replaced, store size fixed): {churn_growth / 1024:+.1f} KiB")
+        _print_breakdown("growth", churn_totals)
+        tracemalloc.stop()
+
+    return {
+        "bytes_per_session": per_session,
+        "churn_growth_kib": max(0.0, churn_growth / 1024),
+        "subsystems": {name: size / count for name, size in totals.items()},
+    }
+
+
+# ============================================
+#      UI
+# ============================================
+
+def profile_ui(frames):
+    """
+    Returns:
+        dict: {screen: {"surfaces_per_frame", "surface_kib_per_frame", "retained_bytes_per_frame"}}
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    import pygame
+    import ui.pygame_ui as ui
+    from benchmarks.ui_bench import build_cases
+
+    created = {"count": 0, "bytes": 0}
+
+    class CountingSurface(pygame.Surface):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created["count"] += 1
+            created["bytes"] += self.get_width() * self.get_height() * self.get_bytesize()
+
+    ui.init_display()
+    cases = build_cases(ui)
+    # transitions draw new text every frame by design; they measure rendering, not leaks
+    cases = {name: draw for name, draw in cases.items() if not name.startswith("transition")}
+
+    results = {}
+    print(f"\nUI screens ({frames} frames each):")
+    with mock.patch.object(pygame, "Surface", CountingSurface):
+        for name, draw in cases.items():
+            for _ in range(10):
+                draw()
+            tracemalloc.start(25)
+            created["count"] = created["bytes"] = 0
+            half = max(1, frames // 2)
+            for i in range(frames):
+                if i == frames - half:
+                    # one-off costs land in the first half; only the second counts as retained
+                    base = take_snapshot()
+                draw()
+                pygame.display.flip()
+            snapshot = take_snapshot()
+            tracemalloc.stop()
+            totals = by_subsystem(snapshot, base)
+            results[name] = {
+                "surfaces_per_frame": created["count"] / frames,
+                "surface_kib_per_frame": created["bytes"] / frames / 1024,
+                "retained_bytes_per_frame": max(0.0, sum(totals.values()) / half),
+            }
+            r = results[name]
+            print(f"  {name:<20} {r['surfaces_per_frame']:5.2f} surfaces/frame  "
+                  f"{r['surface_kib_per_frame']:8.1f} KiB/frame  {r['retained_bytes_per_frame']:8.1f} B retained/frame")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="tracemalloc memory profiling")
+    parser.add_argument("--mode", choices=("all", "sessions", "ui"), default="all")
+    parser.add_argument("--sessions", type=int, default=200, help="sessions held in the store")
+    parser.add_argument("--checkpoints", type=int, default=4, help="snapshots while filling the store")
+    parser.add_argument("--churn", type=int, default=400, help="games replaced after the store is full")
+    parser.add_argument("--frames", type=int, default=120, help="frames per UI screen")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed relative regression (default 0.15)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="store this run as the new baseline")
+    args = parser.parse_args(argv)
+
+    results = {}
+    if args.mode in ("all", "sessions"):
+        results["sessions"] = profile_sessions(args.sessions, args.checkpoints, args.churn)
+    if args.mode in ("all", "ui"):
+        for name, values in profile_ui(args.frames).items():
+            results[f"ui_{name}"] = values
+
+    ok = report(SUITE_NAME, results, METRICS, args.threshold, args.update_baseline)
+    # a zero baseline is never compared, so new per-frame surfaces are checked here
+    leaking = [name for name, values in results.items() if values.get("surfaces_per_frame", 0) > 0]
+    for name in leaking:
+        print(f"{name}: allocates {results[name]['surfaces_per_frame']:.2f} surfaces per frame")
+    return 0 if ok and not leaking else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
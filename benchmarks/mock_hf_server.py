@@ -0,0 +1,315 @@
+"""
+Local stand-in for the Hugging Face Inference API.
+
+Answers text-generation requests in the same shape as the real endpoint
+(POST /<model id> with {"inputs": ..., "parameters": ...}, reply
+[{"generated_text": ...}]), including server-sent-event streaming when the
+request sets "stream": true. Latency, errors, broken output and throughput
+are all configurable, so the fetch path can be measured and load-tested
+without a network or a token.
+
+Completions come from the valid entries of the benchmark corpus
+(benchmarks/corpus/llm_outputs.jsonl); malformed replies from its
+malformed entries.
+
+Usage:
+    python -m benchmarks.mock_hf_server --port 8089 --latency lognormal:800,0.5 --error-429 0.05
+    HF_API_BASE_URL=http://127.0.0.1:8089 HUGGINGFACE_API_TOKEN=x python run_quiz.py
+
+Latency specs (milliseconds):
+    fixed:MS  uniform:LOW,HIGH  exp:MEAN  lognormal:MEDIAN,SIGMA
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.backend_bench import load_corpus
+
+
+def parse_latency(spec):
+    """
+    Turn a latency spec into a sampler.
+
+    Returns:
+        callable: rng -> seconds
+    """
+    kind, _, args = spec.partition(":")
+    values = [float(v) for v in args.split(",")] if args else []
+    if kind == "fixed":
+        return lambda rng: values[0] / 1000
+    if kind == "uniform":
+        return lambda rng: rng.uniform(values[0], values[1]) / 1000
+    if kind == "exp":
+        return lambda rng: rng.expovariate(1 / values[0]) / 1000 if values[0] else 0.0
+    if kind == "lognormal":
+        return lambda rng: rng.lognormvariate(0, values[1]) * values[0] / 1000
+    raise ValueError(f"Unknown latency spec '{spec}'")
+
+
+class MockConfig:
+    """
+    Behaviour of the mock server. Rates are probabilities per request.
+
+    Args:
+        latency (str): Latency spec for the whole reply (see module docstring)
+        error_429 (float): Rate of 429 Too Many Requests replies
+        error_503 (float): Rate of 503 model-loading replies
+        timeout_rate (float): Rate of requests that hang for hang_seconds
+        malformed (float): Rate of replies using a malformed corpus entry
+        truncate (float): Rate of replies cut off part way
+        rps (float): Requests per second allowed before 429 (0 = unlimited)
+        max_concurrent (int): Requests served at once; others queue (0 = unlimited)
+        echo_prompt (bool): Prefix completions with the prompt, like the
+                            real API's return_full_text default
+        token_delay_ms (float): Delay between streamed tokens
+        hang_seconds (float): How long a timed-out request hangs
+        seed (int): RNG seed
+    """
+
+    def __init__(self, latency="fixed:0", error_429=0.0, error_503=0.0, timeout_rate=0.0,
+                 malformed=0.0, truncate=0.0, rps=0.0, max_concurrent=0, echo_prompt=False,
+                 token_delay_ms=0.0, hang_seconds=120.0, seed=0):
+        self.latency = latency
+        self.error_429 = error_429
+        self.error_503 = error_503
+        self.timeout_rate = timeout_rate
+        self.malformed = malformed
+        self.truncate = truncate
+        self.rps = rps
+        self.max_concurrent = max_concurrent
+        self.echo_prompt = echo_prompt
+        self.token_delay_ms = token_delay_ms
+        self.hang_seconds = hang_seconds
+        self.seed = seed
+
+
+class MockState:
+    """Shared by all handler threads: config, RNG, corpus, limits and counters."""
+
+    def __init__(self, config):
+        self.config = config
+        self.sample_latency = parse_latency(config.latency)
+        self.rng = random.Random(config.seed)
+        self.lock = threading.Lock()
+        corpus = load_corpus()
+        self.valid = [e["generated_text"] for e in corpus if e["kind"] == "valid"]
+        self.malformed = [e["generated_text"] for e in corpus if e["kind"] == "malformed"]
+        self.slots = threading.BoundedSemaphore(config.max_concurrent) if config.max_concurrent else None
+        self.tokens = config.rps
+        self.refilled = time.monotonic()
+        self.stats = {"requests": 0, "ok": 0, "429": 0, "503": 0, "timeouts": 0}
+
+    def random(self):
+        with self.lock:
+            return self.rng.random()
+
+    def count(self, key):
+        with self.lock:
+            self.stats[key] += 1
+
+    def admit(self):
+        """Token bucket for the rps limit; False means reply 429."""
+        if not self.config.rps:
+            return True
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.config.rps, self.tokens + (now - self.refilled) * self.config.rps)
+            self.refilled = now
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+    def completion(self, prompt):
+        """Pick the generated text for one request and the latency to apply."""
+        with self.lock:
+            roll = self.rng.random()
+            if roll < self.config.malformed:
+                text = self.rng.choice(self.malformed)
+            else:
+                text = self.rng.choice(self.valid)
+            if self.rng.random() < self.config.truncate:
+                text = text[: int(len(text) * self.rng.uniform(0.3, 0.95))]
+            latency = self.sample_latency(self.rng)
+        if self.config.echo_prompt:
+            text = prompt + text
+        return text, latency
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    state = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply_json(self, status, body, headers=()):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/stats":
+            with self.state.lock:
+                stats = dict(self.state.stats)
+            self._reply_json(200, stats)
+        else:
+            self._reply_json(404, {"error": "Not Found"})
+
+    def do_POST(self):
+        state = self.state
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._reply_json(400, {"error": "Invalid JSON body"})
+            return
+        state.count("requests")
+
+        if not self.headers.get("Authorization", "").startswith("Bearer "):
+            self._reply_json(401, {"error": "Invalid credentials in Authorization header"})
+            return
+        if not state.admit() or state.random() < state.config.error_429:
+            state.count("429")
+            self._reply_json(429, {"error": "Rate limit reached. You reached free usage limit (reset hourly)."},
+                             [("Retry-After", "1")])
+            return
+        if state.random() < state.config.error_503:
+            state.count("503")
+            model = self.path.strip("/")
+            self._reply_json(503, {"error": f"Model {model} is currently loading", "estimated_time": 20.0})
+            return
+        if state.random() < state.config.timeout_rate:
+            state.count("timeouts")
+            time.sleep(state.config.hang_seconds)
+            return
+
+        if state.slots is not None:
+            state.slots.acquire()
+        try:
+            text, latency = state.completion(payload.get("inputs", ""))
+            # counted before replying: a client that has its answer sees it in stats
+            state.count("ok")
+            if payload.get("stream") or payload.get("parameters", {}).get("stream"):
+                self._stream(text, latency)
+            else:
+                time.sleep(latency)
+                self._reply_json(200, [{"generated_text": text}])
+        finally:
+            if state.slots is not None:
+                state.slots.release()
+
+    def _stream(self, text, latency):
+        """Server-sent events, one token per event, the full text on the last."""
+        # time to first token, then the per-token delay
+        time.sleep(latency)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        tokens = [text[i:i + 4] for i in range(0, len(text), 4)] or [""]
+        delay = self.state.config.token_delay_ms / 1000
+        for i, token in enumerate(tokens):
+            last = i == len(tokens) - 1
+            event = {
+                "token": {"id": i, "text": token, "logprob": 0.0, "special": False},
+                "generated_text": text if last else None,
+                "details": None,
+            }
+            self._chunk(f"data:{json.dumps(event)}\n\n".encode("utf-8"))
+            if delay and not last:
+                time.sleep(delay)
+        self._chunk(b"")
+
+    def _chunk(self, data):
+        self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+
+
+class MockHFServer:
+    """
+    The mock server on a background thread.
+
+    Usage:
+        with MockHFServer(MockConfig(latency="fixed:50")) as server:
+            os.environ["HF_API_BASE_URL"] = server.url
+    """
+
+    def __init__(self, config=None, host="127.0.0.1", port=0):
+        self.state = MockState(config or MockConfig())
+        handler = type("Handler", (MockHandler,), {"state": self.state})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://{host}:{self.httpd.server_address[1]}"
+
+    def start(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    @property
+    def stats(self):
+        with self.state.lock:
+            return dict(self.state.stats)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local stand-in Hugging Face inference server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", default="fixed:0", help="latency spec in ms (see module docstring)")
+    parser.add_argument("--error-429", type=float, default=0.0, help="rate of 429 replies")
+    parser.add_argument("--error-503", type=float, default=0.0, help="rate of 503 replies")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="rate of requests that hang")
+    parser.add_argument("--hang-seconds", type=float, default=120.0, help="how long hanging requests hang")
+    parser.add_argument("--malformed", type=float, default=0.0, help="rate of malformed completions")
+    parser.add_argument("--truncate", type=float, default=0.0, help="rate of truncated completions")
+    parser.add_argument("--rps", type=float, default=0.0, help="requests per second before 429 (0 = no limit)")
+    parser.add_argument("--max-concurrent", type=int, default=0, help="requests served at once (0 = no limit)")
+    parser.add_argument("--echo-prompt", action="store_true", help="prefix completions with the prompt")
+    parser.add_argument("--token-delay-ms", type=float, default=0.0, help="delay between streamed tokens")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    config = MockConfig(
+        latency=args.latency, error_429=args.error_429, error_503=args.error_503,
+        timeout_rate=args.timeout_rate, malformed=args.malformed, truncate=args.truncate,
+        rps=args.rps, max_concurrent=args.max_concurrent, echo_prompt=args.echo_prompt,
+        token_delay_ms=args.token_delay_ms, hang_seconds=args.hang_seconds, seed=args.seed,
+    )
+    server = MockHFServer(config, args.host, args.port)
+    print(f"Mock Hugging Face API on {server.url} (HF_API_BASE_URL={server.url})")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(f"Served: {server.stats}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+"""
+Replay benchmark: whole play sessions through the real UI loop.
+
+Recorded sessions (see ui/replay.py) are fed back into run_quiz_ui() under
+SDL's dummy video driver with a seeded, offline QuizGame, so every run sees
+the same questions and the same clicks. Frame times come from run_quiz_ui's
+frame hook and CPU load from the process clock.
+
+Usage:
+    python -m benchmarks.replay_bench                      # replay benchmarks/sessions/*.qzr
+    python -m benchmarks.replay_bench --update-baseline
+    python -m benchmarks.replay_bench --record my_run.qzr  # play in a real window
+    python -m benchmarks.replay_bench --synthesize         # rebuild the bundled session
+"""
+
+import os
+import sys
+import glob
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks._baseline import report, DEFAULT_THRESHOLD
+from backend.game_engine import QuizGame
+from backend.llm_questions import parse_fallback_questions
+
+
+SUITE_NAME = "replay"
+
+SESSIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sessions")
+
+METRICS = {
+    "mean_frame_ms": "lower",
+    "p95_frame_ms": "lower",
+    "cpu_percent": "lower",
+}
+
+DEFAULT_SEED = 1234
+
+
+class SeededQuizGame(QuizGame):
+    """
+    QuizGame with the built-in question set in a seeded order.
+    Never touches the network, so replays are deterministic.
+    """
+
+    def __init__(self, seed=DEFAULT_SEED):
+        super().__init__()
+        self.seed = seed
+
+    def start_new_game(self, topic="General Knowledge"):
+        questions = parse_fallback_questions()
+        random.Random(self.seed).shuffle(questions)
+        self.questions = questions
+        self.score = 0
+        self.current_index = 0
+        self.game_over = False
+        self.game_started = True
+        return True
+
+
+def seeded_factory(seed):
+    """Game factory for run_quiz_ui() that always deals the same game."""
+    def factory(topic="General Knowledge"):
+        game = SeededQuizGame(seed)
+        game.start_new_game(topic)
+        return game
+    return factory
+
+
+def synthesize_session(path, seed=DEFAULT_SEED):
+    """
+    Write a scripted session for the seeded game: a perfect run through all
+    questions (picking a wrong option first, then the right one), a restart
+    that ends on a wrong answer, back home and quit.
+    """
+    import pygame
+    import ui.pygame_ui as ui
+    from ui.layout import get_layout
+    from ui.replay import EventRecorder
+
+    layout = get_layout(ui.WIDTH, ui.HEIGHT)
+    questions = SeededQuizGame(seed)
+    questions.start_new_game()
+    answers = ["abcd".index(q["answer"]) for q in questions.questions]
+
+    recorder = EventRecorder((ui.WIDTH, ui.HEIGHT))
+    t = 0
+
+    def click(rect, delay):
+        nonlocal t
+        t += delay
+        pos = rect.center
+        recorder.add(t, pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1))
+        recorder.add(t + 80, pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=1))
+
+    def answer(index, correct):
+        wrong = (index + 1) % 4
+        click(layout.option_rects[wrong], 700)
+        if correct:
+            click(layout.option_rects[index], 400)
+        click(layout.submit_button, 600)
+
+    click(layout.start_button, 800)
+    for index in answers:
+        answer(index, True)
+
+    click(layout.result_restart, 1500)
+    t += 400  # loading screen
+    for index in answers[:3]:
+        answer(index, True)
+    answer(answers[3], False)
+
+    click(layout.result_home, 1500)
+    t += 800
+    recorder.add(t, pygame.event.Event(pygame.QUIT))
+    recorder.save(path)
+
+
+def replay_session(path, seed=DEFAULT_SEED, speed=1.0):
+    """
+    Play one recording through run_quiz_ui().
+
+    Returns:
+        dict: Frame-time and CPU metrics for the session
+    """
+    import pygame
+    import ui.pygame_ui as ui
+    from ui.replay import EventPlayer, load_recording
+
+    window_size, events = load_recording(path)
+    if window_size != (ui.WIDTH, ui.HEIGHT):
+        raise ValueError(f"{path} was recorded at {window_size}, the UI opens at {(ui.WIDTH, ui.HEIGHT)}")
+    if not events or events[-1][1].type != pygame.QUIT:
+        # a recording cut short still has to end the loop
+        last = events[-1][0] if events else 0
+        events.append((last + 500, pygame.event.Event(pygame.QUIT)))
+
+    frame_times = []
+    player = EventPlayer(events, speed=speed)
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    ui.run_quiz_ui(
+        game_factory=seeded_factory(seed),
+        player=player,
+        frame_hook=lambda state, seconds: frame_times.append(seconds),
+        exit_on_quit=False,
+    )
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    frame_times.sort()
+    frames = len(frame_times)
+    return {
+        "frames": frames,
+        "mean_frame_ms": sum(frame_times) * 1000 / max(1, frames),
+        "p95_frame_ms": frame_times[min(frames - 1, int(frames * 0.95))] * 1000 if frames else 0.0,
+        "max_frame_ms": frame_times[-1] * 1000 if frames else 0.0,
+        "cpu_percent": cpu * 100 / wall,
+        "wall_s": wall,
+    }
+
+
+def record_session(path, seed=DEFAULT_SEED):
+    """Play the seeded game in a real window and save the session."""
+    import ui.pygame_ui as ui
+    from ui.replay import EventRecorder
+
+    recorder = EventRecorder((ui.WIDTH, ui.HEIGHT))
+    try:
+        ui.run_quiz_ui(game_factory=seeded_factory(seed), recorder=recorder, exit_on_quit=False)
+    finally:
+        recorder.save(path)
+    print(f"Recorded {len(recorder.records)} events to {path}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay recorded UI sessions headlessly")
+    parser.add_argument("sessions", nargs="*", help="recordings to replay (default: benchmarks/sessions/*.qzr)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="question order seed")
+    parser.add_argument("--speed", type=float, default=1.0, help="playback speed factor")
+    parser.add_argument("--record", metavar="PATH", help="play in a window and record to PATH")
+    parser.add_argument("--synthesize", action="store_true",
+                        help="rewrite the scripted session in benchmarks/sessions/")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed relative regression (default 0.15)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="store this run as the new baseline")
+    args = parser.parse_args(argv)
+
+    if args.record:
+        record_session(args.record, args.seed)
+        return 0
+
+    # Must be set before pygame is imported by the UI module
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+    if args.synthesize:
+        os.makedirs(SESSIONS_DIR, exist_ok=True)
+        path = os.path.join(SESSIONS_DIR, "full_game.qzr")
+        synthesize_session(path, args.seed)
+        print(f"Wrote {path}")
+        return 0
+
+    paths = args.sessions or sorted(glob.glob(os.path.join(SESSIONS_DIR, "*.qzr")))
+    results = {}
+    for path in paths:
+        name = os.path.splitext(os.path.basename(path))[0]
+        results[name] = replay_session(path, args.seed, args.speed)
+
+    ok = report(SUITE_NAME, results, METRICS, args.threshold, args.update_baseline)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
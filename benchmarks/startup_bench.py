@@ -0,0 +1,105 @@
+"""
+Launch-to-first-frame benchmark.
+
+Starts a fresh interpreter for every sample, imports ui.pygame_ui, opens the
+display under SDL's dummy driver and draws the start screen once.
+
+Usage:
+    python -m benchmarks.startup_bench
+    python -m benchmarks.startup_bench --runs 20 --update-baseline
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from benchmarks._baseline import report, DEFAULT_THRESHOLD
+
+
+SUITE_NAME = "startup"
+
+METRICS = {
+    "import_ms": "lower",
+    "first_frame_ms": "lower",
+}
+
+# Runs in the child interpreter. Times are measured from the first
+# statement so interpreter boot does not add noise.
+CHILD_SCRIPT = """
+import time
+t0 = time.perf_counter()
+import json
+import pygame
+import ui.pygame_ui as ui
+t1 = time.perf_counter()
+if hasattr(ui, "init_display"):
+    ui.init_display()
+ui.draw_start_screen()
+pygame.display.flip()
+t2 = time.perf_counter()
+print(json.dumps({"import_ms": (t1 - t0) * 1000, "first_frame_ms": (t2 - t0) * 1000}))
+"""
+
+
+def sample(cache_dir):
+    """Run one child process and return its timings."""
+    env = dict(os.environ)
+    env.update({
+        "SDL_VIDEODRIVER": "dummy",
+        "SDL_AUDIODRIVER": "dummy",
+        "PYGAME_HIDE_SUPPORT_PROMPT": "1",
+        "QUIZZIFY_CACHE_DIR": cache_dir,
+    })
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def run(runs):
+    """
+    Measure cold (empty cache directory) and warm startups.
+
+    Returns:
+        dict: {case: {"import_ms": float, "first_frame_ms": float}} (medians)
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        cold = []
+        for i in range(runs):
+            cold.append(sample(os.path.join(tmp, f"cold{i}")))
+        warm_dir = os.path.join(tmp, "warm")
+        sample(warm_dir)
+        warm = [sample(warm_dir) for _ in range(runs)]
+
+    for case, samples in (("cold", cold), ("warm", warm)):
+        results[case] = {
+            metric: statistics.median(s[metric] for s in samples)
+            for metric in METRICS
+        }
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Launch-to-first-frame benchmark")
+    parser.add_argument("--runs", type=int, default=7, help="child processes per case")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed relative regression (default 0.15)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="store this run as the new baseline")
+    args = parser.parse_args(argv)
+
+    ok = report(SUITE_NAME, run(args.runs), METRICS, args.threshold, args.update_baseline)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
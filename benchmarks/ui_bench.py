@@ -0,0 +1,201 @@
+"""
+Headless rendering benchmark for the Pygame screens.
+
+Runs every screen of ui/pygame_ui.py under SDL's dummy video driver with a
+stubbed QuizGame and measures frames per second and per-frame allocation.
+
+Usage:
+    python -m benchmarks.ui_bench
+    python -m benchmarks.ui_bench --frames 600 --update-baseline
+"""
+
+import os
+import sys
+import time
+import argparse
+import itertools
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Must be set before pygame is imported by the UI module
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from benchmarks._baseline import report, DEFAULT_THRESHOLD
+
+
+SUITE_NAME = "ui_screens"
+
+METRICS = {
+    "fps": "higher",
+    "alloc_kib_per_frame": "lower",
+}
+
+
+class StubQuizGame:
+    """
+    Offline stand-in for QuizGame with a fixed question set.
+    Exposes the attributes and methods the UI adapter functions use.
+    """
+
+    def __init__(self, num_questions=12):
+        self.questions = [
+            {
+                "text": f"Stub question number {i + 1}: which of these options is the correct one to pick?",
+                "options": {
+                    "a": "The first fairly long option text",
+                    "b": "Second option",
+                    "c": "A third option that wraps onto two lines in the card",
+                    "d": "Fourth",
+                },
+                "answer": "b",
+            }
+            for i in range(num_questions)
+        ]
+        self.score = 0
+        self.current_index = 0
+        self.game_over = False
+        self.game_started = True
+
+    def get_current_question(self):
+        if self.game_over or self.current_index >= len(self.questions):
+            return None
+        return self.questions[self.current_index]
+
+    def submit_answer(self, choice):
+        correct = choice == self.questions[self.current_index]["answer"]
+        if correct:
+            self.score += 10
+            self.current_index += 1
+        self.game_over = not correct or self.current_index >= len(self.questions)
+        return {"correct": correct, "game_over": self.game_over}
+
+    def get_score(self):
+        return self.score
+
+    def get_max_possible_score(self):
+        return 240
+
+
+def build_cases(ui):
+    """
+    Build the screen cases to benchmark.
+
+    Returns:
+        dict: {case_name: zero-argument draw callable}
+    """
+    game = StubQuizGame()
+    question_text, options = ui.load_current_question(game)
+
+    finished = StubQuizGame()
+    for _ in range(5):
+        finished.submit_answer("b")
+    finished.submit_answer("a")
+    score, max_score, correct_count, total_questions = ui.get_result_stats(finished)
+
+    pipeline = ui.RenderPipeline(ui.COLOR_QUESTION_TEXT, ui.COLOR_OPTION_TEXT)
+    pipeline.start(game.questions, ui.layout)
+    while pipeline.get(len(game.questions) - 1, ui.layout) is None:
+        time.sleep(0.001)
+    prepared = pipeline.get(0, ui.layout)
+    all_prepared = [pipeline.get(i, ui.layout) for i in range(len(game.questions))]
+
+    # Question transitions: every frame shows a question not seen before,
+    # either laid out live or swapped in from the pre-rendered set
+    counter = itertools.count()
+
+    def transition_live():
+        n = next(counter)
+        ui.draw_question_screen(f"{question_text} ({n})", [f"{opt} {n}" for opt in options], None, 1)
+
+    def transition_prepared():
+        n = next(counter)
+        ui.draw_question_screen(question_text, options, None, 1, all_prepared[n % len(all_prepared)])
+
+    return {
+        "start": lambda: ui.draw_start_screen(),
+        "loading": lambda: ui.draw_loading_screen(),
+        "question": lambda: ui.draw_question_screen(question_text, options, None, 1),
+        "question_selected": lambda: ui.draw_question_screen(question_text, options, 2, 1),
+        "question_prepared": lambda: ui.draw_question_screen(question_text, options, 2, 1, prepared),
+        "transition_live": transition_live,
+        "transition_prepared": transition_prepared,
+        "result": lambda: ui.draw_result_screen(score, max_score, correct_count, total_questions),
+    }
+
+
+def run_case(draw, frames, warmup=10, repeats=5):
+    """
+    Render one screen repeatedly.
+
+    Args:
+        draw (callable): Draws one frame to the display surface
+        frames (int): Number of measured frames
+        warmup (int): Unmeasured frames rendered first
+        repeats (int): Timing batches; the fastest one is reported
+                       to keep scheduler noise out of the baseline
+
+    Returns:
+        dict: {"fps": float, "ms_per_frame": float, "alloc_kib_per_frame": float}
+    """
+    for _ in range(warmup):
+        draw()
+        pygame.display.flip()
+
+    batch = max(1, frames // repeats)
+    elapsed = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(batch):
+            draw()
+            pygame.display.flip()
+        took = time.perf_counter() - start
+        elapsed = took if elapsed is None else min(elapsed, took)
+
+    # Allocation is measured in a separate pass so tracing overhead
+    # does not distort the frame rate.
+    tracemalloc.start()
+    peak_total = 0
+    for _ in range(frames):
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        draw()
+        pygame.display.flip()
+        _, peak = tracemalloc.get_traced_memory()
+        peak_total += peak - before
+    tracemalloc.stop()
+
+    return {
+        "fps": batch / elapsed,
+        "ms_per_frame": elapsed * 1000 / batch,
+        "alloc_kib_per_frame": peak_total / frames / 1024,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless UI rendering benchmark")
+    parser.add_argument("--frames", type=int, default=300, help="measured frames per screen")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed relative regression (default 0.15)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="store this run as the new baseline")
+    args = parser.parse_args(argv)
+
+    import ui.pygame_ui as ui
+    ui.init_display()
+
+    results = {}
+    for name, draw in build_cases(ui).items():
+        results[name] = run_case(draw, args.frames)
+
+    ok = report(SUITE_NAME, results, METRICS, args.threshold, args.update_baseline)
+    pygame.quit()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
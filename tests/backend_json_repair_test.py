@@ -0,0 +1,68 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+"""
+Tolerant JSON parser tests: the repairs it makes, where it gives up, and
+the malformed corpus outputs it now rescues.
+"""
+
+import json
+import time
+
+import pytest
+
+from backend.json_repair import extract_arrays, loads
+from backend.llm_questions import parse_questions_output, parse_fallback_questions
+from benchmarks.backend_bench import load_corpus
+
+
+def test_repairs():
+    text = """{text: 'Newton's law?', "options": {"a": "x", "b": "say "hi"",}, answer: b, n: 1.5e3, ok: True,, }"""
+    assert loads(text) == {
+        "text": "Newton's law?", "options": {"a": "x", "b": 'say "hi"'}, "answer": "b", "n": 1500.0, "ok": True,
+    }
+    assert loads('["caf\\u00e9\\n", null, -2]') == ["café\n", None, -2]
+
+
+def test_truncated_object_dropped():
+    assert extract_arrays('Here: [{"a": 1}, {"a": 2}, {"a": "cut of') == [[{"a": 1}, {"a": 2}]]
+    assert extract_arrays('[{"a": 1} {"a": [1, 2') == [[{"a": 1}]]
+    with pytest.raises(ValueError):
+        loads('{"a": 1, "b": ')
+
+
+def test_arrays_and_loose_objects():
+    text = "Pick [one] of these. [{a: 1}, {b: 2] and also {c: 3} {d: 4}"
+    assert extract_arrays(text) == [["one"], [{"a": 1}, {"b": 2}], [{"c": 3}, {"d": 4}]]
+    assert extract_arrays("no json here") == []
+
+
+def test_deep_nesting_skipped():
+    text = "[" * 1000 + "]" * 1000 + '[{"a": 1}]'
+    arrays = extract_arrays(text)
+    assert arrays[-1] == [{"a": 1}]
+
+
+def test_whitespace_before_junk_is_linear():
+    # each junk character used to make the tokenizer rescan the blank run before it
+    text = "[" + " " * 200000 + "# " + '{"a": 1}' + " " * 200000 + "@]"
+    start = time.perf_counter()
+    assert extract_arrays(text) == [[{"a": 1}]]
+    assert time.perf_counter() - start < 0.5
+
+
+def test_clean_output_unchanged():
+    for entry in load_corpus():
+        if entry["name"].startswith(("clean_", "compact_", "long_")):
+            assert extract_arrays(entry["generated_text"]) == [json.loads(entry["generated_text"])]
+
+
+def test_malformed_corpus_recovered():
+    fallback = parse_fallback_questions()
+    for entry in load_corpus():
+        if entry["name"].startswith(("prompt_echo_", "trailing_comma_", "single_quotes_")):
+            questions = parse_questions_output(entry["generated_text"])
+            assert questions != fallback, entry["name"]
+            assert len(questions) == 12
+            assert "Question text?" not in {q["text"] for q in questions}
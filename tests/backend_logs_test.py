@@ -0,0 +1,44 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+"""
+Logging tests: structured fields reach the background writer in both
+output formats, and records below the level are dropped.
+"""
+
+import io
+import json
+
+from backend import logs
+
+
+def test_json_records_carry_fields():
+    out = io.StringIO()
+    logs.configure(level="INFO", fmt="json", stream=out)
+    log = logs.get_logger("tests")
+    try:
+        log.info("Game started", extra={"topic": "Space", "session": 7, "latency_ms": 812})
+        log.debug("not written", extra={"topic": "Space"})
+    finally:
+        logs.shutdown()
+
+    lines = out.getvalue().splitlines()
+    assert len(lines) == 1
+    entry = json.loads(lines[0])
+    assert entry["message"] == "Game started"
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "quizzify.tests"
+    assert (entry["topic"], entry["session"], entry["latency_ms"]) == ("Space", 7, 812)
+
+
+def test_text_format():
+    out = io.StringIO()
+    logs.configure(level="DEBUG", fmt="text", stream=out)
+    try:
+        logs.get_logger("tests").warning("Question rejected", extra={"question": 3})
+    finally:
+        logs.shutdown()
+    line = out.getvalue().strip()
+    assert "WARNING" in line and "quizzify.tests: Question rejected" in line
+    assert line.endswith("question=3")
@@ -0,0 +1,81 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+"""
+Metrics registry tests: Prometheus text output, the HTTP endpoint and the
+engine / pipeline instrumentation.
+"""
+
+import threading
+import urllib.request
+
+from backend import metrics
+from backend.game_engine import QuizGame
+from backend.llm_questions import parse_questions_output
+from benchmarks.backend_bench import load_corpus, stubbed_provider
+
+
+def test_render_prometheus_text():
+    registry = metrics.Registry()
+    counter = registry.counter("test_events_total", "Events", ["kind"])
+    counter.labels("a").inc()
+    counter.labels("a").inc(2)
+    counter.labels('b"c').inc()
+    histogram = registry.histogram("test_seconds", "Latency", buckets=(0.1, 1))
+    for value in (0.05, 0.5, 5):
+        histogram.observe(value)
+
+    text = registry.render()
+    assert "# TYPE test_events_total counter" in text
+    assert 'test_events_total{kind="a"} 3' in text
+    assert 'test_events_total{kind="b\\"c"} 1' in text
+    assert 'test_seconds_bucket{le="0.1"} 1' in text
+    assert 'test_seconds_bucket{le="1"} 2' in text
+    assert 'test_seconds_bucket{le="+Inf"} 3' in text
+    assert "test_seconds_count 3" in text
+    assert "test_seconds_sum 5.55" in text
+
+
+def test_counter_across_threads():
+    counter = metrics.Counter("test_threads_total", "Events")
+    threads = [threading.Thread(target=lambda: [counter.inc() for _ in range(10000)]) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    counter.inc(5)
+    assert counter.value == 80005
+
+
+def test_http_endpoint():
+    registry = metrics.Registry()
+    registry.counter("test_up_total", "Up").inc()
+    server = metrics.start_http_server(0, registry=registry)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        body = urllib.request.urlopen(url, timeout=5).read().decode()
+    finally:
+        server.shutdown()
+    assert "test_up_total 1" in body
+
+
+def test_instrumentation():
+    started = metrics.GAMES_STARTED.value
+    won = metrics.GAMES_FINISHED.labels("won").value
+    correct = metrics.ANSWERS.labels("true").value
+    fallbacks = metrics.FALLBACKS.labels("parse_error").value
+
+    entry = next(e for e in load_corpus() if e["name"] == "clean_0")
+    game = QuizGame()
+    with stubbed_provider(entry["generated_text"]):
+        assert game.start_new_game()
+    for q in game.questions:
+        game.submit_answer(q["answer"])
+
+    assert metrics.GAMES_STARTED.value == started + 1
+    assert metrics.GAMES_FINISHED.labels("won").value == won + 1
+    assert metrics.ANSWERS.labels("true").value == correct + 12
+
+    parse_questions_output("no json here")
+    assert metrics.FALLBACKS.labels("parse_error").value == fallbacks + 1
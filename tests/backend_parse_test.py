@@ -0,0 +1,50 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+"""
+Question pipeline tests over the benchmark corpus of model outputs.
+"""
+
+import json
+
+from backend.llm_questions import parse_questions_output, parse_fallback_questions
+from benchmarks.backend_bench import build_corpus, load_corpus, stubbed_provider
+from backend.game_engine import QuizGame
+
+
+def test_corpus_up_to_date():
+    """benchmarks/corpus/llm_outputs.jsonl matches build_corpus()."""
+    assert load_corpus() == build_corpus()
+
+
+def test_valid_outputs_accepted():
+    fallback = parse_fallback_questions()
+    for entry in load_corpus():
+        if entry["kind"] != "valid":
+            continue
+        questions = parse_questions_output(entry["generated_text"])
+        assert questions != fallback, entry["name"]
+        assert len(questions) == 12
+        assert all(q["answer"] in "abcd" for q in questions)
+
+
+def test_start_new_game_with_stubbed_provider():
+    entry = next(e for e in load_corpus() if e["name"] == "clean_1")
+    game = QuizGame()
+    with stubbed_provider(entry["generated_text"]):
+        assert game.start_new_game("Python Programming")
+    assert game.questions != parse_fallback_questions()
+    assert game.get_progress()["current_question"] == 1
+
+
+def test_partial_output_topped_up():
+    fallback = parse_fallback_questions()
+    entry = next(e for e in load_corpus() if e["name"] == "eleven_0")
+    questions = parse_questions_output(entry["generated_text"])
+    assert len(questions) == 12
+    assert questions[:11] == json.loads(entry["generated_text"])
+    assert len({q["text"] for q in questions}) == 12
+
+    few = json.dumps(json.loads(entry["generated_text"])[:3])
+    assert parse_questions_output(few) == fallback
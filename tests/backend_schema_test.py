@@ -0,0 +1,57 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+"""
+Question validator tests: normalization, structured errors, and
+agreement between the column-wise and per-item paths.
+"""
+
+from backend.question_schema import QuestionError, validate_questions
+from backend.llm_questions import parse_fallback_questions
+
+
+def test_clean_batch_passes_through():
+    questions = parse_fallback_questions()
+    valid, errors = validate_questions(questions)
+    assert errors == []
+    assert valid == questions
+    assert all(v is q for v, q in zip(valid, questions))
+
+
+def test_normalizes():
+    item = {"text": "  Year?\n", "options": {"a": 1943, "b": " 1944", "c": "1945 ", "d": 1946.5}, "answer": " C "}
+    valid, errors = validate_questions([item])
+    assert errors == []
+    assert valid == [{"text": "Year?", "options": {"a": "1943", "b": "1944", "c": "1945", "d": "1946.5"},
+                      "answer": "c"}]
+
+
+def test_structured_errors():
+    items = [
+        "not a question",
+        {"text": "", "options": {"a": "x", "b": "y", "c": "z"}, "answer": "e"},
+        {"text": "Q?", "options": None, "answer": None},
+    ]
+    valid, errors = validate_questions(items)
+    assert valid == []
+    assert errors == [
+        QuestionError(0, "", "not an object"),
+        QuestionError(1, "text", "empty"),
+        QuestionError(1, "options.d", "missing or not a string"),
+        QuestionError(1, "answer", "must be one of a, b, c, d"),
+        QuestionError(2, "options", "missing or not an object"),
+        QuestionError(2, "answer", "missing or not a string"),
+    ]
+
+
+def test_chunks_keep_order_and_indices():
+    questions = parse_fallback_questions()
+    questions[5] = dict(questions[5], answer="B")
+    questions[6] = dict(questions[6], text=" ")
+    questions[9] = dict(questions[9], extra="dropped")
+    valid, errors = validate_questions(questions, chunk=4)
+    assert errors == [QuestionError(6, "text", "empty")]
+    assert [q["text"] for q in valid] == [q["text"] for i, q in enumerate(questions) if i != 6]
+    assert valid[5]["answer"] == "b"
+    assert "extra" not in valid[8]
@@ -0,0 +1,79 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+"""
+Difficulty-tiered generation: one concurrent request per tier, assembled in tier order.
+"""
+
+import json
+import time
+from unittest import mock
+
+from backend import llm_questions
+from backend.llm_questions import TIERS, assemble_tiers, get_questions_from_huggingface, parse_fallback_questions
+from benchmarks.backend_bench import load_corpus, stubbed_provider, StubResponse
+
+
+def _questions(prefix, n):
+    base = parse_fallback_questions()
+    return [dict(base[i % len(base)], text=f"{prefix} {i}?") for i in range(n)]
+
+
+def test_assemble_in_tier_order():
+    easy, medium, hard = _questions("easy", 6), _questions("medium", 4), _questions("hard", 4)
+    # a repeat of an easy question is skipped, the next one is used
+    medium.insert(1, easy[0])
+    game = assemble_tiers([easy, medium, hard])
+    assert [q["text"] for q in game] == [q["text"] for q in easy[:4] + medium[:1] + medium[2:5] + hard]
+    assert [q["tier"] for q in game] == ["easy"] * 4 + ["medium"] * 4 + ["hard"] * 4
+
+
+def test_short_tier_topped_up_in_place():
+    game = assemble_tiers([_questions("easy", 4), [], _questions("hard", 5)])
+    assert len(game) == 12
+    texts = {q["text"] for q in parse_fallback_questions()}
+    assert [q["text"] in texts for q in game] == [False] * 4 + [True] * 4 + [False] * 4
+    assert [q["tier"] for q in game][4:8] == ["medium"] * 4
+
+    assert assemble_tiers([_questions("easy", 4), [], []]) == parse_fallback_questions()
+
+
+def test_tiers_requested_concurrently():
+    text = next(e["generated_text"] for e in load_corpus() if e["name"] == "clean_3")
+    payloads = []
+
+    def post(url, headers=None, json=None, timeout=None):
+        payloads.append(json)
+        time.sleep(0.3)
+        return StubResponse(text)
+
+    with stubbed_provider(text), mock.patch("requests.post", new=post):
+        start = time.perf_counter()
+        questions = get_questions_from_huggingface("Chemistry")
+        took = time.perf_counter() - start
+
+    assert took < 0.6
+    assert len(questions) == 12
+    budgets = sorted(p["parameters"]["max_new_tokens"] for p in payloads)
+    assert budgets == sorted(tokens for _, _, tokens in TIERS)
+    for (_, description, _), payload in zip(TIERS, sorted(payloads, key=lambda p: p["parameters"]["max_new_tokens"])):
+        assert description in payload["inputs"]
+        assert "exactly 4" in payload["inputs"]
+
+
+def test_one_failed_tier_is_topped_up():
+    text = next(e["generated_text"] for e in load_corpus() if e["name"] == "clean_4")
+    calls = []
+
+    def post(url, headers=None, json=None, timeout=None):
+        calls.append(json)
+        if "expert" in json["inputs"]:
+            raise ConnectionError("boom")
+        return StubResponse(text)
+
+    with stubbed_provider(text), mock.patch("requests.post", new=post):
+        questions = get_questions_from_huggingface("Chemistry")
+    assert len(calls) == 3
+    builtin = [llm_questions.is_builtin(q) for q in questions]
+    assert builtin == [False] * 8 + [True] * 4
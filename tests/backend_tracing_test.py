@@ -0,0 +1,51 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+"""
+Tracing tests: a game start produces one trace with correctly nested spans
+in a file trace viewers can load.
+"""
+
+import json
+
+from backend import tracing
+from backend.game_engine import QuizGame
+from benchmarks.backend_bench import load_corpus, stubbed_provider
+
+
+def test_game_start_trace(tmp_path):
+    path = tmp_path / "trace.json"
+    tracing.configure(str(path))
+    try:
+        entry = next(e for e in load_corpus() if e["name"] == "clean_2")
+        with stubbed_provider(entry["generated_text"]):
+            assert QuizGame().start_new_game("Space")
+    finally:
+        tracing.configure(None)
+
+    # Chrome's JSON array format: "[" then one event per line, array left open
+    raw = path.read_text()
+    assert raw.startswith("[\n")
+    json.loads(raw.rstrip().rstrip(",") + "]")
+
+    events = {e["name"]: e for e in tracing.read_trace(path)}
+    assert {"game.start", "llm.get_questions", "llm.huggingface", "llm.fetch",
+            "llm.parse", "llm.validate"} <= set(events)
+    assert len({e["args"]["trace_id"] for e in events.values()}) == 1
+
+    root = events["game.start"]
+    assert "parent_id" not in root["args"]
+    assert events["llm.get_questions"]["args"]["parent_id"] == root["args"]["span_id"]
+    assert events["llm.validate"]["args"]["valid"] == 12
+    assert events["llm.fetch"]["args"]["status"] == 200
+    for e in events.values():
+        assert e["ph"] == "X"
+        assert root["ts"] <= e["ts"] and e["ts"] + e["dur"] <= root["ts"] + root["dur"] + 1
+
+
+def test_disabled_is_noop():
+    tracing.configure(None)
+    with tracing.span("anything", a=1) as s:
+        s.set(b=2)
+        assert tracing.current_trace_id() is None
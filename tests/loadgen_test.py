@@ -0,0 +1,44 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+"""
+Load generator smoke test: a short ramp step produces sane numbers.
+"""
+
+import threading
+from unittest import mock
+
+from backend.game_engine import QuizGame
+from benchmarks.loadgen import percentile, run_step, Player
+from benchmarks.backend_bench import load_corpus, stubbed_provider
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([], 95) == 0.0
+
+
+def test_short_step():
+    text = next(e["generated_text"] for e in load_corpus() if e["kind"] == "valid")
+    with stubbed_provider(text):
+        result = run_step(players=4, duration=0.3, topics=["Science"], think=0.005, accuracy=0.8, seed=3)
+    assert result["games_per_sec"] > 0
+    assert result["answers_per_sec"] > 0
+    assert 0 < result["answer_p50_ms"] <= result["answer_p99_ms"]
+    assert result["kib_per_session"] > 0
+
+
+def test_failed_starts_wait_and_are_not_timed():
+    stop = threading.Event()
+    player = Player(3, ["Science"], think=0.05, accuracy=0.8, stop=stop)
+    with mock.patch.object(QuizGame, "start_new_game", return_value=False):
+        player.start()
+        stop.wait(0.3)
+        stop.set()
+        player.join()
+    # one try per think, not a busy loop
+    assert 0 < player.failed_starts < 30
+    assert player.start_latencies == [] and player.games == 0
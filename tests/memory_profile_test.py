@@ -0,0 +1,25 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+"""
+Memory profiling tests: sessions are attributed to the question pipeline,
+a fixed-size session store stops growing, and static screens allocate no
+surfaces per frame.
+"""
+
+from benchmarks.memory_profile import profile_sessions, profile_ui
+
+
+def test_sessions_profile():
+    result = profile_sessions(count=40, checkpoints=2, churn=80)
+    assert 1000 < result["bytes_per_session"] < 64 * 1024
+    assert max(result["subsystems"], key=result["subsystems"].get) == "questions"
+    # 80 replaced games must not leave their questions behind
+    assert result["churn_growth_kib"] < 0.25 * result["bytes_per_session"] * 40 / 1024
+
+
+def test_no_surfaces_per_frame(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    for name, values in profile_ui(frames=5).items():
+        assert values["surfaces_per_frame"] == 0, name
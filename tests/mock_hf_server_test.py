@@ -0,0 +1,71 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+"""
+Mock Hugging Face server tests: the question pipeline runs against it
+through HF_API_BASE_URL, and injected faults end in the fallback set.
+"""
+
+import json
+
+import requests
+
+from backend import llm_questions, metrics
+from backend.llm_questions import get_questions_from_llm, parse_fallback_questions
+from benchmarks.mock_hf_server import MockHFServer, MockConfig
+
+
+def _point_at(monkeypatch, server):
+    monkeypatch.setenv("HF_API_BASE_URL", server.url)
+    monkeypatch.setenv("HUGGINGFACE_API_TOKEN", "test")
+    monkeypatch.setattr(llm_questions, "_env_loaded", True)
+
+
+def test_questions_from_mock(monkeypatch):
+    with MockHFServer(MockConfig(latency="fixed:5")) as server:
+        _point_at(monkeypatch, server)
+        questions = get_questions_from_llm("Science")
+        # one request per difficulty tier
+        assert server.stats["ok"] == len(llm_questions.TIERS)
+    assert len(questions) == 12
+    assert questions != parse_fallback_questions()
+    assert [q["tier"] for q in questions] == ["easy"] * 4 + ["medium"] * 4 + ["hard"] * 4
+
+
+def test_faults_fall_back(monkeypatch):
+    http_errors = metrics.LLM_FETCH_ERRORS.labels("http_status").value
+    network_errors = metrics.LLM_FETCH_ERRORS.labels("network").value
+
+    with MockHFServer(MockConfig(error_503=1.0)) as server:
+        _point_at(monkeypatch, server)
+        assert get_questions_from_llm() == parse_fallback_questions()
+    assert metrics.LLM_FETCH_ERRORS.labels("http_status").value == http_errors + 3
+
+    with MockHFServer(MockConfig(timeout_rate=1.0, hang_seconds=1.0)) as server:
+        _point_at(monkeypatch, server)
+        monkeypatch.setenv("HF_API_TIMEOUT", "0.2")
+        assert get_questions_from_llm() == parse_fallback_questions()
+    assert metrics.LLM_FETCH_ERRORS.labels("network").value == network_errors + 3
+
+
+def test_rate_limit():
+    with MockHFServer(MockConfig(rps=2)) as server:
+        codes = [
+            requests.post(f"{server.url}/m", json={"inputs": "x"}, headers={"Authorization": "Bearer t"}).status_code
+            for _ in range(4)
+        ]
+    assert codes[:2] == [200, 200]
+    assert 429 in codes[2:]
+
+
+def test_streaming():
+    with MockHFServer(MockConfig()) as server:
+        response = requests.post(
+            f"{server.url}/m", json={"inputs": "x", "stream": True},
+            headers={"Authorization": "Bearer t"}, stream=True,
+        )
+        events = [json.loads(line[5:]) for line in response.iter_lines() if line.startswith(b"data:")]
+    text = "".join(e["token"]["text"] for e in events)
+    assert events[-1]["generated_text"] == text
+    assert all(e["generated_text"] is None for e in events[:-1])
@@ -0,0 +1,119 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+"""
+mmap question bank: build, random access, indexes and the fallback path.
+"""
+
+import random
+import shutil
+import tracemalloc
+from unittest import mock
+
+from backend import question_bank, search_index
+from backend.llm_questions import get_questions_from_llm, parse_fallback_questions
+
+
+def _bank(n):
+    base = parse_fallback_questions()
+    for i in range(n):
+        q = base[i % len(base)]
+        yield dict(q, text=f"{q['text']} #{i}", topic=f"Topic {i % 5}", tier=question_bank.TIERS[i % 3])
+
+
+def test_build_and_read(tmp_path):
+    path = str(tmp_path / "bank.qbank")
+    questions = list(_bank(500))
+    assert question_bank.build(iter(questions), path) == 500
+    with question_bank.QuestionBank(path) as bank:
+        assert len(bank) == 500
+        assert bank[0] == questions[0]
+        assert bank[-1] == questions[-1]
+        assert bank[10:13] == questions[10:13]
+        assert sorted(bank.topics()) == [f"topic {i}" for i in range(5)]
+        assert list(bank.ids(topic="  TOPIC 3 ")) == list(range(3, 500, 5))
+        assert list(bank.ids(tier="hard")) == list(range(2, 500, 3))
+        assert len(bank.ids(topic="unknown")) == 0
+
+
+def test_draw_is_tiered(tmp_path):
+    path = str(tmp_path / "bank.qbank")
+    question_bank.build(_bank(300), path)
+    with question_bank.QuestionBank(path) as bank:
+        rng = random.Random(1)
+        drawn = bank.draw(12, rng=rng)
+        assert [q["tier"] for q in drawn] == ["easy"] * 4 + ["medium"] * 4 + ["hard"] * 4
+        assert len({q["text"] for q in drawn}) == 12
+
+        on_topic = bank.draw(12, topic="Topic 2", rng=rng)
+        assert {q["topic"] for q in on_topic} == {"Topic 2"}
+        ranks = [question_bank.TIERS.index(q["tier"]) for q in on_topic]
+        assert ranks == sorted(ranks)
+
+
+def test_compressed_records(tmp_path):
+    questions = list(_bank(3000))
+    sizes = {}
+    for codec in ("none", "zlib"):
+        path = str(tmp_path / f"{codec}.qbank")
+        question_bank.build(iter(questions), path, codec=codec)
+        with question_bank.QuestionBank(path) as bank:
+            assert bank.codec.name == codec
+            assert bank[2999] == questions[2999]
+            assert bank.raw_bytes == sizes.get("none", bank.data_bytes)
+            sizes[codec] = bank.data_bytes
+    assert sizes["zlib"] < sizes["none"] / 3
+
+
+def test_open_does_not_load_questions(tmp_path):
+    path = str(tmp_path / "bank.qbank")
+    question_bank.build(_bank(20000), path)
+    tracemalloc.start()
+    bank = question_bank.QuestionBank(path)
+    bank.draw(12)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    bank.close()
+    # the decompressor primed with the dictionary is most of this
+    assert peak < 256 * 1024
+    assert peak < bank.raw_bytes / 10
+
+
+def test_fetch_failure_draws_from_bank(tmp_path):
+    path = str(tmp_path / "bank.qbank")
+    question_bank.build(_bank(120), path)
+    with mock.patch.dict(os.environ, {"QUIZZIFY_QUESTION_BANK": path, "HUGGINGFACE_API_TOKEN": ""}):
+        questions = get_questions_from_llm("topic 4")
+    assert len(questions) == 12
+    assert {q["topic"] for q in questions} == {"Topic 4"}
+
+    with mock.patch.dict(os.environ, {"HUGGINGFACE_API_TOKEN": ""}):
+        os.environ.pop("QUIZZIFY_QUESTION_BANK", None)
+        assert get_questions_from_llm("topic 4") == parse_fallback_questions()
+
+
+def test_stale_index_is_ignored(tmp_path):
+    old = str(tmp_path / "old.qbank")
+    question_bank.build(_bank(600), old)
+    with question_bank.QuestionBank(old) as bank:
+        search_index.build(bank, search_index.index_path(old))
+    # a smaller bank next to the index of the bigger one
+    path = str(tmp_path / "bank.qbank")
+    question_bank.build(_bank(60), path)
+    shutil.copy(search_index.index_path(old), search_index.index_path(path))
+    with mock.patch.dict(os.environ, {"QUIZZIFY_QUESTION_BANK": path, "HUGGINGFACE_API_TOKEN": ""}):
+        questions = get_questions_from_llm("Topic 4")
+    assert len(questions) == 12
+    assert {q["topic"] for q in questions} == {"Topic 4"}
+
+
+def test_default_bank_closes_the_previous_one(tmp_path):
+    paths = [str(tmp_path / f"{name}.qbank") for name in ("a", "b")]
+    for path in paths:
+        question_bank.build(_bank(20), path)
+    with mock.patch.dict(os.environ, {"QUIZZIFY_QUESTION_BANK": paths[0]}):
+        first = question_bank.default_bank()
+    with mock.patch.dict(os.environ, {"QUIZZIFY_QUESTION_BANK": paths[1]}):
+        assert question_bank.default_bank().path == paths[1]
+    assert first._map.closed
@@ -0,0 +1,82 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+"""
+Streaming import and export of question banks.
+"""
+
+import json
+import tracemalloc
+
+from backend import question_io
+from backend.llm_questions import parse_fallback_questions
+
+
+def _write_jsonl(path, records):
+    with open(path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(record if isinstance(record, str) else json.dumps(record))
+            f.write("\n")
+
+
+def _bank(n):
+    base = parse_fallback_questions()
+    for i in range(n):
+        q = base[i % len(base)]
+        yield dict(q, text=f"{q['text']} #{i}", topic=f"topic {i % 7}", tier=("easy", "medium", "hard")[i % 3])
+
+
+def test_round_trip_jsonl_csv(tmp_path):
+    questions = list(_bank(30))
+    _write_jsonl(tmp_path / "bank.jsonl", questions)
+    result = question_io.convert(str(tmp_path / "bank.jsonl"), str(tmp_path / "bank.csv"), batch_size=7)
+    assert result == {"read": 30, "written": 30, "rejected": 0}
+
+    question_io.convert(str(tmp_path / "bank.csv"), str(tmp_path / "again.jsonl"), batch_size=7)
+    assert list(question_io.iter_questions(str(tmp_path / "again.jsonl"))) == questions
+
+
+def test_errors_report_line_numbers(tmp_path):
+    good = next(_bank(1))
+    bad = dict(good, answer="e")
+    _write_jsonl(tmp_path / "bank.jsonl", [good, "{not json", "", bad, good])
+    errors = []
+    questions = list(question_io.iter_questions(str(tmp_path / "bank.jsonl"), batch_size=2,
+                                                on_error=errors.append))
+    assert len(questions) == 2
+    assert [(e.index, e.field) for e in errors] == [(2, ""), (4, "answer")]
+
+
+def test_csv_header_required(tmp_path):
+    (tmp_path / "bank.csv").write_text("question,a,b\nx,1,2\n", encoding="utf-8")
+    try:
+        list(question_io.iter_questions(str(tmp_path / "bank.csv")))
+    except ValueError as e:
+        assert "text" in str(e)
+    else:
+        assert False, "missing columns accepted"
+
+
+def test_import_memory_is_flat(tmp_path):
+    """Peak memory does not grow with the number of rows."""
+    def peak(n):
+        path = str(tmp_path / f"bank_{n}.jsonl")
+        _write_jsonl(path, _bank(n))
+        tracemalloc.start()
+        count = sum(1 for _ in question_io.iter_questions(path, batch_size=256))
+        _, top = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert count == n
+        return top
+
+    assert peak(20000) < 2 * peak(2000)
+
+
+def test_export_generated_skips_builtin(tmp_path):
+    path = str(tmp_path / "generated.jsonl")
+    fallback = parse_fallback_questions()
+    new = dict(fallback[0], text="Which language is this game written in?")
+    assert question_io.export_generated(path, "Python", fallback) == 0
+    assert question_io.export_generated(path, "Python", fallback[:3] + [new]) == 1
+    assert list(question_io.iter_questions(path)) == [dict(new, topic="Python")]
@@ -0,0 +1,116 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+"""
+Hedged model requests and the provider circuit breaker.
+"""
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from backend import metrics
+from backend import resilience
+from backend.llm_questions import get_questions_from_llm, parse_fallback_questions
+from benchmarks.backend_bench import load_corpus, stubbed_provider, StubResponse
+
+
+def test_breaker_opens_and_probes():
+    now = [0.0]
+    breaker = resilience.CircuitBreaker("test", failures=3, cooldown=10, clock=lambda: now[0])
+    breaker.failure()
+    breaker.failure()
+    breaker.success()
+    breaker.failure()
+    breaker.failure()
+    assert breaker.allow() and breaker.state == "closed"
+    breaker.failure()
+    assert breaker.state == "open" and not breaker.allow()
+
+    now[0] = 10
+    assert breaker.allow() and breaker.state == "half_open"
+    # one probe at a time
+    assert not breaker.allow()
+    breaker.failure()
+    assert breaker.state == "open" and not breaker.allow()
+
+    now[0] = 20
+    assert breaker.allow()
+    breaker.success()
+    assert breaker.state == "closed" and breaker.allow()
+
+    off = resilience.CircuitBreaker("off", failures=0)
+    for _ in range(10):
+        off.failure()
+    assert off.allow()
+
+
+def test_hedge_answers_first():
+    calls = []
+    lock = threading.Lock()
+
+    def fetch(prompt):
+        with lock:
+            calls.append(prompt)
+            slow = len(calls) == 1
+        time.sleep(0.5 if slow else 0.0)
+        return "slow" if slow else "fast"
+
+    won = metrics.LLM_HEDGED_REQUESTS.labels("hedge").value
+    with ThreadPoolExecutor(4) as pool:
+        start = time.perf_counter()
+        assert resilience.hedged(pool, 0.05, fetch, "q") == "fast"
+        assert time.perf_counter() - start < 0.4
+        assert len(calls) == 2
+        assert metrics.LLM_HEDGED_REQUESTS.labels("hedge").value == won + 1
+
+        # answered in time: no second request; failed in time: raised, not hedged
+        calls.clear()
+        calls.append("already slow")
+        assert resilience.hedged(pool, 0.2, fetch, "q") == "fast"
+        assert len(calls) == 2
+
+        def fail(prompt):
+            calls.append(prompt)
+            raise ConnectionError("down")
+
+        calls.clear()
+        with pytest.raises(ConnectionError):
+            resilience.hedged(pool, 0.2, fail, "q")
+        assert len(calls) == 1
+
+
+def test_open_circuit_skips_the_provider():
+    text = next(e["generated_text"] for e in load_corpus() if e["name"] == "clean_3")
+    posts = []
+    up = [False]
+
+    def post(url, headers=None, json=None, timeout=None):
+        posts.append(json)
+        if not up[0]:
+            raise ConnectionError("down")
+        return StubResponse(text)
+
+    resilience.reset()
+    skipped = metrics.FALLBACKS.labels("circuit_open").value
+    settings = {"HF_API_BREAKER_FAILURES": "2", "HF_API_BREAKER_COOLDOWN": "0.1"}
+    with stubbed_provider(text), mock.patch("requests.post", new=post), mock.patch.dict(os.environ, settings):
+        for _ in range(2):
+            assert get_questions_from_llm("Chemistry") == parse_fallback_questions()
+        assert len(posts) == 6
+
+        # open: straight to the fallback, no request
+        assert get_questions_from_llm("Chemistry") == parse_fallback_questions()
+        assert len(posts) == 6
+        assert metrics.FALLBACKS.labels("circuit_open").value == skipped + 1
+
+        # after the cooldown a probe game goes through and closes the circuit
+        time.sleep(0.1)
+        up[0] = True
+        assert get_questions_from_llm("Chemistry") != parse_fallback_questions()
+        assert len(posts) == 9
+    resilience.reset()
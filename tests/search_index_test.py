@@ -0,0 +1,68 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+"""
+BM25 search over a question bank and the on-topic fallback it drives.
+"""
+
+from unittest import mock
+
+from backend import question_bank, search_index
+from backend.llm_questions import get_questions_from_llm
+
+
+SUBJECTS = {
+    "Astronomy": ["planet", "star", "galaxy", "orbit", "comet", "telescope"],
+    "Roman History": ["emperor", "legion", "senate", "caesar", "rome", "gladiator"],
+    "Python Programming": ["python", "list", "dictionary", "function", "decorator", "generator"],
+}
+
+
+def _questions():
+    for topic, words in SUBJECTS.items():
+        for i in range(20):
+            word = words[i % len(words)]
+            yield {
+                "text": f"Question {i} about the {word}?",
+                "options": {"a": f"{word} one", "b": "two", "c": "three", "d": "four"},
+                "answer": "a",
+                "topic": topic,
+                "tier": question_bank.TIERS[i % 3],
+            }
+
+
+def _build(tmp_path):
+    path = str(tmp_path / "bank.qbank")
+    question_bank.build(_questions(), path)
+    with question_bank.QuestionBank(path) as bank:
+        search_index.build(bank, search_index.index_path(path))
+    return path
+
+
+def test_tokenize():
+    assert search_index.tokenize("What are the Planets of the Solar-System?") == ["planet", "solar", "system"]
+    assert search_index.tokenize("class glass") == ["class", "glass"]
+
+
+def test_search_ranks_topic_first(tmp_path):
+    path = _build(tmp_path)
+    with question_bank.QuestionBank(path) as bank, search_index.SearchIndex(search_index.index_path(path)) as index:
+        hits = index.search("roman emperors", limit=20)
+        assert hits[0][1] >= hits[-1][1]
+        assert {bank[n]["topic"] for n, _ in hits} == {"Roman History"}
+        assert index.search("zebra") == []
+
+        # "question" is in every document; it is only used when nothing rarer matches
+        assert len(index.search("question", limit=100)) == 60
+        assert {bank[n]["topic"] for n, _ in index.search("question comet", limit=100)} == {"Astronomy"}
+
+
+def test_fallback_stays_on_topic(tmp_path):
+    path = _build(tmp_path)
+    with mock.patch.dict(os.environ, {"QUIZZIFY_QUESTION_BANK": path, "HUGGINGFACE_API_TOKEN": ""}):
+        questions = get_questions_from_llm("python decorators and generators")
+    assert len(questions) == 12
+    assert {q["topic"] for q in questions} == {"Python Programming"}
+    ranks = [question_bank.TIERS.index(q["tier"]) for q in questions]
+    assert ranks == sorted(ranks)
@@ -0,0 +1,67 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+"""
+Semantic topic cache: hashed n-gram similarity, eviction and reuse before a model call.
+"""
+
+import json
+from unittest import mock
+
+from backend import metrics
+from backend.topic_cache import TopicCache, embed
+from backend.llm_questions import get_questions_from_llm
+from benchmarks.backend_bench import load_corpus, stubbed_provider
+
+
+def _similarity(a, b):
+    a, b = embed(a), embed(b)
+    return sum(value * b.get(bucket, 0.0) for bucket, value in a.items())
+
+
+def test_similar_topics_match():
+    assert abs(_similarity("Python programming", "Programming in PYTHON") - 1) < 1e-9
+    assert _similarity("Python programming", "python programing") >= 0.8
+    assert _similarity("Python programming", "Java programming") < 0.8
+    assert _similarity("Roman history", "Greek history") < 0.8
+    assert embed("the of and") == {}
+
+
+def test_get_and_eviction():
+    cache = TopicCache(capacity=2)
+    cache.put("World History", ["history"])
+    cache.put("Astronomy", ["astronomy"])
+    questions, match, similarity = cache.get("history of the world")
+    assert (questions, match) == (["history"], "world history")
+    assert similarity > 0.999
+    assert cache.get("Football") is None
+
+    # Astronomy is now the least recently used
+    cache.put("Football", ["football"])
+    assert len(cache) == 2
+    assert cache.get("astronomy") is None
+    assert cache.get("football")[0] == ["football"]
+    assert cache.nearest("world histories", k=2)[0][1] == "world history"
+
+
+def test_sets_stored_compressed():
+    text = next(e["generated_text"] for e in load_corpus() if e["name"] == "long_2")
+    questions = json.loads(text)
+    cache = TopicCache(capacity=4)
+    cache.put("Astronomy", questions)
+    assert cache.get("astronomy")[0] == questions
+    assert cache.stored_bytes() < len(json.dumps(questions, separators=(",", ":"))) / 3
+
+
+def test_reused_before_network():
+    text = next(e["generated_text"] for e in load_corpus() if e["name"] == "clean_1")
+    with mock.patch.dict(os.environ, {"QUIZZIFY_TOPIC_CACHE_SIZE": "8"}):
+        with stubbed_provider(text):
+            generated = get_questions_from_llm("Python Programming")
+        assert [q["text"] for q in generated] == [q["text"] for q in json.loads(text)]
+
+        hits = metrics.TOPIC_CACHE_LOOKUPS.labels("hit").value
+        with mock.patch("requests.post", side_effect=AssertionError("model called")):
+            assert get_questions_from_llm("programming in python") == generated
+        assert metrics.TOPIC_CACHE_LOOKUPS.labels("hit").value == hits + 1
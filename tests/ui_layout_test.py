@@ -0,0 +1,39 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+"""
+Layout engine tests: the design size reproduces the original mobile
+rects, other sizes scale and stay on screen, and layouts are cached.
+"""
+
+import pygame
+
+from ui.layout import get_layout, DESIGN_WIDTH, DESIGN_HEIGHT
+
+
+def test_design_size_matches_original_rects():
+    """At 480x750 the layout equals the original hand-placed rects."""
+    layout = get_layout(DESIGN_WIDTH, DESIGN_HEIGHT)
+    assert layout.start_button == pygame.Rect(120, 600, 240, 65)
+    assert layout.question_card == pygame.Rect(30, 80, 420, 160)
+    assert layout.option_rects[3] == pygame.Rect(40, 510, 400, 65)
+    assert layout.submit_button == pygame.Rect(120, 660, 240, 55)
+    assert layout.result_home == pygame.Rect(50, 640, 160, 55)
+    assert layout.result_restart == pygame.Rect(270, 640, 160, 55)
+
+
+def test_scaled_layout_fits_window():
+    """Every rect stays inside a large landscape window."""
+    layout = get_layout(1920, 1080)
+    window = pygame.Rect(0, 0, 1920, 1080)
+    for rect in layout.option_rects + [layout.start_button, layout.result_home, layout.result_restart]:
+        assert window.contains(rect)
+    assert layout.fonts.question.get_height() > get_layout(DESIGN_WIDTH, DESIGN_HEIGHT).fonts.question.get_height()
+
+
+def test_layout_cached_per_size():
+    """Resizing back to a known size reuses the computed layout."""
+    assert get_layout(800, 600) is get_layout(800, 600)
+    layout = get_layout(800, 600)
+    assert layout.wrap("a few words to wrap", "option", 60) is layout.wrap("a few words to wrap", "option", 60)
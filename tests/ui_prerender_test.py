@@ -0,0 +1,41 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+"""
+Pre-render pipeline test: prepared question surfaces draw the same
+pixels as live text layout.
+"""
+
+import time
+
+import pygame
+
+from backend.llm_questions import parse_fallback_questions
+
+
+def test_prepared_matches_live(monkeypatch):
+    """Every question gets prepared, and blitting it matches live rendering."""
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    import ui.pygame_ui as ui
+    ui.init_display()
+
+    questions = parse_fallback_questions()
+    pipeline = ui.RenderPipeline(ui.COLOR_QUESTION_TEXT, ui.COLOR_OPTION_TEXT)
+    pipeline.start(questions, ui.layout)
+
+    deadline = time.time() + 5
+    while pipeline.get(len(questions) - 1, ui.layout) is None and time.time() < deadline:
+        time.sleep(0.01)
+
+    for index in (0, len(questions) - 1):
+        q = questions[index]
+        options = [q["options"][k] for k in "abcd"]
+        ui.draw_question_screen(q["text"], options, None, index + 1)
+        live = pygame.image.tobytes(ui.screen, "RGB")
+        ui.draw_question_screen(q["text"], options, None, index + 1, pipeline.get(index, ui.layout))
+        assert pygame.image.tobytes(ui.screen, "RGB") == live
+
+    # A different layout must not be served stale surfaces
+    from ui.layout import get_layout
+    assert pipeline.get(0, get_layout(800, 600)) is None
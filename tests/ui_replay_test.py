@@ -0,0 +1,51 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+"""
+Replay harness test: recordings round-trip through the binary format and
+a replayed session drives the real UI loop to the end.
+"""
+
+import pygame
+
+from ui.replay import EventRecorder, load_recording
+
+
+def test_recording_round_trip(tmp_path):
+    recorder = EventRecorder((480, 750))
+    recorder.add(0, pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(120, 300), button=1))
+    recorder.add(250, pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE))
+    recorder.add(260, pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT))
+    recorder.add(300, pygame.event.Event(pygame.VIDEORESIZE, w=800, h=600, size=(800, 600)))
+    recorder.record(pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 1)))  # not recorded
+    path = tmp_path / "session.qzr"
+    recorder.save(path)
+
+    size, events = load_recording(path)
+    assert size == (480, 750)
+    assert [t for t, _ in events] == [0, 250, 260, 300]
+    assert events[0][1].pos == (120, 300) and events[0][1].button == 1
+    assert events[1][1].key == pygame.K_ESCAPE
+    # arrow keys are above 0x40000000
+    assert events[2][1].key == pygame.K_RIGHT
+    assert (events[3][1].w, events[3][1].h) == (800, 600)
+
+
+def test_replay_reaches_result(monkeypatch):
+    """The bundled session plays a full game through run_quiz_ui."""
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    import ui.pygame_ui as ui
+    from ui.replay import EventPlayer
+    from benchmarks.replay_bench import SESSIONS_DIR, seeded_factory
+
+    _, events = load_recording(os.path.join(SESSIONS_DIR, "full_game.qzr"))
+    states = []
+    ui.run_quiz_ui(
+        game_factory=seeded_factory(1234),
+        player=EventPlayer(events, speed=10),
+        frame_hook=lambda state, seconds: states.append(state),
+        exit_on_quit=False,
+    )
+    assert "result" in states
+    assert states[-1] == "start"
@@ -0,0 +1,90 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+"""
+UI startup tests: the UI module must import without a display,
+and fonts must be created lazily through the font path cache.
+"""
+
+import json
+import subprocess
+
+import pygame
+
+
+def test_import_without_display():
+    """Importing the UI opens no window (checked in a fresh interpreter)."""
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    code = (
+        "import pygame, ui.pygame_ui as ui\n"
+        "assert ui.screen is None\n"
+        "assert not pygame.display.get_init()\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_font_paths_cached(tmp_path, monkeypatch):
+    """First lookup writes the cache file, later lookups reuse it."""
+    from ui.resources import FontBook
+    monkeypatch.setenv("QUIZZIFY_CACHE_DIR", str(tmp_path))
+
+    fonts = FontBook({"title": ("arial", 30, True, False)})
+    assert fonts.title.get_height() > 0
+    assert fonts.title is fonts.title
+
+    cache = json.loads((tmp_path / FontBook.CACHE_FILE).read_text())
+    assert "arial|1|0" in cache
+
+    # A fresh book must not rescan: poison SysFont and resolve again
+    monkeypatch.setattr(pygame.font, "SysFont", None)
+    other = FontBook({"title": ("arial", 12, True, False)})
+    assert other.title.get_height() > 0
+
+
+def test_atlas_up_to_date():
+    """The committed atlas was built from the current manifest."""
+    from ui.assets import load_manifest, ASSETS_DIR
+    manifest, digest = load_manifest()
+    with open(os.path.join(ASSETS_DIR, manifest["index"]), "r", encoding="utf-8") as f:
+        index = json.load(f)
+    assert index["manifest_sha1"] == digest, "run: python -m ui.assets build"
+    assert set(index["rects"]) == set(manifest["images"])
+
+
+def test_pack_no_overlap():
+    """Packed rectangles never overlap and fit inside the atlas."""
+    from ui.assets import pack
+    sizes = {f"img{i}": (10 + i * 7, 40 - i * 3) for i in range(10)}
+    (w, h), rects = pack(sizes, padding=2)
+    boxes = [pygame.Rect(r) for r in rects.values()]
+    for i, a in enumerate(boxes):
+        assert a.right <= w and a.bottom <= h
+        assert a.collidelist(boxes[i + 1:]) == -1
+
+
+def test_fonts_opened_from_threads(tmp_path, monkeypatch):
+    """Worker threads (prerender) and the main thread can open fonts at once."""
+    import threading
+    from ui.resources import FontBook
+    monkeypatch.setenv("QUIZZIFY_CACHE_DIR", str(tmp_path))
+
+    families = [f"nosuchfont{i}" for i in range(16)]
+    books = [FontBook({"body": (family, 14, False, False)}) for family in families]
+    errors = []
+
+    def open_font(book):
+        try:
+            assert book.private("body").get_height() > 0
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=open_font, args=(book,)) for book in books]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    cache = json.loads((tmp_path / FontBook.CACHE_FILE).read_text())
+    assert all(f"{family}|0|0" in cache for family in families)
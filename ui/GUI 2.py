@@ -2,11 +2,17 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import threading
 import tkinter as tk
 from tkinter import messagebox
 from backend.game_engine import QuizGame
+from backend import metrics
+from backend import logs
 
 class QuizzifyGUI(tk.Tk):
+    # How often the main loop checks on a game being started (ms)
+    START_POLL_MS = 100
+
     def __init__(self):
         super().__init__()
         self.title("Quizzify - Quiz Master")
@@ -15,17 +21,37 @@ class QuizzifyGUI(tk.Tk):
         
         # Initialize game engine
         self.game = QuizGame()
+        self.start_thread = None
+        self.start_result = None
+        
+        # Every screen is built once; switching screens only packs/unpacks
+        # frames and question transitions only reconfigure widgets.
+        self.current_screen = None
+        self.screens = {
+            "home": self.build_home_screen(),
+            "question": self.build_question_screen(),
+            "results": self.build_results_screen(),
+        }
         
         # Show home screen
         self.home_screen()
 
-    def home_screen(self):
+    def show_screen(self, name, bg):
+        """Swap the visible screen frame"""
+        if self.current_screen is not None:
+            self.screens[self.current_screen].pack_forget()
+        self.configure(bg=bg)
+        if name == "question":
+            self.screens[name].pack(expand=True, fill='both', padx=20, pady=20)
+        elif name == "results":
+            self.screens[name].pack(expand=True, fill='both', padx=30, pady=30)
+        else:
+            self.screens[name].pack(expand=True, fill='both')
+        self.current_screen = name
+
+    def build_home_screen(self):
         """Home Screen - Yellow background"""
-        self.clear()
-        self.configure(bg='#FFC107')
-        
         container = tk.Frame(self, bg='#FFC107')
-        container.pack(expand=True, fill='both')
         
         # Top spacing
         tk.Label(container, bg='#FFC107', height=2).pack()
@@ -58,60 +84,78 @@ class QuizzifyGUI(tk.Tk):
         tk.Frame(container, bg='#000000', height=3).pack(fill='x', padx=50, pady=10)
         
         # Play button
-        tk.Button(container, text="PLAY NOW",
-                 font=('Arial', 18, 'bold'),
-                 bg='#000000', fg='#FFC107',
-                 activebackground='#333333', activeforeground='#FFC107',
-                 relief='raised', bd=6, padx=50, pady=18,
-                 cursor='hand2', command=self.start_game).pack(pady=30)
+        self.play_btn = tk.Button(container, text="PLAY NOW",
+                                  font=('Arial', 18, 'bold'),
+                                  bg='#000000', fg='#FFC107',
+                                  activebackground='#333333', activeforeground='#FFC107',
+                                  relief='raised', bd=6, padx=50, pady=18,
+                                  cursor='hand2', command=self.start_game)
+        self.play_btn.pack(pady=30)
+        return container
+
+    def home_screen(self):
+        """Show the home screen"""
+        self.show_screen("home", '#FFC107')
 
     def start_game(self):
-        """Start new game"""
-        success = self.game.start_new_game()
-        if success:
+        """Start new game without blocking the Tk main loop"""
+        if self.start_thread is not None:
+            return
+        self.set_loading(True)
+        self.start_result = None
+        self.start_thread = threading.Thread(target=self._start_worker, daemon=True)
+        self.start_thread.start()
+        self.after(self.START_POLL_MS, self.poll_start)
+
+    def _start_worker(self):
+        """Runs on the worker thread; only touches the game, never Tk"""
+        self.start_result = self.game.start_new_game()
+
+    def poll_start(self):
+        """Check whether the worker has finished starting the game"""
+        if self.start_thread.is_alive():
+            self.after(self.START_POLL_MS, self.poll_start)
+            return
+        self.start_thread = None
+        self.set_loading(False)
+        if self.start_result:
             self.show_question()
         else:
             messagebox.showerror("Error", "Failed to start game!")
 
-    def show_question(self):
+    def set_loading(self, loading):
+        """Disable the start buttons while a game is being fetched"""
+        if loading:
+            self.play_btn.config(text="LOADING...", state='disabled')
+            self.restart_btn.config(text="LOADING...", state='disabled')
+        else:
+            self.play_btn.config(text="PLAY NOW", state='normal')
+            self.restart_btn.config(text="RESTART", state='normal')
+
+    def build_question_screen(self):
         """Question Screen - Dark red background"""
-        self.clear()
-        self.configure(bg='#8B0000')
-        
-        # Get current question
-        question_data = self.game.get_current_question()
-        
-        if not question_data:
-            # No more questions, show results
-            self.show_results()
-            return
-        
         container = tk.Frame(self, bg='#8B0000')
-        container.pack(expand=True, fill='both', padx=20, pady=20)
-        
-        # Get difficulty level from backend
-        level_name, points_value = self.game.get_current_level()
         
         # Difficulty level header
-        tk.Label(container, text=level_name.upper(),
-                font=('Arial', 14, 'bold'),
-                bg='#8B0000', fg='#FFC107', pady=5).pack()
+        self.level_label = tk.Label(container,
+                                    font=('Arial', 14, 'bold'),
+                                    bg='#8B0000', fg='#FFC107', pady=5)
+        self.level_label.pack()
         
         tk.Frame(container, bg='#FFFFFF', height=2).pack(fill='x', pady=10)
         
         # Question number
-        progress = self.game.get_progress()
-        q_num = progress["current_question"]
-        
-        tk.Label(container, text=f"{q_num}.",
-                font=('Arial', 14),
-                bg='#8B0000', fg='#FFFFFF').pack(pady=5)
+        self.q_num_label = tk.Label(container,
+                                    font=('Arial', 14),
+                                    bg='#8B0000', fg='#FFFFFF')
+        self.q_num_label.pack(pady=5)
         
         # Question text
-        tk.Label(container, text=question_data["text"],
-                font=('Arial', 16, 'bold'),
-                bg='#8B0000', fg='#FFFFFF',
-                wraplength=380, justify='center').pack(pady=20)
+        self.question_label = tk.Label(container,
+                                       font=('Arial', 16, 'bold'),
+                                       bg='#8B0000', fg='#FFFFFF',
+                                       wraplength=380, justify='center')
+        self.question_label.pack(pady=20)
         
         # Image placeholder
         image_frame = tk.Frame(container, bg='#FFA500', 
@@ -127,8 +171,6 @@ class QuizzifyGUI(tk.Tk):
         self.selected_option = tk.StringVar()
         self.option_buttons = []
         
-        # Get options from backend
-        options = question_data["options"]
         option_keys = ['a', 'b', 'c', 'd']
         
         for i, key in enumerate(option_keys):
@@ -136,7 +178,6 @@ class QuizzifyGUI(tk.Tk):
             col = i % 2
             
             btn = tk.Button(options_frame, 
-                           text=options[key],
                            font=('Arial', 12, 'bold'),
                            bg='#F5E6D3', fg='#000000',
                            activebackground='#FFC107', activeforeground='#000000',
@@ -162,6 +203,35 @@ class QuizzifyGUI(tk.Tk):
                                     state='disabled',
                                     command=self.submit_answer)
         self.submit_btn.pack(pady=15)
+        return container
+
+    def show_question(self):
+        """Fill the question screen with the current question"""
+        # Get current question
+        question_data = self.game.get_current_question()
+        
+        if not question_data:
+            # No more questions, show results
+            self.show_results()
+            return
+        
+        # Get difficulty level and question number from backend
+        level_name, points_value = self.game.get_current_level()
+        progress = self.game.get_progress()
+        
+        self.level_label.config(text=level_name.upper())
+        self.q_num_label.config(text=f"{progress['current_question']}.")
+        self.question_label.config(text=question_data["text"])
+        
+        options = question_data["options"]
+        for key, btn in zip(['a', 'b', 'c', 'd'], self.option_buttons):
+            btn.config(text=options[key], bg='#F5E6D3', fg='#000000')
+        
+        self.selected_option.set("")
+        self.submit_btn.config(state='disabled')
+        
+        if self.current_screen != "question":
+            self.show_screen("question", '#8B0000')
 
     def select_option(self, key, btn_index):
         """Handle option selection"""
@@ -200,18 +270,9 @@ class QuizzifyGUI(tk.Tk):
             # Continue to next question
             self.show_question()
 
-    def show_results(self):
+    def build_results_screen(self):
         """Results Screen - Orange-red background"""
-        self.clear()
-        self.configure(bg='#FF6347')
-        
-        # Get final score and progress
-        score = self.game.get_score()
-        progress = self.game.get_progress()
-        max_score = self.game.get_max_possible_score()
-        
         container = tk.Frame(self, bg='#FF6347')
-        container.pack(expand=True, fill='both', padx=30, pady=30)
         
         # Top spacing
         tk.Label(container, bg='#FF6347', height=1).pack()
@@ -240,9 +301,44 @@ class QuizzifyGUI(tk.Tk):
         score_circle.pack(pady=10)
         score_circle.pack_propagate(False)
         
-        tk.Label(score_circle, text=f"{score}/{max_score}",
-                font=('Arial', 22, 'bold'),
-                bg='#FFFFFF', fg='#8B0000').pack(expand=True)
+        self.score_label = tk.Label(score_circle,
+                                    font=('Arial', 22, 'bold'),
+                                    bg='#FFFFFF', fg='#8B0000')
+        self.score_label.pack(expand=True)
+        
+        self.correct_label = tk.Label(score_card,
+                                      font=('Arial', 13, 'bold'),
+                                      bg='#8B0000', fg='#FFC107', pady=15)
+        self.correct_label.pack()
+        
+        # Buttons
+        btn_frame = tk.Frame(container, bg='#FF6347')
+        btn_frame.pack(pady=25, fill='x')
+        
+        tk.Button(btn_frame, text="HOME",
+                 font=('Arial', 15, 'bold'),
+                 bg='#FFFFFF', fg='#8B0000',
+                 activebackground='#F0F0F0', activeforeground='#8B0000',
+                 relief='raised', bd=5, width=8, height=2,
+                 cursor='hand2', command=self.home_screen).pack(side='left', padx=15, expand=True)
+        
+        self.restart_btn = tk.Button(btn_frame, text="RESTART",
+                                     font=('Arial', 15, 'bold'),
+                                     bg='#FFC107', fg='#8B0000',
+                                     activebackground='#FF9800', activeforeground='#8B0000',
+                                     relief='raised', bd=5, width=8, height=2,
+                                     cursor='hand2', command=self.start_game)
+        self.restart_btn.pack(side='right', padx=15, expand=True)
+        return container
+
+    def show_results(self):
+        """Fill the results screen with the final score"""
+        # Get final score and progress
+        score = self.game.get_score()
+        progress = self.game.get_progress()
+        max_score = self.game.get_max_possible_score()
+        
+        self.score_label.config(text=f"{score}/{max_score}")
         
         # Calculate correct answers (questions answered before wrong answer or completion)
         questions_answered = progress["current_question"]
@@ -269,34 +365,13 @@ class QuizzifyGUI(tk.Tk):
             easy_correct = remaining_score // 10
             correct_answers += easy_correct
         
-        tk.Label(score_card, 
-                text=f"Total Correct answers:\n{correct_answers} out of {questions_answered} Questions",
-                font=('Arial', 13, 'bold'),
-                bg='#8B0000', fg='#FFC107', pady=15).pack()
-        
-        # Buttons
-        btn_frame = tk.Frame(container, bg='#FF6347')
-        btn_frame.pack(pady=25, fill='x')
-        
-        tk.Button(btn_frame, text="HOME",
-                 font=('Arial', 15, 'bold'),
-                 bg='#FFFFFF', fg='#8B0000',
-                 activebackground='#F0F0F0', activeforeground='#8B0000',
-                 relief='raised', bd=5, width=8, height=2,
-                 cursor='hand2', command=self.home_screen).pack(side='left', padx=15, expand=True)
+        self.correct_label.config(
+            text=f"Total Correct answers:\n{correct_answers} out of {questions_answered} Questions")
         
-        tk.Button(btn_frame, text="RESTART",
-                 font=('Arial', 15, 'bold'),
-                 bg='#FFC107', fg='#8B0000',
-                 activebackground='#FF9800', activeforeground='#8B0000',
-                 relief='raised', bd=5, width=8, height=2,
-                 cursor='hand2', command=self.start_game).pack(side='right', padx=15, expand=True)
-
-    def clear(self):
-        """Clear all widgets"""
-        for widget in self.winfo_children():
-            widget.destroy()
+        self.show_screen("results", '#FF6347')
 
 if __name__ == "__main__":
+    logs.configure()
+    metrics.configure_from_env()
     app = QuizzifyGUI()
     app.mainloop()
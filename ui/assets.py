@@ -0,0 +1,211 @@
+"""
+Asset pipeline for the Pygame UI.
+
+assets/manifest.json lists every image with its on-screen size. The build
+step pre-scales the sources and packs them into one atlas image plus a JSON
+index of sub-rectangles:
+
+    python -m ui.assets build
+
+At runtime AssetAtlas loads the atlas once, converts it to the display
+format and serves sub-surfaces, so drawing never scales or converts pixels.
+"""
+
+import os
+import sys
+import json
+import hashlib
+
+import pygame
+
+from backend.logs import get_logger
+
+log = get_logger(__name__)
+
+
+# Paths are resolved relative to the package, not the working directory
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+MANIFEST_PATH = os.path.join(ASSETS_DIR, "manifest.json")
+
+
+def load_manifest(path=MANIFEST_PATH):
+    """Load the asset manifest and return (manifest, content_hash)."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    return json.loads(raw), hashlib.sha1(raw).hexdigest()
+
+
+def _scaled_sources(manifest, base_dir):
+    """Load and pre-scale every image in the manifest."""
+    images = {}
+    for name, entry in manifest["images"].items():
+        image = pygame.image.load(os.path.join(base_dir, entry["source"]))
+        size = entry.get("size")
+        if size:
+            image = pygame.transform.smoothscale(image, size)
+        images[name] = image
+    return images
+
+
+def pack(sizes, padding=2):
+    """
+    Shelf-pack rectangles into a roughly square atlas.
+
+    Args:
+        sizes (dict): {name: (width, height)}
+        padding (int): Empty pixels kept around every image
+
+    Returns:
+        tuple: ((atlas_width, atlas_height), {name: (x, y, w, h)})
+    """
+    area = sum((w + padding) * (h + padding) for w, h in sizes.values())
+    widest = max((w for w, _ in sizes.values()), default=0) + padding
+    max_width = max(widest, int(area ** 0.5) + 1)
+
+    rects = {}
+    x = y = shelf_h = 0
+    atlas_w = 0
+    # tallest first keeps shelves tight
+    for name, (w, h) in sorted(sizes.items(), key=lambda item: -item[1][1]):
+        if x + w + padding > max_width:
+            x = 0
+            y += shelf_h
+            shelf_h = 0
+        rects[name] = (x + padding, y + padding, w, h)
+        x += w + padding
+        shelf_h = max(shelf_h, h + padding)
+        atlas_w = max(atlas_w, x)
+    return (atlas_w + padding, y + shelf_h + padding), rects
+
+
+def build_atlas(manifest_path=MANIFEST_PATH):
+    """
+    Build the atlas image and index described by the manifest.
+
+    Returns:
+        str: Path of the written atlas image
+    """
+    manifest, digest = load_manifest(manifest_path)
+    base_dir = os.path.dirname(manifest_path)
+    padding = manifest.get("padding", 2)
+
+    images = _scaled_sources(manifest, base_dir)
+    atlas_size, rects = pack({name: img.get_size() for name, img in images.items()}, padding)
+
+    atlas = pygame.Surface(atlas_size, pygame.SRCALPHA)
+    atlas.fill((0, 0, 0, 0))
+    for name, image in images.items():
+        atlas.blit(image, rects[name][:2])
+
+    atlas_path = os.path.join(base_dir, manifest["atlas"])
+    index_path = os.path.join(base_dir, manifest["index"])
+    os.makedirs(os.path.dirname(atlas_path), exist_ok=True)
+    pygame.image.save(atlas, atlas_path)
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump({"manifest_sha1": digest, "size": list(atlas_size), "rects": rects}, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return atlas_path
+
+
+class AssetAtlas:
+    """
+    Runtime view of the built atlas.
+
+    The atlas is loaded on the first get() and converted to the display
+    format once a display exists. If the atlas is missing or older than the
+    manifest, the sources are scaled in memory instead (slower startup,
+    same result) and a warning asks for a rebuild.
+    """
+
+    def __init__(self, manifest_path=MANIFEST_PATH):
+        self.manifest_path = manifest_path
+        self._atlas = None
+        self._rects = None
+        self._subsurfaces = {}
+        self._scaled = {}
+        self._converted = False
+
+    def get(self, name):
+        """
+        Return the pre-scaled image for a manifest entry.
+
+        Returns:
+            pygame.Surface or None: None if the name is unknown or failed to load
+        """
+        if self._rects is None:
+            self._load()
+        if not self._converted and pygame.display.get_surface() is not None:
+            self._convert()
+
+        image = self._subsurfaces.get(name)
+        if image is None and name in self._rects:
+            image = self._atlas.subsurface(pygame.Rect(self._rects[name]))
+            self._subsurfaces[name] = image
+        return image
+
+    def get_scaled(self, name, scale):
+        """
+        Return an image resized by a layout scale factor.
+        Each (name, scale) pair is scaled once and kept.
+        """
+        if scale == 1:
+            return self.get(name)
+        image = self.get(name)
+        if image is None:
+            return None
+        key = (name, scale)
+        scaled = self._scaled.get(key)
+        if scaled is None:
+            w, h = image.get_size()
+            scaled = pygame.transform.smoothscale(image, (max(1, round(w * scale)), max(1, round(h * scale))))
+            self._scaled[key] = scaled
+        return scaled
+
+    def _load(self):
+        self._rects = {}
+        try:
+            manifest, digest = load_manifest(self.manifest_path)
+        except (OSError, ValueError) as e:
+            log.warning("Asset manifest unreadable, using fallback drawing", extra={"error": str(e)})
+            return
+
+        base_dir = os.path.dirname(self.manifest_path)
+        try:
+            with open(os.path.join(base_dir, manifest["index"]), "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if index["manifest_sha1"] != digest:
+                raise ValueError("atlas is older than the manifest")
+            self._atlas = pygame.image.load(os.path.join(base_dir, manifest["atlas"]))
+            self._rects = index["rects"]
+            return
+        except (OSError, ValueError, KeyError, pygame.error) as e:
+            log.warning("Asset atlas not usable, run 'python -m ui.assets build'", extra={"error": str(e)})
+
+        # In-memory build from the sources
+        try:
+            images = _scaled_sources(manifest, base_dir)
+        except (OSError, pygame.error) as e:
+            log.warning("Asset sources not loadable, using fallback drawing", extra={"error": str(e)})
+            return
+        atlas_size, rects = pack({name: img.get_size() for name, img in images.items()},
+                                 manifest.get("padding", 2))
+        self._atlas = pygame.Surface(atlas_size, pygame.SRCALPHA)
+        self._atlas.fill((0, 0, 0, 0))
+        for name, image in images.items():
+            self._atlas.blit(image, rects[name][:2])
+        self._rects = rects
+
+    def _convert(self):
+        self._converted = True
+        if self._atlas is not None:
+            self._atlas = self._atlas.convert_alpha()
+            # sub-surfaces of the old atlas must not outlive it
+            self._subsurfaces.clear()
+            self._scaled.clear()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "build":
+        print(f"Atlas written to {build_atlas()}")
+    else:
+        print("Usage: python -m ui.assets build")
@@ -0,0 +1,176 @@
+"""
+Resolution-independent layout for the Pygame UI.
+
+Every rect, font size and text wrap is described once in design pixels for
+the original 480x750 portrait window, with an anchor saying which edge it
+sticks to. get_layout() turns that into real pixels for a window size and
+caches the result, so a resize costs one layout pass and drawing a frame
+costs none.
+"""
+
+import functools
+
+import pygame
+
+from ui.resources import FontBook
+
+
+# The window size the design was made for
+DESIGN_WIDTH, DESIGN_HEIGHT = 480, 750
+
+# (family, size, bold, italic) at design size
+FONT_SPECS = {
+    "quizzify": ("arial", 60, True, False),
+    "lets_play": ("arial", 36, True, True),
+    "tagline": ("arial", 19, True, False),
+    "button": ("arial", 20, True, False),
+    "question_num": ("arial", 2, True, False),
+    "question": ("arial", 28, True, False),
+    "option": ("arial", 24, False, False),
+    "submit": ("arial", 20, False, False),
+    "results_title": ("arial", 40, True, False),
+    "result_label": ("arial", 24, False, False),
+    "result_score": ("arial", 52, True, False),
+    "result_correct": ("arial", 24, False, False),
+    "level": ("arial", 18, True, False),
+}
+
+# Rects in design pixels:
+#   (vertical anchor, offset, horizontal spec, width or margin, height)
+# vertical anchor "top":    rect.top is offset below the window top
+#                 "bottom": rect.top is offset above the window bottom
+#                 "middle": rect.centery is offset from the window middle
+# horizontal spec "center":  width is the rect width, centered in the column
+#                 "stretch": width is the margin kept on both sides
+#                 int:       rect.left relative to the column center
+RECT_SPECS = {
+    # Start screen
+    "start_title_box": ("top", 230, "center", 400, 70),
+    "start_button": ("bottom", 150, "center", 240, 65),
+    # Question screen
+    "level_badge": ("top", 15, "center", 120, 35),
+    "question_card": ("top", 80, "stretch", 30, 160),
+    "submit_button": ("bottom", 90, "center", 240, 55),
+    # Result screen
+    "results_bubble": ("top", 60, "center", 280, 80),
+    "result_outer_card": ("top", 180, "stretch", 30, 380),
+    "result_inner_card": ("top", 195, "stretch", 45, 350),
+    "result_home": ("bottom", 110, -190, 160, 55),
+    "result_restart": ("bottom", 110, 30, 160, 55),
+}
+
+OPTION_TOP = 270
+OPTION_H = 65
+OPTION_GAP_Y = 15
+OPTION_MARGIN = 40
+
+# Points as (vertical anchor, offset); x is the column center
+POINT_SPECS = {
+    "start_bulb_center": ("top", 140),
+    "start_lets_play": ("top", 340),
+    "start_tagline": ("top", 385),
+    "loading_bulb_center": ("middle", -90),
+    "loading_text": ("middle", 10),
+    "loading_dots": ("middle", 60),
+}
+
+# Wrapped text kept per layout before the cache is reset
+WRAP_CACHE_SIZE = 512
+
+
+class Layout:
+    """
+    All geometry for one window size.
+
+    Content is scaled uniformly to fit the window and centered in a
+    column; backgrounds use the full window.
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.size = (width, height)
+        self.scale = min(width / DESIGN_WIDTH, height / DESIGN_HEIGHT)
+        self.column_width = round(DESIGN_WIDTH * self.scale)
+        self.column_left = (width - self.column_width) // 2
+        self.center_x = width // 2
+
+        for name, spec in RECT_SPECS.items():
+            setattr(self, name, self._rect(*spec))
+        for name, (anchor, offset) in POINT_SPECS.items():
+            setattr(self, name, (self.center_x, self._y(anchor, offset)))
+
+        self.option_rects = [
+            self._rect("top", OPTION_TOP + i * (OPTION_H + OPTION_GAP_Y), "stretch", OPTION_MARGIN, OPTION_H)
+            for i in range(4)
+        ]
+
+        self.fonts = FontBook({
+            name: (family, max(1, round(size * self.scale)), bold, italic)
+            for name, (family, size, bold, italic) in FONT_SPECS.items()
+        })
+        self._wrap_cache = {}
+
+    def px(self, value):
+        """Scale a design-pixel length (radius, offset, thickness) to this size."""
+        return max(1, round(value * self.scale)) if value > 0 else round(value * self.scale)
+
+    def _y(self, anchor, offset):
+        if anchor == "top":
+            return self.px(offset)
+        if anchor == "bottom":
+            return self.height - self.px(offset)
+        return self.height // 2 + self.px(offset)
+
+    def _rect(self, anchor, offset, horizontal, width, height):
+        h = self.px(height)
+        top = self._y(anchor, offset)
+        if anchor == "middle":
+            top -= h // 2
+        if horizontal == "stretch":
+            margin = self.px(width)
+            return pygame.Rect(self.column_left + margin, top, self.column_width - 2 * margin, h)
+        w = self.px(width)
+        if horizontal == "center":
+            return pygame.Rect(self.center_x - w // 2, top, w, h)
+        return pygame.Rect(self.center_x + self.px(horizontal), top, w, h)
+
+    def wrap(self, text, font_name, max_width):
+        """
+        Wrap text to fit a width using one of this layout's fonts.
+
+        Returns:
+            tuple: Lines of text (cached per text, font and width)
+        """
+        key = (text, font_name, max_width)
+        lines = self._wrap_cache.get(key)
+        if lines is None:
+            if len(self._wrap_cache) >= WRAP_CACHE_SIZE:
+                self._wrap_cache.clear()
+            lines = tuple(wrap_text(text, getattr(self.fonts, font_name), max_width))
+            self._wrap_cache[key] = lines
+        return lines
+
+
+def wrap_text(text, font, max_width):
+    """Wrap text to fit width."""
+    words = text.split()
+    lines = []
+    current = ""
+    for w in words:
+        test = (current + " " + w).strip()
+        if font.size(test)[0] <= max_width:
+            current = test
+        else:
+            if current:
+                lines.append(current)
+            current = w
+    if current:
+        lines.append(current)
+    return lines
+
+
+@functools.lru_cache(maxsize=8)
+def get_layout(width, height):
+    """Return the (cached) layout for a window size."""
+    return Layout(width, height)
@@ -0,0 +1,109 @@
+"""
+Background pre-rendering of question text.
+
+As soon as a game's questions are known, a worker thread wraps and renders
+the question card text and the four option labels of every question for
+the current layout. Moving to the next question then only swaps which
+prepared surfaces get blitted; no text is wrapped or rendered on that frame.
+"""
+
+import threading
+
+import pygame
+
+from ui.layout import wrap_text
+
+
+class PreparedQuestion:
+    """Rendered text blocks for one question: (surface, offset) pairs."""
+
+    def __init__(self, card_text, option_texts):
+        self.card_text = card_text
+        self.option_texts = option_texts
+
+
+def render_text_block(text, font, color, rect, padding):
+    """
+    Render wrapped, centered text exactly as draw_multiline_center places it.
+
+    Returns:
+        tuple: (surface, (dx, dy)) where (dx, dy) is the blit offset
+               from rect.topleft
+    """
+    lines = wrap_text(text, font, rect.width - padding)
+    line_h = font.get_linesize()
+    start_y = rect.height // 2 - len(lines) * line_h // 2
+
+    rendered = []
+    for i, line in enumerate(lines):
+        surf = font.render(line, True, color)
+        rendered.append((surf, surf.get_rect(center=(rect.width // 2, start_y + i * line_h))))
+
+    if not rendered:
+        return pygame.Surface((0, 0), pygame.SRCALPHA), (0, 0)
+
+    bounds = rendered[0][1].unionall([r for _, r in rendered[1:]])
+    block = pygame.Surface(bounds.size, pygame.SRCALPHA)
+    for surf, r in rendered:
+        block.blit(surf, (r.x - bounds.x, r.y - bounds.y))
+    return block, bounds.topleft
+
+
+class RenderPipeline:
+    """
+    Prepares PreparedQuestion entries for a question set on a worker thread.
+
+    Usage:
+        pipeline.start(game.questions, layout)
+        prepared = pipeline.get(game.current_index, layout)  # None if not ready
+    """
+
+    def __init__(self, question_color, option_color):
+        self.question_color = question_color
+        self.option_color = option_color
+        self._layout = None
+        self._prepared = []
+        self._generation = 0
+
+    def start(self, questions, layout):
+        """Start preparing a question set, dropping any earlier run."""
+        self._generation += 1
+        prepared = [None] * len(questions)
+        self._layout = layout
+        self._prepared = prepared
+        worker = threading.Thread(
+            target=self._run,
+            args=(self._generation, list(questions), layout, prepared),
+            daemon=True,
+        )
+        worker.start()
+
+    def cancel(self):
+        """Stop the current run; get() returns None until the next start()."""
+        self._generation += 1
+        self._layout = None
+        self._prepared = []
+
+    def get(self, index, layout):
+        """Return the prepared entry for a question, or None if not ready."""
+        if layout is not self._layout or not 0 <= index < len(self._prepared):
+            return None
+        return self._prepared[index]
+
+    def _run(self, generation, questions, layout, prepared):
+        # Private fonts: the main thread keeps drawing with the shared ones
+        question_font = layout.fonts.private("question")
+        option_font = layout.fonts.private("option")
+        padding = layout.px(30)
+
+        for i, q in enumerate(questions):
+            if generation != self._generation:
+                return
+            opts = q["options"]
+            card_text = render_text_block(q["text"], question_font, self.question_color,
+                                          layout.question_card, padding)
+            option_texts = [
+                render_text_block(opts.get(key, ""), option_font, self.option_color, rect, padding)
+                for key, rect in zip("abcd", layout.option_rects)
+            ]
+            prepared[i] = PreparedQuestion(card_text, option_texts)
@@ -1,25 +1,54 @@
 import sys
 import pygame
 import math
-import os
+import time
+import functools
+import threading
 
 # ============================================
 #          BACKEND INTEGRATION (REAL ENGINE)
 # ============================================
 
 from backend.game_engine import QuizGame
+from backend import metrics
+from backend import logs
+from ui.assets import AssetAtlas
+from ui.scheduler import FrameScheduler
+from ui.layout import get_layout
+from ui.prerender import RenderPipeline
+
+log = logs.get_logger(__name__)
 
 # ============================================
 #    CONFIG: WINDOW, COLORS, FONTS (MOBILE)
 # ============================================
 
-pygame.init()
-pygame.display.set_caption("Quizzify Mobile")
-
-# Mobile phone dimensions (portrait)
+# Mobile phone dimensions (portrait), the default window size
 WIDTH, HEIGHT = 480, 750
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-clock = pygame.time.Clock()
+
+# Created by init_display() so importing this module needs no display
+screen = None
+
+# Geometry and fonts for the current window size (see ui/layout.py)
+layout = get_layout(WIDTH, HEIGHT)
+
+def init_display(size=(WIDTH, HEIGHT)):
+    """Initialize pygame and open the window. Safe to call more than once."""
+    global screen
+    if screen is None:
+        pygame.init()
+        pygame.display.set_caption("Quizzify Mobile")
+        screen = pygame.display.set_mode(size, pygame.RESIZABLE)
+        resize_window(*screen.get_size())
+    return screen
+
+def resize_window(width, height):
+    """Switch to the layout for a new window size (cached per size)."""
+    global screen, layout
+    surface = pygame.display.get_surface()
+    if surface is not None:
+        screen = surface
+    layout = get_layout(width, height)
 
 # ============================================
 #    EXACT COLORS FROM SCREENSHOTS
@@ -75,44 +104,8 @@ COLOR_HOME_TEXT = (30, 15, 10)
 COLOR_RESTART_BUTTON = (255, 165, 0)
 COLOR_RESTART_TEXT = (0, 0, 0)
 
-# Fonts - Better rendering with proper sizes
-font_quizzify = pygame.font.SysFont("arial", 60, bold=True)
-font_lets_play = pygame.font.SysFont("arial", 36, bold=True, italic=True)
-font_tagline = pygame.font.SysFont("arial", 19, bold=True)
-font_button = pygame.font.SysFont("arial", 20, bold=True)
-font_question_num = pygame.font.SysFont("arial", 2, bold=True)
-font_question = pygame.font.SysFont("arial", 28, bold=True)
-font_option = pygame.font.SysFont("arial", 24, bold=False)
-font_submit = pygame.font.SysFont("arial", 20, bold=False)
-font_results_title = pygame.font.SysFont("arial", 40, bold=True)
-font_result_label = pygame.font.SysFont("arial", 24, bold=False)
-font_result_score = pygame.font.SysFont("arial", 52, bold=True)
-font_result_correct = pygame.font.SysFont("arial", 24, bold=False)
-font_level = pygame.font.SysFont("arial", 18, bold=True)
-
-# Load bulb image with multiple path attempts
-bulb_image = None
-possible_paths = [
-    "assets/bullb.png",
-    "bullb.png",
-    os.path.join("Assets", "bulb.png"),
-    os.path.join("assets", "bulb.png")
-]
-for path in possible_paths:
-    if os.path.exists(path):
-        try:
-            bulb_image = pygame.image.load(path)
-            bulb_image = pygame.transform.scale(bulb_image, (100, 100))
-            print(f"✅ Bulb image loaded from: {path}")
-            break
-        except Exception as e:
-            print(f" Error loading {path}: {e}")
-            continue
-
-if bulb_image is None:
-    print("WARNING: bulb.png not found. Using fallback drawing.")
-    print(f"Current directory: {os.getcwd()}")
-    print(f"Tried paths: {possible_paths}")
+# Pre-scaled images from assets/build/atlas.png (see ui/assets.py)
+assets = AssetAtlas()
 
 # ============================================
 #      BACKEND ADAPTER
@@ -125,6 +118,64 @@ def create_game(topic: str = "General Knowledge") -> QuizGame:
         raise RuntimeError("start_new_game() failed")
     return game
 
+# Posted by GameLoader when a background create_game() finishes.
+# event.game is the QuizGame (or None), event.error the exception (or None).
+GAME_LOADED = pygame.event.custom_type()
+
+class GameLoader:
+    """
+    Runs create_game() on a worker thread so the event loop never blocks
+    on the network. The result comes back as a GAME_LOADED event.
+    """
+
+    def __init__(self, pipeline=None, factory=None):
+        """
+        Args:
+            pipeline (RenderPipeline): Optional; started on the loaded
+                                       questions before the event is posted
+            factory (callable): Builds the game from a topic; defaults to
+                                create_game()
+        """
+        self._cancel = None
+        self.pending = False
+        self.pipeline = pipeline
+        self.factory = factory or create_game
+
+    def start(self, topic: str = "General Knowledge"):
+        """Start loading a new game, discarding any load still in flight."""
+        self.cancel()
+        cancel = threading.Event()
+        self._cancel = cancel
+        self.pending = True
+        worker = threading.Thread(target=self._run, args=(topic, cancel), daemon=True)
+        worker.start()
+
+    def cancel(self):
+        """Drop the in-flight load; its result will never be posted."""
+        if self._cancel is not None:
+            self._cancel.set()
+            self._cancel = None
+        self.pending = False
+
+    def _run(self, topic, cancel):
+        game, error = None, None
+        try:
+            game = self.factory(topic)
+        except Exception as e:
+            error = e
+        if game is not None and self.pipeline is not None and not cancel.is_set():
+            self.pipeline.start(game.questions, layout)
+        if not cancel.is_set():
+            pygame.event.post(pygame.event.Event(GAME_LOADED, game=game, error=error, token=cancel))
+
+    def accept(self, event) -> bool:
+        """Return True if the event belongs to the current (not cancelled) load."""
+        if event.token is not self._cancel:
+            return False
+        self._cancel = None
+        self.pending = False
+        return True
+
 def load_current_question(game: QuizGame):
     q = game.get_current_question()
     if q is None:
@@ -163,49 +214,15 @@ def get_level_info(question_number):
     else:
         return "EASY", COLOR_EASY
 
-# ============================================
-#           MOBILE LAYOUT RECTS
-# ============================================
-
-# Start screen (mobile)
-START_BULB_CENTER = (WIDTH // 2, 140)
-START_TITLE_BOX = pygame.Rect(WIDTH // 2 - 200, 230, 400, 70)
-START_LETS_PLAY_Y = 340
-START_TAGLINE_Y = 385
-START_BUTTON = pygame.Rect(WIDTH // 2 - 120, HEIGHT - 150, 240, 65)
-
-# Question screen (mobile - vertical stack)
-QUESTION_CARD = pygame.Rect(30, 80, WIDTH - 60, 160)
-LEVEL_BADGE = pygame.Rect(WIDTH // 2 - 60, 15, 120, 35)
-
-OPTION_W = WIDTH - 80
-OPTION_H = 65
-OPTION_GAP_Y = 15
-
-OPTION_RECTS = [
-    pygame.Rect(40, 270, OPTION_W, OPTION_H),
-    pygame.Rect(40, 270 + OPTION_H + OPTION_GAP_Y, OPTION_W, OPTION_H),
-    pygame.Rect(40, 270 + 2 * (OPTION_H + OPTION_GAP_Y), OPTION_W, OPTION_H),
-    pygame.Rect(40, 270 + 3 * (OPTION_H + OPTION_GAP_Y), OPTION_W, OPTION_H),
-]
-
-SUBMIT_BUTTON = pygame.Rect(WIDTH // 2 - 120, HEIGHT - 90, 240, 55)
-
-# Result screen (mobile)
-RESULTS_BUBBLE = pygame.Rect(WIDTH // 2 - 140, 60, 280, 80)
-RESULT_OUTER_CARD = pygame.Rect(30, 180, WIDTH - 60, 380)
-RESULT_INNER_CARD = pygame.Rect(45, 195, WIDTH - 90, 350)
-RESULT_HOME = pygame.Rect(WIDTH // 2 - 190, HEIGHT - 110, 160, 55)
-RESULT_RESTART = pygame.Rect(WIDTH // 2 + 30, HEIGHT - 110, 160, 55)
-
 # ============================================
 #             ENHANCED DRAW HELPERS
 # ============================================
 
 def draw_smooth_wave_with_fill(surface, y_position, amplitude, wavelength, line_color, fill_color, thickness, is_top=True):
     """Draw a smooth sine wave with yellow fill above/below."""
+    width, height = surface.get_size()
     points = []
-    for x in range(WIDTH + 10):
+    for x in range(width + 10):
         y_offset = amplitude * math.sin(2 * math.pi * x / wavelength)
         if is_top:
             y = y_position + y_offset
@@ -213,20 +230,21 @@ def draw_smooth_wave_with_fill(surface, y_position, amplitude, wavelength, line_
             y = y_position - y_offset
         points.append((x, y))
     if is_top:
-        fill_points = [(0, 0)] + points + [(WIDTH, 0)]
+        fill_points = [(0, 0)] + points + [(width, 0)]
         pygame.draw.polygon(surface, fill_color, fill_points)
     else:
-        fill_points = [(0, HEIGHT)] + points + [(WIDTH, HEIGHT)]
+        fill_points = [(0, height)] + points + [(width, height)]
         pygame.draw.polygon(surface, fill_color, fill_points)
     if len(points) > 1:
         pygame.draw.lines(surface, line_color, False, points, thickness)
 
 def draw_grid_pattern(surface, grid_size=30, line_color=(240, 240, 230), line_width=1):
     """Draw subtle grid pattern."""
-    for x in range(0, WIDTH, grid_size):
-        pygame.draw.line(surface, line_color, (x, 0), (x, HEIGHT), line_width)
-    for y in range(0, HEIGHT, grid_size):
-        pygame.draw.line(surface, line_color, (0, y), (WIDTH, y), line_width)
+    width, height = surface.get_size()
+    for x in range(0, width, grid_size):
+        pygame.draw.line(surface, line_color, (x, 0), (x, height), line_width)
+    for y in range(0, height, grid_size):
+        pygame.draw.line(surface, line_color, (0, y), (width, y), line_width)
 
 def draw_bulb_fallback(surface, center, radius=35):
     """Fallback: Draw bulb with gradient if image not available."""
@@ -256,11 +274,12 @@ def draw_bulb_fallback(surface, center, radius=35):
 
 def draw_bulb_image(surface, center):
     """Draw bulb from image file or fallback to drawing."""
-    if bulb_image:
-        rect = bulb_image.get_rect(center=center)
-        surface.blit(bulb_image, rect)
+    image = assets.get_scaled("bulb", layout.scale)
+    if image:
+        rect = image.get_rect(center=center)
+        surface.blit(image, rect)
     else:
-        draw_bulb_fallback(surface, center, radius=35)
+        draw_bulb_fallback(surface, center, radius=layout.px(35))
 
 def draw_text_with_border(surface, text, font, text_color, border_color, center, border_width=2):
     """Draw text with CLEAN border."""
@@ -294,26 +313,10 @@ def draw_text_center(surface, text, font, color, center):
     rect = surf.get_rect(center=center)
     surface.blit(surf, rect)
 
-def wrap_text(text, font, max_width):
-    """Wrap text to fit width."""
-    words = text.split()
-    lines = []
-    current = ""
-    for w in words:
-        test = (current + " " + w).strip()
-        if font.size(test)[0] <= max_width:
-            current = test
-        else:
-            if current:
-                lines.append(current)
-            current = w
-    if current:
-        lines.append(current)
-    return lines
-
-def draw_multiline_center(surface, text, font, color, rect):
-    """Draw multi-line centered text."""
-    lines = wrap_text(text, font, rect.width - 30)
+def draw_multiline_center(surface, text, font_name, color, rect):
+    """Draw multi-line centered text using a layout font."""
+    font = getattr(layout.fonts, font_name)
+    lines = layout.wrap(text, font_name, rect.width - layout.px(30))
     line_h = font.get_linesize()
     total_h = len(lines) * line_h
     start_y = rect.centery - total_h // 2
@@ -324,7 +327,7 @@ def draw_multiline_center(surface, text, font, color, rect):
 
 def draw_sunburst_background(surface, center, inner_color, outer_color, num_rays=16):
     """Draw comic-style sunburst background."""
-    max_distance = max(WIDTH, HEIGHT) * 1.5
+    max_distance = max(surface.get_size()) * 1.5
     for i in range(num_rays * 2):
         angle_start = (360 / (num_rays * 2)) * i
         angle_end = (360 / (num_rays * 2)) * (i + 1)
@@ -342,9 +345,9 @@ def draw_speech_bubble(surface, rect, color, border_color, border_width=3):
     """Draw comic-style speech bubble."""
     pygame.draw.ellipse(surface, color, rect)
     pygame.draw.ellipse(surface, border_color, rect, border_width)
-    star_positions = [(rect.left + 25, rect.top + 15), (rect.right - 25, rect.top + 15)]
+    star_positions = [(rect.left + layout.px(25), rect.top + layout.px(15)), (rect.right - layout.px(25), rect.top + layout.px(15))]
     for pos in star_positions:
-        draw_star(surface, pos, 10, border_color)
+        draw_star(surface, pos, layout.px(10), border_color)
 
 def draw_star(surface, center, size, color):
     """Draw a simple star shape."""
@@ -361,37 +364,78 @@ def draw_star(surface, center, size, color):
 #             SCREEN DRAWS (MOBILE)
 # ============================================
 
+# Per-frame scratch surfaces, reused by purpose and size instead of
+# allocating a new one every frame
+_scratch = {}
+
+def scratch_surface(name, size):
+    """Return a cleared transparent surface that is reused across frames."""
+    key = (name, size)
+    surface = _scratch.get(key)
+    if surface is None:
+        if len(_scratch) >= 8:
+            _scratch.clear()
+        surface = _scratch[key] = pygame.Surface(size, pygame.SRCALPHA)
+    else:
+        surface.fill((0, 0, 0, 0))
+    return surface
+
+@functools.lru_cache(maxsize=2)
+def dots_overlay(size, step, radius):
+    """The result screen's dot pattern, drawn once per window size."""
+    width, height = size
+    dots_surface = pygame.Surface(size, pygame.SRCALPHA)
+    for x in range(0, width, step):
+        for y in range(0, height, step):
+            pygame.draw.circle(dots_surface, (*COLOR_RESULT_DOTS, 30), (x, y), radius)
+    return dots_surface
+
 def draw_start_screen():
     """Draw mobile start screen."""
     screen.fill(COLOR_BG_START_YELLOW)
-    draw_grid_pattern(screen, grid_size=40, line_color=(247, 228, 196))
-    draw_smooth_wave_with_fill(screen, 30, 20, 150, COLOR_WAVE_BLACK, COLOR_WAVE_YELLOW, 10, is_top=True)
-    draw_smooth_wave_with_fill(screen, HEIGHT - 30, 20, 150, COLOR_WAVE_BLACK, COLOR_WAVE_YELLOW, 10, is_top=False)
-    draw_bulb_image(screen, START_BULB_CENTER)
-    draw_text_center(screen, "QUIZZIFY", font_quizzify, COLOR_TITLE_BROWN, START_TITLE_BOX.center)
-    draw_text_with_drop_shadow(screen, "LET'S PLAY", font_lets_play, COLOR_LETS_PLAY_BLACK, (120, 120, 120), (WIDTH // 2, START_LETS_PLAY_Y), shadow_offset=(2, 2))
-    draw_text_with_drop_shadow(screen, "THINK.TAP.SLAY", font_tagline, COLOR_TAGLINE, COLOR_TAGLINE_SHADOW, (WIDTH // 2, START_TAGLINE_Y), shadow_offset=(1, 1))
-    draw_round_rect(screen, START_BUTTON, COLOR_BUTTON_BLACK, radius=35)
-    draw_text_center(screen, "PLAY NOW", font_button, COLOR_BUTTON_WHITE, START_BUTTON.center)
-
-def draw_question_screen(question_text, options, selected_option, question_number):
-    """Draw mobile question screen with a glowing selection effect."""
+    px = layout.px
+    draw_grid_pattern(screen, grid_size=px(40), line_color=(247, 228, 196))
+    draw_smooth_wave_with_fill(screen, px(30), px(20), px(150), COLOR_WAVE_BLACK, COLOR_WAVE_YELLOW, px(10), is_top=True)
+    draw_smooth_wave_with_fill(screen, layout.height - px(30), px(20), px(150), COLOR_WAVE_BLACK, COLOR_WAVE_YELLOW, px(10), is_top=False)
+    draw_bulb_image(screen, layout.start_bulb_center)
+    draw_text_center(screen, "QUIZZIFY", layout.fonts.quizzify, COLOR_TITLE_BROWN, layout.start_title_box.center)
+    draw_text_with_drop_shadow(screen, "LET'S PLAY", layout.fonts.lets_play, COLOR_LETS_PLAY_BLACK, (120, 120, 120), layout.start_lets_play, shadow_offset=(px(2), px(2)))
+    draw_text_with_drop_shadow(screen, "THINK.TAP.SLAY", layout.fonts.tagline, COLOR_TAGLINE, COLOR_TAGLINE_SHADOW, layout.start_tagline, shadow_offset=(px(1), px(1)))
+    draw_round_rect(screen, layout.start_button, COLOR_BUTTON_BLACK, radius=px(35))
+    draw_text_center(screen, "PLAY NOW", layout.fonts.button, COLOR_BUTTON_WHITE, layout.start_button.center)
+
+def blit_prepared(surface, block, rect):
+    """Blit a pre-rendered text block (see ui/prerender.py) into its rect."""
+    text_surf, (dx, dy) = block
+    surface.blit(text_surf, (rect.x + dx, rect.y + dy))
+
+def draw_question_screen(question_text, options, selected_option, question_number, prepared=None):
+    """
+    Draw mobile question screen with a glowing selection effect.
+    If prepared (a PreparedQuestion) is given, its text surfaces are
+    blitted instead of wrapping and rendering the text again.
+    """
+    px = layout.px
     screen.fill(COLOR_BG_QUESTION_BROWN)
 
     # level badge
     level_name, level_color = get_level_info(question_number)
-    draw_round_rect(screen, LEVEL_BADGE, level_color, radius=18)
-    draw_text_center(screen, level_name, font_level, (255, 255, 255), LEVEL_BADGE.center)
+    draw_round_rect(screen, layout.level_badge, level_color, radius=px(18))
+    draw_text_center(screen, level_name, layout.fonts.level, (255, 255, 255), layout.level_badge.center)
 
     # question card
-    draw_round_rect(screen, QUESTION_CARD, COLOR_QUESTION_CARD_CREAM, radius=18, border_color=COLOR_OPTION_BORDER, border_width=2)
+    card = layout.question_card
+    draw_round_rect(screen, card, COLOR_QUESTION_CARD_CREAM, radius=px(18), border_color=COLOR_OPTION_BORDER, border_width=px(2))
 
     # question number
     q_num_text = f"{question_number}. "
-    text_surf = font_question_num.render(q_num_text, True, COLOR_QUESTION_TEXT)
-    screen.blit(text_surf, (QUESTION_CARD.left + 20, QUESTION_CARD.top + 15))
+    text_surf = layout.fonts.question_num.render(q_num_text, True, COLOR_QUESTION_TEXT)
+    screen.blit(text_surf, (card.left + px(20), card.top + px(15)))
 
-    draw_multiline_center(screen, question_text, font_question, COLOR_QUESTION_TEXT, QUESTION_CARD)
+    if prepared is not None:
+        blit_prepared(screen, prepared.card_text, card)
+    else:
+        draw_multiline_center(screen, question_text, "question", COLOR_QUESTION_TEXT, card)
 
     # ---- Glow effect for selected option ----
     # Use a pulsing alpha to make the glow look alive
@@ -400,13 +444,13 @@ def draw_question_screen(question_text, options, selected_option, question_numbe
     base_alpha = 80
     pulse_alpha = int(base_alpha + pulse * 100)  # ranges roughly 80..180
 
-    for idx, rect in enumerate(OPTION_RECTS):
+    for idx, rect in enumerate(layout.option_rects):
         # if selected, draw glow first (behind the option)
         if idx == selected_option:
             # create a transparent surface slightly larger than rect
-            halo_w = rect.width + 40
-            halo_h = rect.height + 40
-            halo = pygame.Surface((halo_w, halo_h), pygame.SRCALPHA)
+            halo_w = rect.width + px(40)
+            halo_h = rect.height + px(40)
+            halo = scratch_surface("halo", (halo_w, halo_h))
             # radial-ish multi-layer glow (three layers with decreasing size/alpha)
             layer_colors = [
                 (255, 200, 0, max(40, int(pulse_alpha * 0.35))),
@@ -414,106 +458,193 @@ def draw_question_screen(question_text, options, selected_option, question_numbe
                 (255, 230, 120, max(20, int(pulse_alpha * 0.15))),
             ]
             # outer
-            pygame.draw.rect(halo, layer_colors[0], halo.get_rect(), border_radius=24)
+            pygame.draw.rect(halo, layer_colors[0], halo.get_rect(), border_radius=px(24))
             # middle (slightly smaller)
-            inner_rect = pygame.Rect(8, 8, halo_w - 16, halo_h - 16)
-            pygame.draw.rect(halo, layer_colors[1], inner_rect, border_radius=20)
+            inner_rect = halo.get_rect().inflate(-px(16), -px(16))
+            pygame.draw.rect(halo, layer_colors[1], inner_rect, border_radius=px(20))
             # inner faint
-            inner_rect2 = pygame.Rect(14, 14, halo_w - 28, halo_h - 28)
-            pygame.draw.rect(halo, layer_colors[2], inner_rect2, border_radius=16)
+            inner_rect2 = halo.get_rect().inflate(-px(28), -px(28))
+            pygame.draw.rect(halo, layer_colors[2], inner_rect2, border_radius=px(16))
             # blit halo so it centers behind option rect
             halo_pos = (rect.x - (halo_w - rect.width) // 2, rect.y - (halo_h - rect.height) // 2)
             screen.blit(halo, halo_pos)
 
             bg_color = COLOR_OPTION_HOVER
             border_col = COLOR_OPTION_BORDER
-            border_w = 3
+            border_w = px(3)
         else:
             bg_color = COLOR_OPTION_BG_CREAM
             border_col = COLOR_OPTION_BORDER
-            border_w = 2
+            border_w = px(2)
 
-        draw_round_rect(screen, rect, bg_color, radius=12, border_color=border_col, border_width=border_w)
+        draw_round_rect(screen, rect, bg_color, radius=px(12), border_color=border_col, border_width=border_w)
 
-        if idx < len(options):
-            draw_multiline_center(screen, options[idx], font_option, COLOR_OPTION_TEXT, rect)
+        if prepared is not None:
+            blit_prepared(screen, prepared.option_texts[idx], rect)
+        elif idx < len(options):
+            draw_multiline_center(screen, options[idx], "option", COLOR_OPTION_TEXT, rect)
 
     # submit button
-    draw_round_rect(screen, SUBMIT_BUTTON, COLOR_SUBMIT_ORANGE, radius=28)
-    draw_text_center(screen, "SUBMIT", font_submit, COLOR_SUBMIT_TEXT, SUBMIT_BUTTON.center)
+    draw_round_rect(screen, layout.submit_button, COLOR_SUBMIT_ORANGE, radius=px(28))
+    draw_text_center(screen, "SUBMIT", layout.fonts.submit, COLOR_SUBMIT_TEXT, layout.submit_button.center)
 
 def draw_result_screen(score, max_score, correct_count, total_questions):
     """Draw mobile result screen."""
-    draw_sunburst_background(screen, (WIDTH // 2, HEIGHT // 2), COLOR_RESULT_BG_CENTER, COLOR_RESULT_BG_OUTER, num_rays=16)
+    px = layout.px
+    width, height = layout.size
+    draw_sunburst_background(screen, (width // 2, height // 2), COLOR_RESULT_BG_CENTER, COLOR_RESULT_BG_OUTER, num_rays=16)
 
-    dots_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    for x in range(0, WIDTH, 20):
-        for y in range(0, HEIGHT, 20):
-            pygame.draw.circle(dots_surface, (*COLOR_RESULT_DOTS, 30), (x, y), 2)
-    screen.blit(dots_surface, (0, 0))
+    screen.blit(dots_overlay((width, height), px(20), px(2)), (0, 0))
 
-    draw_speech_bubble(screen, RESULTS_BUBBLE, COLOR_RESULTS_BUBBLE, COLOR_RESULTS_BUBBLE_BORDER)
-    draw_text_center(screen, "RESULTS", font_results_title, COLOR_RESULTS_TEXT, RESULTS_BUBBLE.center)
+    draw_speech_bubble(screen, layout.results_bubble, COLOR_RESULTS_BUBBLE, COLOR_RESULTS_BUBBLE_BORDER, border_width=px(3))
+    draw_text_center(screen, "RESULTS", layout.fonts.results_title, COLOR_RESULTS_TEXT, layout.results_bubble.center)
 
-    draw_round_rect(screen, RESULT_OUTER_CARD, COLOR_RESULT_CARD, radius=22)
-    draw_round_rect(screen, RESULT_INNER_CARD, COLOR_RESULT_CARD_INNER, radius=18)
+    inner = layout.result_inner_card
+    draw_round_rect(screen, layout.result_outer_card, COLOR_RESULT_CARD, radius=px(22))
+    draw_round_rect(screen, inner, COLOR_RESULT_CARD_INNER, radius=px(18))
 
-    draw_text_center(screen, "Your Final Score is", font_result_label, COLOR_SCORE_LABEL, (RESULT_INNER_CARD.centerx, RESULT_INNER_CARD.top + 45))
+    draw_text_center(screen, "Your Final Score is", layout.fonts.result_label, COLOR_SCORE_LABEL, (inner.centerx, inner.top + px(45)))
 
     score_text = f"{score}/{max_score}"
-    score_bg = pygame.Rect(RESULT_INNER_CARD.centerx - 80, RESULT_INNER_CARD.top + 85, 160, 70)
+    score_bg = pygame.Rect(inner.centerx - px(80), inner.top + px(85), px(160), px(70))
     pygame.draw.ellipse(screen, (255, 255, 245), score_bg)
-    pygame.draw.ellipse(screen, COLOR_RESULTS_BUBBLE_BORDER, score_bg, 2)
-    draw_text_center(screen, score_text, font_result_score, COLOR_SCORE_TEXT, (RESULT_INNER_CARD.centerx, RESULT_INNER_CARD.top + 120))
+    pygame.draw.ellipse(screen, COLOR_RESULTS_BUBBLE_BORDER, score_bg, px(2))
+    draw_text_center(screen, score_text, layout.fonts.result_score, COLOR_SCORE_TEXT, (inner.centerx, inner.top + px(120)))
 
-    draw_text_center(screen, "Total Correct answers:", font_result_label, COLOR_CORRECT_LABEL, (RESULT_INNER_CARD.centerx, RESULT_INNER_CARD.bottom - 90))
+    draw_text_center(screen, "Total Correct answers:", layout.fonts.result_label, COLOR_CORRECT_LABEL, (inner.centerx, inner.bottom - px(90)))
 
     correct_text = f"{correct_count} out of {total_questions} Questions"
-    draw_text_center(screen, correct_text, font_result_correct, COLOR_CORRECT_TEXT, (RESULT_INNER_CARD.centerx, RESULT_INNER_CARD.bottom - 60))
+    draw_text_center(screen, correct_text, layout.fonts.result_correct, COLOR_CORRECT_TEXT, (inner.centerx, inner.bottom - px(60)))
+
+    draw_round_rect(screen, layout.result_home, COLOR_HOME_BUTTON, radius=px(28), border_color=COLOR_RESULTS_BUBBLE_BORDER, border_width=px(2))
+    draw_text_center(screen, "HOME", layout.fonts.button, COLOR_HOME_TEXT, layout.result_home.center)
 
-    draw_round_rect(screen, RESULT_HOME, COLOR_HOME_BUTTON, radius=28, border_color=COLOR_RESULTS_BUBBLE_BORDER, border_width=2)
-    draw_text_center(screen, "HOME", font_button, COLOR_HOME_TEXT, RESULT_HOME.center)
+    draw_round_rect(screen, layout.result_restart, COLOR_RESTART_BUTTON, radius=px(28))
+    draw_text_center(screen, "RESTART", layout.fonts.button, COLOR_RESTART_TEXT, layout.result_restart.center)
 
-    draw_round_rect(screen, RESULT_RESTART, COLOR_RESTART_BUTTON, radius=28)
-    draw_text_center(screen, "RESTART", font_button, COLOR_RESTART_TEXT, RESULT_RESTART.center)
+def draw_loading_screen():
+    """Draw animated loading screen shown while questions are fetched."""
+    px = layout.px
+    screen.fill(COLOR_BG_QUESTION_BROWN)
+    draw_bulb_image(screen, layout.loading_bulb_center)
+    draw_text_center(screen, "LOADING QUESTIONS", layout.fonts.button, COLOR_QUESTION_CARD_CREAM, layout.loading_text)
+
+    # three dots pulsing one after another
+    t = pygame.time.get_ticks() / 1000.0
+    for i in range(3):
+        pulse = (math.sin(t * 5.0 - i * 0.8) + 1.0) / 2.0
+        radius = px(5 + pulse * 5)
+        color = (255, int(165 + pulse * 60), int(pulse * 80))
+        dots_x, dots_y = layout.loading_dots
+        pygame.draw.circle(screen, color, (dots_x + px(30) * (i - 1), dots_y), radius)
 
 # ============================================
 #             MAIN LOOP
 # ============================================
 
-def run_quiz_ui():
-    """Main UI loop."""
+def run_quiz_ui(game_factory=None, recorder=None, player=None, frame_hook=None, exit_on_quit=True):
+    """
+    Main UI loop.
+
+    Args:
+        game_factory (callable): Builds a QuizGame from a topic (default create_game)
+        recorder (EventRecorder): Optional; every handled event is recorded
+        player (EventPlayer): Optional; started once the window is open to
+                              replay a recorded session
+        frame_hook (callable): Optional; called as frame_hook(state, seconds)
+                               after every drawn frame
+        exit_on_quit (bool): Call sys.exit() when the window closes
+    """
+    init_display()
+    logs.configure()
+    metrics.configure_from_env()
     state = "start"
+    # screen to show once the pending game has loaded
+    after_load = "start"
     selected_option = None
     current_question_num = 1
 
-    game = create_game()
-    question_text, options = load_current_question(game)
+    game = None
+    question_text, options = "", ["", "", "", ""]
+    pipeline = RenderPipeline(COLOR_QUESTION_TEXT, COLOR_OPTION_TEXT)
+    loader = GameLoader(pipeline, game_factory)
+    loader.start()
+    scheduler = FrameScheduler(fps=60)
+    if recorder is not None:
+        recorder.start()
+    if player is not None:
+        player.start()
 
     running = True
     while running:
-        for event in pygame.event.get():
+        # only the loading dots and the selection glow move
+        animating = state == "loading" or (state == "question" and selected_option is not None)
+
+        if scheduler.should_draw(animating):
+            frame_start = time.perf_counter()
+            if state == "start":
+                draw_start_screen()
+            elif state == "loading":
+                draw_loading_screen()
+            elif state == "question":
+                prepared = pipeline.get(game.current_index, layout)
+                draw_question_screen(question_text, options, selected_option, current_question_num, prepared)
+            elif state == "result":
+                score, max_score, correct_count, total_questions = get_result_stats(game)
+                draw_result_screen(score, max_score, correct_count, total_questions)
+
+            pygame.display.flip()
+            if frame_hook is not None:
+                frame_hook(state, time.perf_counter() - frame_start)
+
+        for event in scheduler.next_events(animating):
+            if recorder is not None:
+                recorder.record(event)
+
             if event.type == pygame.QUIT:
                 running = False
 
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 running = False
 
+            if event.type == pygame.VIDEORESIZE:
+                resize_window(event.w, event.h)
+                if game is not None:
+                    pipeline.start(game.questions, layout)
+
+            if event.type == GAME_LOADED and loader.accept(event):
+                if event.error is not None:
+                    log.error("Failed to load game", extra={"error": str(event.error)})
+                    state = "start"
+                else:
+                    game = event.game
+                    current_question_num = 1
+                    question_text, options = load_current_question(game)
+                    selected_option = None
+                    if state == "loading":
+                        state = after_load
+
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 mx, my = event.pos
 
                 if state == "start":
-                    if START_BUTTON.collidepoint(mx, my):
-                        current_question_num = 1
-                        question_text, options = load_current_question(game)
-                        state = "question"
+                    if layout.start_button.collidepoint(mx, my):
+                        if game is None:
+                            if not loader.pending:
+                                loader.start()
+                            after_load = "question"
+                            state = "loading"
+                        else:
+                            current_question_num = 1
+                            question_text, options = load_current_question(game)
+                            state = "question"
 
                 elif state == "question":
-                    for idx, rect in enumerate(OPTION_RECTS):
+                    for idx, rect in enumerate(layout.option_rects):
                         if rect.collidepoint(mx, my):
                             selected_option = idx
 
-                    if SUBMIT_BUTTON.collidepoint(mx, my) and selected_option is not None:
+                    if layout.submit_button.collidepoint(mx, my) and selected_option is not None:
                         game_over = submit_answer_and_check(game, selected_option)
                         selected_option = None
 
@@ -524,33 +655,26 @@ def run_quiz_ui():
                             question_text, options = load_current_question(game)
 
                 elif state == "result":
-                    if RESULT_HOME.collidepoint(mx, my):
-                        game = create_game()
-                        current_question_num = 1
-                        question_text, options = load_current_question(game)
+                    if layout.result_home.collidepoint(mx, my):
+                        game = None
+                        loader.start()
                         selected_option = None
                         state = "start"
 
-                    elif RESULT_RESTART.collidepoint(mx, my):
-                        game = create_game()
-                        current_question_num = 1
-                        question_text, options = load_current_question(game)
+                    elif layout.result_restart.collidepoint(mx, my):
+                        game = None
+                        loader.start()
                         selected_option = None
-                        state = "question"
-
-        if state == "start":
-            draw_start_screen()
-        elif state == "question":
-            draw_question_screen(question_text, options, selected_option, current_question_num)
-        elif state == "result":
-            score, max_score, correct_count, total_questions = get_result_stats(game)
-            draw_result_screen(score, max_score, correct_count, total_questions)
-
-        pygame.display.flip()
-        clock.tick(60)
+                        after_load = "question"
+                        state = "loading"
 
+    loader.cancel()
+    pipeline.cancel()
+    if player is not None:
+        player.stop()
     pygame.quit()
-    sys.exit()
+    if exit_on_quit:
+        sys.exit()
 
 if __name__ == "__main__":
     run_quiz_ui()
\ No newline at end of file
@@ -0,0 +1,172 @@
+"""
+Input recording and replay for the Pygame UI.
+
+EventRecorder captures the input events run_quiz_ui handles (clicks, keys,
+resizes, quit) with millisecond timestamps into a compact binary file.
+EventPlayer posts a recording back into the pygame event queue from a
+feeder thread at the recorded times, so a replayed session goes through
+exactly the same loop code as a live one.
+
+File format (little endian):
+    header  b"QZREC2" + window width (uint16) + window height (uint16)
+    record  t_ms (uint32), kind (uint8), x (int16), y (int16), extra (uint32)
+
+extra holds the button or the key code; SDL key codes for arrows, function
+and keypad keys are above 0x40000000. Version 1 files (b"QZREC1", uint16
+extra) still load.
+"""
+
+import time
+import struct
+import threading
+
+import pygame
+
+
+MAGIC = b"QZREC2"
+HEADER = struct.Struct("<6sHH")
+RECORD = struct.Struct("<IBhhI")
+# version 1 records, with a uint16 extra
+RECORDS = {MAGIC: RECORD, b"QZREC1": struct.Struct("<IBhhH")}
+
+# kind codes, stable across pygame versions
+KIND_MOUSE_DOWN = 1
+KIND_MOUSE_UP = 2
+KIND_KEY_DOWN = 3
+KIND_RESIZE = 4
+KIND_QUIT = 5
+
+RECORDED_TYPES = {
+    pygame.MOUSEBUTTONDOWN: KIND_MOUSE_DOWN,
+    pygame.MOUSEBUTTONUP: KIND_MOUSE_UP,
+    pygame.KEYDOWN: KIND_KEY_DOWN,
+    pygame.VIDEORESIZE: KIND_RESIZE,
+    pygame.QUIT: KIND_QUIT,
+}
+
+
+def encode_event(event):
+    """
+    Turn a pygame event into (kind, x, y, extra).
+
+    Returns:
+        tuple or None: None for event types that are not recorded
+    """
+    kind = RECORDED_TYPES.get(event.type)
+    if kind in (KIND_MOUSE_DOWN, KIND_MOUSE_UP):
+        return kind, event.pos[0], event.pos[1], event.button
+    if kind == KIND_KEY_DOWN:
+        return kind, 0, 0, event.key
+    if kind == KIND_RESIZE:
+        return kind, event.w, event.h, 0
+    if kind == KIND_QUIT:
+        return kind, 0, 0, 0
+    return None
+
+
+def decode_event(kind, x, y, extra):
+    """Rebuild the pygame event for a stored record."""
+    if kind == KIND_MOUSE_DOWN:
+        return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(x, y), button=extra)
+    if kind == KIND_MOUSE_UP:
+        return pygame.event.Event(pygame.MOUSEBUTTONUP, pos=(x, y), button=extra)
+    if kind == KIND_KEY_DOWN:
+        return pygame.event.Event(pygame.KEYDOWN, key=extra, mod=0, unicode="", scancode=0)
+    if kind == KIND_RESIZE:
+        return pygame.event.Event(pygame.VIDEORESIZE, w=x, h=y, size=(x, y))
+    if kind == KIND_QUIT:
+        return pygame.event.Event(pygame.QUIT)
+    raise ValueError(f"Unknown event kind {kind}")
+
+
+class EventRecorder:
+    """
+    Collects input events with timestamps relative to start() (or to the
+    first event when start() was never called).
+
+    Usage:
+        recorder = EventRecorder(window_size)
+        recorder.start()
+        recorder.record(event)   # for every event the loop handles
+        recorder.save("session.qzr")
+    """
+
+    def __init__(self, window_size):
+        self.window_size = window_size
+        self.records = []
+        self._start = None
+
+    def start(self):
+        """Start the clock; called when the window opens."""
+        self._start = time.perf_counter()
+
+    def record(self, event, now=None):
+        encoded = encode_event(event)
+        if encoded is None:
+            return
+        now = time.perf_counter() if now is None else now
+        if self._start is None:
+            self._start = now
+        self.records.append((int((now - self._start) * 1000),) + encoded)
+
+    def add(self, t_ms, event):
+        """Append an event at an explicit time (for synthesized sessions)."""
+        self.records.append((t_ms,) + encode_event(event))
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, *self.window_size))
+            for record in self.records:
+                f.write(RECORD.pack(*record))
+
+
+def load_recording(path):
+    """
+    Read a recording.
+
+    Returns:
+        tuple: (window_size, [(t_ms, pygame.event.Event), ...])
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, width, height = HEADER.unpack_from(data, 0)
+    record = RECORDS.get(magic)
+    if record is None:
+        raise ValueError(f"{path} is not a Quizzify recording")
+
+    events = []
+    for offset in range(HEADER.size, len(data) - record.size + 1, record.size):
+        t_ms, kind, x, y, extra = record.unpack_from(data, offset)
+        events.append((t_ms, decode_event(kind, x, y, extra)))
+    return (width, height), events
+
+
+class EventPlayer:
+    """
+    Posts recorded events into the pygame queue at their recorded times.
+
+    Args:
+        events (list): [(t_ms, event), ...] as returned by load_recording()
+        speed (float): Playback speed factor (2.0 = twice as fast)
+    """
+
+    def __init__(self, events, speed=1.0):
+        self.events = events
+        self.speed = speed
+        self._stop = threading.Event()
+        self.done = threading.Event()
+
+    def start(self):
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        start = time.perf_counter()
+        for t_ms, event in self.events:
+            delay = start + t_ms / 1000.0 / self.speed - time.perf_counter()
+            if delay > 0 and self._stop.wait(delay):
+                break
+            pygame.event.post(event)
+        self.done.set()
@@ -0,0 +1,139 @@
+"""
+Lazy UI resources.
+
+Fonts are created on first use instead of at import time, so importing the
+UI does not need a display (images are served by ui.assets). System font lookups are resolved
+once and cached in a small JSON file, which saves the system font scan
+(fc-list / registry walk) on every later launch.
+"""
+
+import os
+import json
+import threading
+
+import pygame
+import pygame.sysfont
+
+
+def cache_dir():
+    """Directory for Quizzify's local caches (QUIZZIFY_CACHE_DIR overrides)."""
+    path = os.environ.get("QUIZZIFY_CACHE_DIR")
+    if not path:
+        path = os.path.join(os.path.expanduser("~"), ".cache", "quizzify")
+    return path
+
+
+# Shared by every FontBook: created fonts by spec, and resolved font
+# paths by cache file
+_fonts = {}
+_path_caches = {}
+
+# Fonts are also opened from worker threads (FontBook.private() in the
+# prerender pipeline). Opening a font, resolving its path and writing the
+# path cache file happen under this lock: SDL_ttf shares one FreeType
+# library between fonts, and two writers would clobber the cache file.
+_lock = threading.RLock()
+
+
+class FontBook:
+    """
+    Named fonts created on first attribute access.
+    Fonts are shared between books, so books are cheap to create.
+
+    Usage:
+        fonts = FontBook({"title": ("arial", 60, True, False)})
+        fonts.title.render("QUIZZIFY", True, color)
+    """
+
+    CACHE_FILE = "font_paths.json"
+
+    def __init__(self, specs=None):
+        """
+        Args:
+            specs (dict): {name: (family, size, bold, italic)}
+        """
+        self._specs = specs or {}
+
+    def __getattr__(self, name):
+        try:
+            spec = self.__dict__["_specs"][name]
+        except KeyError:
+            raise AttributeError(name) from None
+        return self.font(*spec)
+
+    def font(self, family, size, bold=False, italic=False):
+        """Return the font for a spec, creating it on first use."""
+        key = (family, size, bold, italic)
+        font = _fonts.get(key)
+        if font is None:
+            with _lock:
+                font = _fonts.get(key)
+                if font is None:
+                    font = _fonts[key] = self._open(family, size, bold, italic)
+        return font
+
+    def private(self, name):
+        """
+        Return a new, uncached font for a named spec.
+
+        SDL_ttf fonts must not be used from two threads at once; background
+        renderers take a private copy instead of the shared instance.
+        """
+        with _lock:
+            return self._open(*self._specs[name])
+
+    def _open(self, family, size, bold, italic):
+        path, set_bold, set_italic = self.resolve(family, bold, italic)
+        if not pygame.font.get_init():
+            pygame.font.init()
+        return pygame.sysfont.font_constructor(path, size, set_bold, set_italic)
+
+    def resolve(self, family, bold, italic):
+        """
+        Resolve a font family to (path, emulate_bold, emulate_italic).
+
+        Uses the cache file when possible; otherwise does the same search as
+        pygame.font.SysFont() and records the answer. Thread-safe.
+        """
+        with _lock:
+            return self._resolve(family, bold, italic)
+
+    def _resolve(self, family, bold, italic):
+        cache_path = self._cache_path()
+        paths = _path_caches.get(cache_path)
+        if paths is None:
+            paths = _path_caches[cache_path] = self._load_cache(cache_path)
+
+        key = f"{family}|{int(bold)}|{int(italic)}"
+        cached = paths.get(key)
+        if cached is not None and (cached[0] is None or os.path.exists(cached[0])):
+            return tuple(cached)
+
+        # SysFont hands its resolution to the constructor; capture it
+        # instead of building a font we would throw away.
+        resolved = pygame.font.SysFont(
+            family, 1, bold, italic,
+            constructor=lambda path, size, set_bold, set_italic: (path, set_bold, set_italic),
+        )
+        paths[key] = list(resolved)
+        self._save_cache(cache_path, paths)
+        return resolved
+
+    def _cache_path(self):
+        return os.path.join(cache_dir(), self.CACHE_FILE)
+
+    def _load_cache(self, cache_path):
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self, cache_path, paths):
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, "w", encoding="utf-8") as f:
+                json.dump(paths, f, indent=2, sort_keys=True)
+        except OSError:
+            # A read-only home directory only costs us the scan next time
+            pass
@@ -0,0 +1,84 @@
+"""
+Adaptive frame scheduling for the Pygame loop.
+
+While something is animating the loop runs at the full frame rate. When the
+screen is static it blocks in pygame.event.wait() instead, so an idle window
+uses next to no CPU and still reacts to input immediately.
+"""
+
+import pygame
+
+
+class FrameScheduler:
+    """
+    Decides how long the main loop sleeps between frames.
+
+    Usage:
+        scheduler = FrameScheduler()
+        while running:
+            if scheduler.should_draw(animating):
+                draw(); pygame.display.flip()
+            for event in scheduler.next_events(animating):
+                ...
+    """
+
+    # Events that never change what is on screen
+    PASSIVE_EVENTS = (pygame.MOUSEMOTION, pygame.NOEVENT)
+
+    def __init__(self, fps=60, idle_timeout_ms=1000):
+        """
+        Args:
+            fps (int): Frame rate while animating
+            idle_timeout_ms (int): Longest single wait while idle
+        """
+        self.fps = fps
+        self.idle_timeout_ms = idle_timeout_ms
+        self.clock = pygame.time.Clock()
+        self.dirty = True
+        self._animate_until = 0
+
+    def request_animation(self, duration_ms):
+        """Keep running at full frame rate for a while (e.g. a transition)."""
+        end = pygame.time.get_ticks() + duration_ms
+        self._animate_until = max(self._animate_until, end)
+
+    def invalidate(self):
+        """Force a redraw on the next frame."""
+        self.dirty = True
+
+    def is_animating(self, animating=False):
+        return animating or pygame.time.get_ticks() < self._animate_until
+
+    def should_draw(self, animating=False):
+        """
+        Return True if a frame must be drawn now, and clear the dirty flag.
+
+        Args:
+            animating (bool): True while the current screen has moving parts
+        """
+        if self.dirty or self.is_animating(animating):
+            self.dirty = False
+            return True
+        return False
+
+    def next_events(self, animating=False):
+        """
+        Wait for the next frame or for input, whichever applies.
+
+        Returns:
+            list: Pending events. Any non-passive event marks the frame dirty.
+        """
+        if self.is_animating(animating):
+            self.clock.tick(self.fps)
+            events = pygame.event.get()
+        else:
+            first = pygame.event.wait(self.idle_timeout_ms)
+            events = [first] + pygame.event.get()
+            # don't let the idle time count as one long frame
+            self.clock.tick()
+
+        for event in events:
+            if event.type not in self.PASSIVE_EVENTS:
+                self.dirty = True
+                break
+        return [event for event in events if event.type != pygame.NOEVENT]